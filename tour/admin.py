@@ -26,7 +26,9 @@ from .models import (
     RawItinerary,
     ProcessedItinerary,
     TrainingExport,
+    BatchJob,
     UploadedPackage,
+    PackageImage,
 )
 
 class ItineraryInline(admin.TabularInline):
@@ -44,12 +46,25 @@ class TourPackageAdmin(admin.ModelAdmin):
 # PRICING ADMIN CLASSES
 # =============================================================================
 
+class ChangedFieldsSaveMixin:
+    """Save only the fields the admin form actually changed (plus updated_at)."""
+
+    def save_model(self, request, obj, form, change):
+        if not change:
+            return super().save_model(request, obj, form, change)
+        concrete = {f.name for f in obj._meta.concrete_fields}
+        changed = [name for name in form.changed_data if name in concrete]
+        if changed:
+            obj.save(update_fields=changed + ['updated_at'])
+
+
 @admin.register(Destination)
 class DestinationAdmin(admin.ModelAdmin):
     list_display = ('name', 'region', 'country', 'avg_time_needed', 'is_active')
     list_filter = ('region', 'country', 'is_active')
-    search_fields = ('name', 'region', 'highlights')
+    search_fields = ('^slug', 'name', 'region', 'highlights')
     list_editable = ('is_active',)
+    prepopulated_fields = {'slug': ('name',)}
 
 
 class HotelRateInline(admin.TabularInline):
@@ -65,7 +80,7 @@ class ActivityRateInline(admin.TabularInline):
 
 
 @admin.register(HotelRate)
-class HotelRateAdmin(admin.ModelAdmin):
+class HotelRateAdmin(ChangedFieldsSaveMixin, admin.ModelAdmin):
     list_display = ('name', 'destination', 'tier', 'room_type', 'meal_plan', 'rate_low_season', 'rate_high_season', 'is_active', 'updated_at')
     list_filter = ('tier', 'destination', 'meal_plan', 'is_active')
     search_fields = ('name', 'destination__name')
@@ -74,14 +89,14 @@ class HotelRateAdmin(admin.ModelAdmin):
 
 
 @admin.register(TransportRate)
-class TransportRateAdmin(admin.ModelAdmin):
+class TransportRateAdmin(ChangedFieldsSaveMixin, admin.ModelAdmin):
     list_display = ('vehicle_type', 'rate_per_day', 'max_passengers', 'fuel_consumption', 'is_active', 'updated_at')
     list_filter = ('vehicle_type', 'is_active')
     list_editable = ('rate_per_day', 'is_active')
 
 
 @admin.register(ActivityRate)
-class ActivityRateAdmin(admin.ModelAdmin):
+class ActivityRateAdmin(ChangedFieldsSaveMixin, admin.ModelAdmin):
     list_display = ('name', 'activity_type', 'destination', 'rate_adult', 'rate_child', 'duration', 'is_active', 'updated_at')
     list_filter = ('activity_type', 'destination', 'is_active')
     search_fields = ('name', 'destination__name')
@@ -89,13 +104,13 @@ class ActivityRateAdmin(admin.ModelAdmin):
 
 
 @admin.register(FuelPrice)
-class FuelPriceAdmin(admin.ModelAdmin):
+class FuelPriceAdmin(ChangedFieldsSaveMixin, admin.ModelAdmin):
     list_display = ('fuel_type', 'price_per_liter', 'price_per_liter_usd', 'updated_at')
     list_editable = ('price_per_liter', 'price_per_liter_usd')
 
 
 @admin.register(FlightRate)
-class FlightRateAdmin(admin.ModelAdmin):
+class FlightRateAdmin(ChangedFieldsSaveMixin, admin.ModelAdmin):
     list_display = ('airline', 'origin_code', 'destination_code', 'price_economy', 'flight_duration', 'frequency', 'is_active', 'updated_at')
     list_filter = ('airline', 'is_active')
     search_fields = ('origin', 'destination', 'origin_code', 'destination_code')
@@ -200,7 +215,7 @@ class RawItineraryAdmin(admin.ModelAdmin):
     list_filter = ('source_type', 'is_processed', 'source')
     search_fields = ('page_title', 'source_url', 'raw_text')
     readonly_fields = ('scraped_at',)
-    actions = ['process_with_gpt']
+    actions = ['process_with_gpt', 'submit_gpt_batch']
     
     def title_short(self, obj):
         title = obj.page_title or obj.source_url or 'No title'
@@ -216,11 +231,21 @@ class RawItineraryAdmin(admin.ModelAdmin):
         from .services.gpt_processor import GPTProcessor
         processor = GPTProcessor()
         processed = 0
-        for raw in queryset.filter(is_processed=False):
+        pending = queryset.filter(is_processed=False).exclude(batch_jobs__status__in=BatchJob.ACTIVE_STATUSES)
+        for raw in pending:
             result = processor.process_raw_itinerary(raw)
             if result:
                 processed += 1
         self.message_user(request, f'Processed {processed} items')
+    
+    @admin.action(description='Submit selected to GPT Batch API')
+    def submit_gpt_batch(self, request, queryset):
+        from .services.gpt_processor import GPTProcessor
+        job = GPTProcessor().submit_batch(queryset.filter(is_processed=False), user=request.user)
+        if job:
+            self.message_user(request, f'Submitted batch {job.batch_id} with {job.request_count} items')
+        else:
+            self.message_user(request, 'Nothing to submit')
 
 
 @admin.register(ProcessedItinerary)
@@ -318,6 +343,33 @@ class TrainingExportAdmin(admin.ModelAdmin):
     readonly_fields = ('file_name', 'file_path', 'record_count', 'export_format', 'exported_by', 'created_at')
 
 
+@admin.register(BatchJob)
+class BatchJobAdmin(admin.ModelAdmin):
+    list_display = ('batch_id', 'status', 'request_count', 'succeeded', 'failed', 'submitted_by', 'created_at', 'ingested_at')
+    list_filter = ('status', 'created_at')
+    search_fields = ('batch_id',)
+    readonly_fields = ('batch_id', 'input_file_id', 'output_file_id', 'error_file_id', 'status', 'gpt_model',
+                       'raw_itineraries', 'request_count', 'succeeded', 'failed', 'submitted_by', 'created_at', 'ingested_at')
+    actions = ['ingest_results']
+    
+    @admin.action(description='Check status and ingest results')
+    def ingest_results(self, request, queryset):
+        from .services.gpt_processor import GPTProcessor
+        processor = GPTProcessor()
+        for job in queryset.filter(ingested_at__isnull=True):
+            stats = processor.ingest_batch_results(job.batch_id)
+            self.message_user(
+                request,
+                f"{job.batch_id}: {stats['status']}, {stats['succeeded']}/{stats['processed']} saved"
+            )
+
+
+class PackageImageInline(admin.TabularInline):
+    model = PackageImage
+    extra = 0
+    fields = ('image', 'order')
+
+
 @admin.register(UploadedPackage)
 class UploadedPackageAdmin(admin.ModelAdmin):
     list_display = ('title', 'package_type', 'duration_days', 'status', 'is_analyzed', 'operator', 'created_at')
@@ -326,6 +378,7 @@ class UploadedPackageAdmin(admin.ModelAdmin):
     list_editable = ('status',)
     readonly_fields = ('extracted_text', 'is_analyzed', 'share_token', 'created_at', 'updated_at')
     actions = ['create_raw_itinerary']
+    inlines = [PackageImageInline]
     
     fieldsets = (
         ('Basic Info', {
@@ -335,7 +388,7 @@ class UploadedPackageAdmin(admin.ModelAdmin):
             'fields': ('price_per_person', 'min_group_size', 'max_group_size')
         }),
         ('Files', {
-            'fields': ('pdf_itinerary', 'cover_image', 'image_2', 'image_3', 'image_4')
+            'fields': ('pdf_itinerary', 'cover_image')
         }),
         ('AI Processing (Internal)', {
             'fields': ('extracted_text', 'is_analyzed'),
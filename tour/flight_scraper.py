@@ -458,7 +458,7 @@ def populate_flight_rates_from_scraper():
             if existing:
                 # Update price
                 existing.price_economy = Decimal(str(route['price_avg']))
-                existing.save()
+                existing.touch('price_economy')
                 updated_count += 1
             else:
                 # Create new
@@ -3,6 +3,7 @@ Management command to populate pricing data for tours.
 Usage: python manage.py populate_pricing [--flights] [--destinations] [--hotels] [--activities] [--all]
 """
 from django.core.management.base import BaseCommand
+from django.utils.text import slugify
 from decimal import Decimal
 
 
@@ -185,7 +186,7 @@ class Command(BaseCommand):
         created = 0
         for dest_name, hotels in hotels_data.items():
             try:
-                destination = Destination.objects.get(name=dest_name)
+                destination = Destination.objects.get(slug=slugify(dest_name))
                 for hotel in hotels:
                     _, was_created = HotelRate.objects.get_or_create(
                         name=hotel['name'],
@@ -244,7 +245,7 @@ class Command(BaseCommand):
         created = 0
         for item in park_fees + activities:
             try:
-                destination = Destination.objects.get(name=item['dest'])
+                destination = Destination.objects.get(slug=slugify(item['dest']))
                 _, was_created = ActivityRate.objects.get_or_create(
                     name=item['name'],
                     destination=destination,
@@ -1,6 +1,6 @@
 """
 Management command to scrape LIVE flight prices using Selenium browser automation.
-Usage: python manage.py scrape_flights_live [--route DAR ZNZ] [--all] [--visible]
+Usage: python manage.py scrape_flights_live [--route DAR ZNZ] [--all] [--visible] [--debug]
 """
 from django.core.management.base import BaseCommand
 from decimal import Decimal
@@ -18,6 +18,8 @@ class Command(BaseCommand):
                           help='Show browser window (not headless)')
         parser.add_argument('--update-db', action='store_true',
                           help='Update database with scraped prices')
+        parser.add_argument('--debug', action='store_true',
+                          help='Save a screenshot when a page yields no prices')
 
     def handle(self, *args, **options):
         from tour.selenium_scraper import SeleniumFlightScraper
@@ -30,7 +32,7 @@ class Command(BaseCommand):
         self.stdout.write("=" * 60)
         self.stdout.write(f"Mode: {'Headless' if headless else 'Visible Browser'}\n")
         
-        scraper = SeleniumFlightScraper(headless=headless)
+        scraper = SeleniumFlightScraper(headless=headless, debug=options['debug'])
         
         try:
             if options['route']:
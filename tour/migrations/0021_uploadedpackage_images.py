@@ -0,0 +1,62 @@
+# Generated by Django 4.2.13 on 2026-10-15 22:17
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def copy_image_slots(apps, schema_editor):
+    """Move image_2/3/4 columns into PackageImage rows."""
+    UploadedPackage = apps.get_model('tour', 'UploadedPackage')
+    PackageImage = apps.get_model('tour', 'PackageImage')
+    images = []
+    for package in UploadedPackage.objects.all().iterator():
+        for order, field in enumerate(('image_2', 'image_3', 'image_4'), start=2):
+            image = getattr(package, field)
+            if image:
+                images.append(PackageImage(package=package, image=image.name, order=order))
+    PackageImage.objects.bulk_create(images)
+
+
+def restore_image_slots(apps, schema_editor):
+    UploadedPackage = apps.get_model('tour', 'UploadedPackage')
+    PackageImage = apps.get_model('tour', 'PackageImage')
+    for img in PackageImage.objects.filter(order__in=(2, 3, 4)):
+        UploadedPackage.objects.filter(pk=img.package_id).update(**{f'image_{img.order}': img.image.name})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tour', '0020_ai_training_pipeline'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PackageImage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('image', models.ImageField(upload_to='package_images/')),
+                ('order', models.PositiveSmallIntegerField(default=0, help_text='Gallery slot (lower = shown first)')),
+                ('package', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='images', to='tour.uploadedpackage')),
+            ],
+            options={
+                'verbose_name': 'Package Image',
+                'verbose_name_plural': 'Package Images',
+                'ordering': ['order'],
+                'unique_together': {('package', 'order')},
+            },
+        ),
+        migrations.RunPython(copy_image_slots, restore_image_slots),
+        migrations.RemoveField(
+            model_name='uploadedpackage',
+            name='image_2',
+        ),
+        migrations.RemoveField(
+            model_name='uploadedpackage',
+            name='image_3',
+        ),
+        migrations.RemoveField(
+            model_name='uploadedpackage',
+            name='image_4',
+        ),
+    ]
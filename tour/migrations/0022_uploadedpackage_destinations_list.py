@@ -0,0 +1,40 @@
+# Generated by Django 4.2.13 on 2026-10-15 22:18
+
+import json
+
+from django.db import migrations, models
+
+
+def split_destinations(apps, schema_editor):
+    """Rewrite 'A, B, C' strings as JSON lists while the column is still text."""
+    UploadedPackage = apps.get_model('tour', 'UploadedPackage')
+    for package in UploadedPackage.objects.only('pk', 'destinations').iterator():
+        names = [d.strip() for d in (package.destinations or '').split(',') if d.strip()]
+        UploadedPackage.objects.filter(pk=package.pk).update(destinations=json.dumps(names))
+
+
+def join_destinations(apps, schema_editor):
+    """Reverse of split_destinations; runs once the column is text again."""
+    UploadedPackage = apps.get_model('tour', 'UploadedPackage')
+    for package in UploadedPackage.objects.only('pk', 'destinations').iterator():
+        try:
+            names = json.loads(package.destinations or '[]')
+        except ValueError:
+            continue
+        UploadedPackage.objects.filter(pk=package.pk).update(destinations=', '.join(names))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tour', '0021_uploadedpackage_images'),
+    ]
+
+    operations = [
+        migrations.RunPython(split_destinations, join_destinations),
+        migrations.AlterField(
+            model_name='uploadedpackage',
+            name='destinations',
+            field=models.JSONField(blank=True, default=list, help_text='List of destinations'),
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 4.2.13 on 2026-10-15 22:20
+
+from django.db import migrations, models
+from django.utils.text import slugify
+
+
+def populate_slugs(apps, schema_editor):
+    Destination = apps.get_model('tour', 'Destination')
+    used = set()
+    for dest in Destination.objects.order_by('pk'):
+        base_slug = slugify(dest.name)
+        slug = base_slug
+        counter = 2
+        while slug in used:
+            slug = f"{base_slug}-{counter}"
+            counter += 1
+        used.add(slug)
+        Destination.objects.filter(pk=dest.pk).update(slug=slug)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tour', '0022_uploadedpackage_destinations_list'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='destination',
+            name='slug',
+            field=models.SlugField(blank=True, max_length=255),
+        ),
+        migrations.RunPython(populate_slugs, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='destination',
+            name='slug',
+            field=models.SlugField(blank=True, max_length=255, unique=True),
+        ),
+        migrations.AddIndex(
+            model_name='destination',
+            index=models.Index(fields=['region', 'name'], name='destination_region_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='destination',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['is_active', 'region'], name='destination_active_region_idx'),
+        ),
+    ]
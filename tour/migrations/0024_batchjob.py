@@ -0,0 +1,40 @@
+# Generated by Django 4.2.13 on 2026-10-15 22:40
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('tour', '0023_destination_slug_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BatchJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('batch_id', models.CharField(max_length=100, unique=True)),
+                ('input_file_id', models.CharField(max_length=100)),
+                ('output_file_id', models.CharField(blank=True, max_length=100)),
+                ('error_file_id', models.CharField(blank=True, max_length=100)),
+                ('status', models.CharField(default='validating', help_text='Status as reported by OpenAI', max_length=20)),
+                ('gpt_model', models.CharField(max_length=50)),
+                ('request_count', models.PositiveIntegerField(default=0)),
+                ('succeeded', models.PositiveIntegerField(default=0)),
+                ('failed', models.PositiveIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('ingested_at', models.DateTimeField(blank=True, null=True)),
+                ('raw_itineraries', models.ManyToManyField(related_name='batch_jobs', to='tour.rawitinerary')),
+                ('submitted_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'GPT Batch Job',
+                'verbose_name_plural': 'GPT Batch Jobs',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
@@ -1,5 +1,8 @@
+from functools import cached_property
+
 from django.db import models
 from django.conf import settings
+from django.utils import timezone
 import slugify
 
 
@@ -326,9 +329,20 @@ class ServiceMatch(models.Model):
 # TOUR PRICING & ITINERARY GENERATION MODELS
 # =============================================================================
 
+class TouchMixin:
+    """Partial-write helper for models with an auto_now `updated_at` column."""
+
+    def touch(self, *fields):
+        """Write only `fields` (plus updated_at) with a single UPDATE, skipping a full-row save."""
+        self.updated_at = timezone.now()
+        values = {f: getattr(self, f) for f in fields}
+        type(self).objects.filter(pk=self.pk).update(updated_at=self.updated_at, **values)
+
+
 class Destination(models.Model):
     """Popular destinations with relevant info for itinerary generation."""
     name = models.CharField(max_length=255)  # e.g., "Serengeti National Park"
+    slug = models.SlugField(max_length=255, unique=True, blank=True)
     region = models.CharField(max_length=100)  # e.g., "Northern Circuit"
     country = models.CharField(max_length=100, default="Tanzania")
     description = models.TextField(blank=True)
@@ -339,14 +353,31 @@ class Destination(models.Model):
     image = models.ImageField(upload_to='destinations/', blank=True, null=True)
     is_active = models.BooleanField(default=True)
 
+    def save(self, *args, **kwargs):
+        # Auto-generate a unique slug from the name for URL/lookup use
+        if not self.slug:
+            base_slug = slugify(self.name)
+            slug = base_slug
+            counter = 2
+            while Destination.objects.filter(slug=slug).exclude(pk=self.pk).exists():
+                slug = f"{base_slug}-{counter}"
+                counter += 1
+            self.slug = slug
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return f"{self.name}, {self.region}"
 
     class Meta:
         ordering = ['region', 'name']
+        indexes = [
+            models.Index(fields=['region', 'name'], name='destination_region_name_idx'),
+            models.Index(fields=['is_active', 'region'], name='destination_active_region_idx',
+                         condition=models.Q(is_active=True)),
+        ]
 
 
-class HotelRate(models.Model):
+class HotelRate(TouchMixin, models.Model):
     """Admin-managed hotel pricing for accurate itinerary costing."""
     TIER_CHOICES = [
         ('budget', 'Budget'),
@@ -394,7 +425,7 @@ class HotelRate(models.Model):
         ordering = ['destination', 'tier', 'name']
 
 
-class TransportRate(models.Model):
+class TransportRate(TouchMixin, models.Model):
     """Admin-managed transport/vehicle pricing."""
     VEHICLE_TYPES = [
         ('sedan', 'Sedan Car'),
@@ -425,7 +456,7 @@ class TransportRate(models.Model):
         ordering = ['vehicle_type']
 
 
-class ActivityRate(models.Model):
+class ActivityRate(TouchMixin, models.Model):
     """Admin-managed activity/park fees pricing."""
     ACTIVITY_TYPES = [
         ('park_fee', 'National Park Entry Fee'),
@@ -464,7 +495,7 @@ class ActivityRate(models.Model):
         ordering = ['activity_type', 'name']
 
 
-class FuelPrice(models.Model):
+class FuelPrice(TouchMixin, models.Model):
     """Current fuel prices - updated by admin."""
     fuel_type = models.CharField(max_length=20, choices=[('petrol', 'Petrol'), ('diesel', 'Diesel')])
     price_per_liter = models.DecimalField(max_digits=6, decimal_places=2, help_text="Price in TZS")
@@ -478,7 +509,7 @@ class FuelPrice(models.Model):
         verbose_name_plural = "Fuel Prices"
 
 
-class FlightRate(models.Model):
+class FlightRate(TouchMixin, models.Model):
     """Admin-managed domestic/regional flight pricing."""
     AIRLINES = [
         ('precision', 'Precision Air'),
@@ -612,14 +643,22 @@ class TourRequest(models.Model):
     def __str__(self):
         return f"{self.client_name} - {self.start_date} ({self.get_tour_type_display()})"
 
-    @property
+    @cached_property
     def duration_days(self):
         return (self.end_date - self.start_date).days + 1
 
-    @property
+    @cached_property
     def total_travelers(self):
         return self.num_adults + self.num_children
 
+    @cached_property
+    def start_date_display(self):
+        return self.start_date.strftime('%B %d, %Y')
+
+    @cached_property
+    def end_date_display(self):
+        return self.end_date.strftime('%B %d, %Y')
+
     class Meta:
         ordering = ['-created_at']
 
@@ -656,7 +695,7 @@ class UploadedPackage(models.Model):
     duration_days = models.PositiveIntegerField(default=1, help_text="Number of days")
     
     # Destinations
-    destinations = models.CharField(max_length=500, blank=True, help_text="Comma-separated list of destinations")
+    destinations = models.JSONField(default=list, blank=True, help_text="List of destinations")
     
     # Pricing
     price_per_person = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
@@ -667,11 +706,6 @@ class UploadedPackage(models.Model):
     pdf_itinerary = models.FileField(upload_to='package_pdfs/')
     cover_image = models.ImageField(upload_to='package_images/')
     
-    # Additional Images (optional)
-    image_2 = models.ImageField(upload_to='package_images/', blank=True, null=True)
-    image_3 = models.ImageField(upload_to='package_images/', blank=True, null=True)
-    image_4 = models.ImageField(upload_to='package_images/', blank=True, null=True)
-    
     # Internal: Extracted content for system use (hidden from users)
     extracted_text = models.TextField(blank=True)
     is_analyzed = models.BooleanField(default=False)
@@ -697,17 +731,10 @@ class UploadedPackage(models.Model):
             self.share_token = secrets.token_urlsafe(16)
         super().save(*args, **kwargs)
     
-    @property
+    @cached_property
     def all_images(self):
-        """Return list of all available images."""
-        images = [self.cover_image]
-        if self.image_2:
-            images.append(self.image_2)
-        if self.image_3:
-            images.append(self.image_3)
-        if self.image_4:
-            images.append(self.image_4)
-        return images
+        """Return list of all available images (cover first, then gallery)."""
+        return [self.cover_image] + [img.image for img in self.images.all()]
     
     class Meta:
         ordering = ['-created_at']
@@ -715,6 +742,23 @@ class UploadedPackage(models.Model):
         verbose_name_plural = 'Uploaded Packages'
 
 
+class PackageImage(models.Model):
+    """Additional gallery image for an uploaded package (one row per image)."""
+    
+    package = models.ForeignKey(UploadedPackage, on_delete=models.CASCADE, related_name='images')
+    image = models.ImageField(upload_to='package_images/')
+    order = models.PositiveSmallIntegerField(default=0, help_text="Gallery slot (lower = shown first)")
+    
+    def __str__(self):
+        return f"{self.package.title} - image {self.order}"
+    
+    class Meta:
+        ordering = ['order']
+        unique_together = ('package', 'order')
+        verbose_name = 'Package Image'
+        verbose_name_plural = 'Package Images'
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # AI TRAINING DATA PIPELINE
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -911,3 +955,34 @@ class TrainingExport(models.Model):
     class Meta:
         ordering = ['-created_at']
 
+
+class BatchJob(models.Model):
+    """An OpenAI Batch API job extracting a set of RawItineraries."""
+    
+    # Batch API statuses while requests are still queued or running
+    ACTIVE_STATUSES = ('validating', 'in_progress', 'finalizing', 'cancelling')
+    # Batch API statuses after which no more output will appear
+    FINAL_STATUSES = ('completed', 'failed', 'expired', 'cancelled')
+    
+    batch_id = models.CharField(max_length=100, unique=True)
+    input_file_id = models.CharField(max_length=100)
+    output_file_id = models.CharField(max_length=100, blank=True)
+    error_file_id = models.CharField(max_length=100, blank=True)
+    status = models.CharField(max_length=20, default='validating', help_text="Status as reported by OpenAI")
+    gpt_model = models.CharField(max_length=50)
+    raw_itineraries = models.ManyToManyField(RawItinerary, related_name='batch_jobs')
+    request_count = models.PositiveIntegerField(default=0)
+    succeeded = models.PositiveIntegerField(default=0)
+    failed = models.PositiveIntegerField(default=0)
+    submitted_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    ingested_at = models.DateTimeField(null=True, blank=True)
+    
+    def __str__(self):
+        return f"{self.batch_id} ({self.status}, {self.request_count} requests)"
+    
+    class Meta:
+        ordering = ['-created_at']
+        verbose_name = 'GPT Batch Job'
+        verbose_name_plural = 'GPT Batch Jobs'
+
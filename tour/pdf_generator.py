@@ -1,20 +1,48 @@
 """
 PDF Generator for Tour Itineraries using ReportLab
+
+Importing this module loads ReportLab (fonts, colour tables, rl_config), so
+import it lazily from the code that actually builds a PDF - as
+views.tour_request_pdf does - rather than at module level elsewhere.
 """
+from django.conf import settings
+from reportlab import rl_config
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch, cm
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle, StyleSheet1
+from reportlab.lib.units import cm
 from reportlab.platypus import (
     SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle,
-    Image, PageBreak, HRFlowable
+    PageBreak, HRFlowable
 )
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
+from reportlab.lib.enums import TA_CENTER, TA_RIGHT
+from reportlab.lib.utils import ImageReader
 from io import BytesIO
+from string import Template
+from xml.sax.saxutils import escape as xml_escape
+import copy
 import json
+from functools import lru_cache
+from itertools import zip_longest
 from datetime import datetime
 
 
+# Attribute validation on ReportLab objects is only useful while developing
+if not settings.DEBUG:
+    rl_config.shapeChecking = 0
+
+
+@lru_cache(maxsize=8)
+def _cached_image_reader(path):
+    """
+    Decode an image file once per process and reuse it across PDFs.
+    
+    Draw the result with canvas.drawImage; platypus.Image only accepts a
+    filename or file object and decodes it again on every build.
+    """
+    return ImageReader(path)
+
+
 # Brand colors
 BURNT_ORANGE = colors.HexColor('#CC5500')
 BLACK = colors.HexColor('#000000')
@@ -23,7 +51,113 @@ LIGHT_GRAY = colors.HexColor('#F5F5F5')
 DARK_GRAY = colors.HexColor('#333333')
 
 
-def get_custom_styles():
+# Paragraph markup for the day header cells (values must be XML-escaped)
+DAY_TITLE_TEMPLATE = Template("<b>$title</b>")
+
+# Currency formatters for the cost tables
+_fmt_usd = "${:,.0f}".format
+_fmt_usd2 = "${:,.2f}".format
+
+
+# Vertical gaps between sections. Spacer objects themselves are created per
+# use: the doc template marks a spacer pushed to the next frame as
+# `_postponed`, and a shared instance would then raise LayoutError the next
+# time it lands at a frame bottom.
+GAP_XS = 0.2*cm
+GAP_S = 0.3*cm
+GAP_M = 0.5*cm
+GAP_L = 1*cm
+
+
+# Column widths, computed once rather than per table/day
+DAY_HEADER_COL_WIDTHS = (1.5*cm, 10*cm, 5*cm)
+COST_COL_WIDTHS = (12*cm, 5*cm)
+PACK_COL_WIDTHS = (5.5*cm, 5.5*cm, 5.5*cm)
+FIN_COL_WIDTHS = (10*cm, 6*cm)
+
+
+# Table styles are constant (only the cell data varies), so build them once
+DAY_HEADER_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, -1), BLACK),
+    ('TEXTCOLOR', (0, 0), (-1, -1), WHITE),
+    ('ALIGN', (0, 0), (0, 0), 'CENTER'),
+    ('ALIGN', (1, 0), (1, 0), 'LEFT'),
+    ('ALIGN', (2, 0), (2, 0), 'RIGHT'),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('PADDING', (0, 0), (-1, -1), 10),
+    ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
+])
+
+# Client cost table rows as (cost_breakdown key, label), in display order;
+# rows with a zero/missing value are left out
+COST_ROWS = (
+    ('accommodation_total', 'Accommodation'),
+    ('activities_total', 'Activities & Excursions'),
+    ('transport_total', 'Transport'),
+    ('park_fees_total', 'Park & Conservation Fees'),
+    ('subtotal_per_person', 'Subtotal (per person)'),
+    ('total_per_person', 'TOTAL PER PERSON'),
+    ('total_all_travelers', 'TOTAL (ALL TRAVELERS)'),
+)
+# Rows set apart by a gap, padded onto the row above instead of an empty
+# spacer row. COST_ROW_GAP is the extra bottom padding that grows that row by
+# the 18pt a blank cost-table row used to take.
+COST_GAP_BEFORE = frozenset({'subtotal_per_person', 'total_per_person'})
+COST_CELL_PADDING = 5
+COST_ROW_GAP = 16
+
+
+
+def _cost_table_style(n_rows, gap_rows):
+    """
+    Style for an n_rows cost table, with absolute row indices so ReportLab
+    has no negative indices to resolve per cell. The last two rows are the
+    highlighted totals; each row in gap_rows gets extra bottom padding.
+    """
+    last = n_rows - 1
+    totals = max(n_rows - 2, 0)
+    commands = [
+        ('ALIGN', (0, 0), (0, last), 'LEFT'),
+        ('ALIGN', (1, 0), (1, last), 'RIGHT'),
+        ('FONTNAME', (0, totals), (1, last), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (1, last), 10),
+        ('TEXTCOLOR', (0, totals), (1, last), BURNT_ORANGE),
+        ('LINEABOVE', (0, totals), (1, totals), 1, BLACK),
+        ('PADDING', (0, 0), (1, last), COST_CELL_PADDING),
+    ]
+    commands.extend(
+        ('BOTTOMPADDING', (0, i), (1, i), COST_CELL_PADDING + COST_ROW_GAP)
+        for i in gap_rows
+    )
+    return TableStyle(commands)
+
+
+PACK_TABLE_STYLE = TableStyle([
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('PADDING', (0, 0), (-1, -1), 4),
+])
+
+FIN_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), BLACK),
+    ('TEXTCOLOR', (0, 0), (-1, 0), WHITE),
+    ('ALIGN', (0, 0), (0, -1), 'LEFT'),
+    ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, -1), (-1, -1), 14),
+    ('TEXTCOLOR', (0, -1), (-1, -1), colors.green),
+    ('BACKGROUND', (0, -1), (-1, -1), colors.HexColor('#E8F5E9')),
+    ('LINEABOVE', (0, -3), (-1, -3), 1, BLACK),
+    ('PADDING', (0, 0), (-1, -1), 8),
+    ('GRID', (0, 0), (-1, -1), 0.5, LIGHT_GRAY),
+])
+
+
+# Template stylesheet, built once on first use (see get_custom_styles)
+_TEMPLATE_STYLES = None
+
+
+def _build_styles():
     """Create custom paragraph styles for the PDF."""
     styles = getSampleStyleSheet()
     
@@ -82,6 +216,15 @@ def get_custom_styles():
         leading=14,
     ))
     
+    # Day number cell in the day header (colour set on the style, not inline markup)
+    styles.add(ParagraphStyle(
+        name='DayNumber',
+        parent=styles['CustomBody'],
+        textColor=BURNT_ORANGE,
+        fontName='Helvetica-Bold',
+        alignment=TA_CENTER,
+    ))
+    
     # Small text
     styles.add(ParagraphStyle(
         name='SmallText',
@@ -104,19 +247,127 @@ def get_custom_styles():
     return styles
 
 
-def generate_itinerary_pdf(tour_request, itinerary_data):
+def get_custom_styles():
     """
-    Generate a professional PDF itinerary.
+    Return the custom stylesheet for one PDF build.
     
-    Args:
-        tour_request: TourRequest model instance
-        itinerary_data: Dict containing the generated itinerary
-    
-    Returns:
-        BytesIO buffer containing the PDF
+    The styles are constructed once per process; each call gets shallow
+    copies on a fresh StyleSheet1 so a build can't leak state into the next.
     """
-    buffer = BytesIO()
-    doc = SimpleDocTemplate(
+    global _TEMPLATE_STYLES
+    if _TEMPLATE_STYLES is None:
+        _TEMPLATE_STYLES = _build_styles()
+    
+    aliases = {style.name: alias for alias, style in _TEMPLATE_STYLES.byAlias.items()}
+    styles = StyleSheet1()
+    for name, style in _TEMPLATE_STYLES.byName.items():
+        styles.add(copy.copy(style), alias=aliases.get(name))
+    return styles
+
+
+def _build_day_flowables(day, styles):
+    """Build the flowables for one itinerary day."""
+    flowables = []
+    # Local aliases for the styles looked up repeatedly below
+    body = styles['CustomBody']
+    small = styles['SmallText']
+    
+    # Day header with background
+    # Escape JSON text once up front; ReportLab treats it as markup
+    day_num = xml_escape(str(day.get('day', '')))
+    day_title = xml_escape(str(day.get('title') or ''))
+    destination = xml_escape(str(day.get('destination') or ''))
+    
+    # Create day header table for better styling
+    day_header_data = [[
+        Paragraph(f"DAY {day_num}", styles['DayNumber']),
+        Paragraph(DAY_TITLE_TEMPLATE.substitute(title=day_title), body),
+        Paragraph(destination, small)
+    ]]
+    day_header_table = Table(day_header_data, colWidths=DAY_HEADER_COL_WIDTHS)
+    day_header_table.setStyle(DAY_HEADER_TABLE_STYLE)
+    flowables.append(Spacer(1, GAP_S))
+    flowables.append(day_header_table)
+    
+    # Activities
+    activities = day.get('activities', [])
+    if activities:
+        flowables.append(Spacer(1, GAP_XS))
+        flowables.append(Paragraph("<b>Activities:</b>", body))
+        # One Paragraph for all bullets: a single parse/wrap per day
+        activity_lines = []
+        for activity in activities:
+            act_name = activity.get('name', '')
+            act_time = activity.get('time', '')
+            act_cost = activity.get('cost_per_person', '')
+            time_str = f" ({xml_escape(str(act_time))})" if act_time else ""
+            cost_str = f" - ${xml_escape(str(act_cost))}/pp" if act_cost else ""
+            activity_lines.append(f"• {xml_escape(str(act_name or ''))}{time_str}{cost_str}")
+        flowables.append(Paragraph("<br/>".join(activity_lines), small))
+    
+    # Accommodation
+    accommodation = day.get('accommodation', {})
+    if accommodation:
+        flowables.append(Spacer(1, GAP_XS))
+        acc_name = xml_escape(str(accommodation.get('name') or 'TBA'))
+        meal_plan = xml_escape(str(accommodation.get('meal_plan') or ''))
+        acc_cost = accommodation.get('cost_per_person', '')
+        meal_str = f" ({meal_plan})" if meal_plan else ""
+        cost_str = f" - ${acc_cost}/pp" if acc_cost else ""
+        flowables.append(Paragraph(f"<b>Accommodation:</b> {acc_name}{meal_str}{cost_str}", body))
+    
+    # Transport, meals and tips share a style, so they go in one Paragraph
+    detail_lines = []
+    
+    # Transport
+    transport = day.get('transport', {})
+    if transport:
+        trans_desc = xml_escape(str(transport.get('description') or ''))
+        distance = transport.get('distance_km', '')
+        dist_str = f" (~{distance} km)" if distance else ""
+        if trans_desc:
+            detail_lines.append(f"<b>Transport:</b> {trans_desc}{dist_str}")
+    
+    # Meals
+    meals = day.get('meals_included', [])
+    if meals:
+        meals_str = xml_escape(', '.join(map(str, meals)))
+        detail_lines.append(f"<b>Meals:</b> {meals_str}")
+    
+    # Tips
+    tips = xml_escape(str(day.get('tips') or ''))
+    if tips:
+        detail_lines.append(f"<i>💡 {tips}</i>")
+    
+    if detail_lines:
+        flowables.append(Paragraph("<br/>".join(detail_lines), small))
+    
+    return flowables
+
+
+@lru_cache(maxsize=128)
+def _cached_day_flowables(day_json):
+    """Day flowables keyed on the day's JSON, so identical days are built once."""
+    return tuple(_build_day_flowables(json.loads(day_json), get_custom_styles()))
+
+
+def _clone_flowable(flowable):
+    """Copy a cached flowable so layout state set during a build stays per-document."""
+    clone = copy.copy(flowable)
+    if isinstance(flowable, Table):
+        clone._cellvalues = [[copy.copy(cell) for cell in row] for row in flowable._cellvalues]
+    return clone
+
+
+def _day_flowables(day):
+    """Return fresh flowables for one itinerary day, reusing cached builds."""
+    day_json = json.dumps(day, sort_keys=True, default=str)
+    return [_clone_flowable(f) for f in _cached_day_flowables(day_json)]
+
+
+def _new_doc(buffer):
+    """A4 document template shared by all PDF entry points."""
+    return SimpleDocTemplate(
         buffer,
         pagesize=A4,
         rightMargin=1*cm,
@@ -124,246 +375,142 @@ def generate_itinerary_pdf(tour_request, itinerary_data):
         topMargin=1.5*cm,
         bottomMargin=1.5*cm
     )
-    
-    styles = get_custom_styles()
+
+
+def _build_pdf(story, outfile=None):
+    """Build story into outfile if given, else into a rewound BytesIO buffer."""
+    buffer = outfile if outfile is not None else BytesIO()
+    _new_doc(buffer).build(story)
+    if outfile is not None:
+        return outfile
+    buffer.seek(0)
+    return buffer
+
+
+def _client_story(tour_request, itinerary_data, styles,
+                  include_days=True, include_cost=True, include_packing=True):
+    """Flowables for the client itinerary (see generate_itinerary_pdf)."""
     story = []
+    title = styles['CustomTitle']
+    subtitle = styles['Subtitle']
+    body = styles['CustomBody']
+    section = styles['SectionHeader']
+    small = styles['SmallText']
+    now_str = datetime.now().strftime('%B %d, %Y at %H:%M')
     
     # ═══════════════════════════════════════════════════════════════
     # HEADER / TITLE PAGE
     # ═══════════════════════════════════════════════════════════════
     
     # Company name / branding
-    story.append(Spacer(1, 1*cm))
-    story.append(Paragraph("BARIZI TOURS", styles['CustomTitle']))
-    story.append(Paragraph("Your Safari Adventure Awaits", styles['Subtitle']))
-    story.append(Spacer(1, 0.5*cm))
+    story.append(Spacer(1, GAP_L))
+    story.append(Paragraph("BARIZI TOURS", title))
+    story.append(Paragraph("Your Safari Adventure Awaits", subtitle))
+    story.append(Spacer(1, GAP_M))
     
     # Horizontal line
     story.append(HRFlowable(width="100%", thickness=2, color=BURNT_ORANGE))
-    story.append(Spacer(1, 0.5*cm))
+    story.append(Spacer(1, GAP_M))
     
     # Tour title
     tour_title = f"{tour_request.duration_days}-Day {tour_request.get_tour_type_display()} Safari"
-    story.append(Paragraph(tour_title, styles['CustomTitle']))
+    story.append(Paragraph(tour_title, title))
     
     # Client info box
     client_info = f"""
     <b>Prepared for:</b> {tour_request.client_name}<br/>
     <b>Email:</b> {tour_request.client_email}<br/>
-    <b>Travel Dates:</b> {tour_request.start_date.strftime('%B %d, %Y')} - {tour_request.end_date.strftime('%B %d, %Y')}<br/>
+    <b>Travel Dates:</b> {tour_request.start_date_display} - {tour_request.end_date_display}<br/>
     <b>Travelers:</b> {tour_request.num_adults} Adult(s), {tour_request.num_children} Child(ren)
     """
-    story.append(Spacer(1, 0.5*cm))
-    story.append(Paragraph(client_info, styles['CustomBody']))
-    story.append(Spacer(1, 0.5*cm))
+    story.append(Spacer(1, GAP_M))
+    story.append(Paragraph(client_info, body))
+    story.append(Spacer(1, GAP_M))
     
     # Summary
     if itinerary_data.get('summary'):
-        story.append(Paragraph("Tour Overview", styles['SectionHeader']))
-        story.append(Paragraph(itinerary_data['summary'], styles['CustomBody']))
+        story.append(Paragraph("Tour Overview", section))
+        story.append(Paragraph(itinerary_data['summary'], body))
     
-    story.append(Spacer(1, 0.5*cm))
+    story.append(Spacer(1, GAP_M))
     
     # ═══════════════════════════════════════════════════════════════
     # DAY-BY-DAY ITINERARY
     # ═══════════════════════════════════════════════════════════════
     
-    story.append(Paragraph("Day-by-Day Itinerary", styles['SectionHeader']))
-    story.append(HRFlowable(width="100%", thickness=1, color=LIGHT_GRAY))
+    if include_days:
+        story.append(Paragraph("Day-by-Day Itinerary", section))
+        story.append(HRFlowable(width="100%", thickness=1, color=LIGHT_GRAY))
     
-    for day in itinerary_data.get('days', []):
-        # Day header with background
-        day_num = day.get('day', '')
-        day_title = day.get('title', '')
-        destination = day.get('destination', '')
-        
-        # Create day header table for better styling
-        day_header_data = [[
-            Paragraph(f"<font color='#CC5500'>DAY {day_num}</font>", styles['CustomBody']),
-            Paragraph(f"<b>{day_title}</b>", styles['CustomBody']),
-            Paragraph(destination, styles['SmallText'])
-        ]]
-        day_header_table = Table(day_header_data, colWidths=[1.5*cm, 10*cm, 5*cm])
-        day_header_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, -1), BLACK),
-            ('TEXTCOLOR', (0, 0), (-1, -1), WHITE),
-            ('ALIGN', (0, 0), (0, 0), 'CENTER'),
-            ('ALIGN', (1, 0), (1, 0), 'LEFT'),
-            ('ALIGN', (2, 0), (2, 0), 'RIGHT'),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('PADDING', (0, 0), (-1, -1), 10),
-            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
-        ]))
-        story.append(Spacer(1, 0.3*cm))
-        story.append(day_header_table)
-        
-        # Activities
-        activities = day.get('activities', [])
-        if activities:
-            story.append(Spacer(1, 0.2*cm))
-            story.append(Paragraph("<b>Activities:</b>", styles['CustomBody']))
-            for activity in activities:
-                act_name = activity.get('name', '')
-                act_time = activity.get('time', '')
-                act_cost = activity.get('cost_per_person', '')
-                time_str = f" ({act_time})" if act_time else ""
-                cost_str = f" - ${act_cost}/pp" if act_cost else ""
-                story.append(Paragraph(f"• {act_name}{time_str}{cost_str}", styles['SmallText']))
-        
-        # Accommodation
-        accommodation = day.get('accommodation', {})
-        if accommodation:
-            story.append(Spacer(1, 0.2*cm))
-            acc_name = accommodation.get('name', 'TBA')
-            meal_plan = accommodation.get('meal_plan', '')
-            acc_cost = accommodation.get('cost_per_person', '')
-            meal_str = f" ({meal_plan})" if meal_plan else ""
-            cost_str = f" - ${acc_cost}/pp" if acc_cost else ""
-            story.append(Paragraph(f"<b>Accommodation:</b> {acc_name}{meal_str}{cost_str}", styles['CustomBody']))
-        
-        # Transport
-        transport = day.get('transport', {})
-        if transport:
-            trans_desc = transport.get('description', '')
-            distance = transport.get('distance_km', '')
-            dist_str = f" (~{distance} km)" if distance else ""
-            if trans_desc:
-                story.append(Paragraph(f"<b>Transport:</b> {trans_desc}{dist_str}", styles['SmallText']))
-        
-        # Meals
-        meals = day.get('meals_included', [])
-        if meals:
-            meals_str = ', '.join(meals)
-            story.append(Paragraph(f"<b>Meals:</b> {meals_str}", styles['SmallText']))
-        
-        # Tips
-        tips = day.get('tips', '')
-        if tips:
-            story.append(Paragraph(f"<i>💡 {tips}</i>", styles['SmallText']))
+        for day in itinerary_data.get('days', []):
+            story.extend(_day_flowables(day))
     
     # ═══════════════════════════════════════════════════════════════
     # COST BREAKDOWN
     # ═══════════════════════════════════════════════════════════════
     
-    story.append(Spacer(1, 0.5*cm))
-    story.append(Paragraph("Cost Breakdown", styles['SectionHeader']))
-    story.append(HRFlowable(width="100%", thickness=1, color=LIGHT_GRAY))
+    if include_cost:
+        story.append(Spacer(1, GAP_M))
+        story.append(Paragraph("Cost Breakdown", section))
+        story.append(HRFlowable(width="100%", thickness=1, color=LIGHT_GRAY))
     
-    cost_breakdown = itinerary_data.get('cost_breakdown', {})
-    if cost_breakdown:
-        cost_data = []
-        
-        if cost_breakdown.get('accommodation_total'):
-            cost_data.append(['Accommodation', f"${cost_breakdown['accommodation_total']:,.0f}"])
-        if cost_breakdown.get('activities_total'):
-            cost_data.append(['Activities & Excursions', f"${cost_breakdown['activities_total']:,.0f}"])
-        if cost_breakdown.get('transport_total'):
-            cost_data.append(['Transport', f"${cost_breakdown['transport_total']:,.0f}"])
-        if cost_breakdown.get('park_fees_total'):
-            cost_data.append(['Park & Conservation Fees', f"${cost_breakdown['park_fees_total']:,.0f}"])
-        
-        # Subtotal
-        if cost_breakdown.get('subtotal_per_person'):
-            cost_data.append(['', ''])  # Spacer row
-            cost_data.append(['Subtotal (per person)', f"${cost_breakdown['subtotal_per_person']:,.0f}"])
+        cost_breakdown = itinerary_data.get('cost_breakdown', {})
+        if cost_breakdown:
+            # Markup lines are operator-only and deliberately absent from COST_ROWS
+            rows = [(key, label) for key, label in COST_ROWS if cost_breakdown.get(key)]
+            cost_data = [[label, _fmt_usd(cost_breakdown[key])] for key, label in rows]
         
-        # Markup info (only show to operator, not client)
-        # Skip markup in client PDF
-        
-        # Totals
-        if cost_breakdown.get('total_per_person'):
-            cost_data.append(['', ''])  # Spacer row
-            cost_data.append(['TOTAL PER PERSON', f"${cost_breakdown['total_per_person']:,.0f}"])
-        if cost_breakdown.get('total_all_travelers'):
-            cost_data.append(['TOTAL (ALL TRAVELERS)', f"${cost_breakdown['total_all_travelers']:,.0f}"])
-        
-        if cost_data:
-            cost_table = Table(cost_data, colWidths=[12*cm, 5*cm])
-            cost_table.setStyle(TableStyle([
-                ('ALIGN', (0, 0), (0, -1), 'LEFT'),
-                ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
-                ('FONTNAME', (0, -2), (-1, -1), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, -1), 10),
-                ('TEXTCOLOR', (0, -2), (-1, -1), BURNT_ORANGE),
-                ('LINEABOVE', (0, -2), (-1, -2), 1, BLACK),
-                ('PADDING', (0, 0), (-1, -1), 5),
-            ]))
-            story.append(cost_table)
+            if cost_data:
+                cost_table = Table(cost_data, colWidths=COST_COL_WIDTHS)
+                gap_rows = [i - 1 for i, (key, _) in enumerate(rows) if i and key in COST_GAP_BEFORE]
+                cost_table.setStyle(_cost_table_style(len(cost_data), gap_rows))
+                story.append(cost_table)
     
     # ═══════════════════════════════════════════════════════════════
     # WHAT TO PACK
     # ═══════════════════════════════════════════════════════════════
     
-    what_to_pack = itinerary_data.get('what_to_pack', [])
+    what_to_pack = itinerary_data.get('what_to_pack', []) if include_packing else []
     if what_to_pack:
-        story.append(Spacer(1, 0.5*cm))
-        story.append(Paragraph("Packing Checklist", styles['SectionHeader']))
+        story.append(Spacer(1, GAP_M))
+        story.append(Paragraph("Packing Checklist", section))
         story.append(HRFlowable(width="100%", thickness=1, color=LIGHT_GRAY))
         
-        # Create 3-column layout for packing items
-        pack_rows = []
-        row = []
-        for i, item in enumerate(what_to_pack):
-            row.append(f"☐ {item}")
-            if len(row) == 3:
-                pack_rows.append(row)
-                row = []
-        if row:  # Add remaining items
-            while len(row) < 3:
-                row.append('')
-            pack_rows.append(row)
+        # Create 3-column layout for packing items (last row padded with '')
+        prefixed = [f"☐ {item}" for item in what_to_pack]
+        pack_rows = [list(row) for row in zip_longest(*[iter(prefixed)] * 3, fillvalue='')]
         
         if pack_rows:
-            pack_table = Table(pack_rows, colWidths=[5.5*cm, 5.5*cm, 5.5*cm])
-            pack_table.setStyle(TableStyle([
-                ('FONTSIZE', (0, 0), (-1, -1), 9),
-                ('PADDING', (0, 0), (-1, -1), 4),
-            ]))
+            pack_table = Table(pack_rows, colWidths=PACK_COL_WIDTHS)
+            pack_table.setStyle(PACK_TABLE_STYLE)
             story.append(pack_table)
     
     # ═══════════════════════════════════════════════════════════════
     # FOOTER / TERMS
     # ═══════════════════════════════════════════════════════════════
     
-    story.append(Spacer(1, 1*cm))
+    story.append(Spacer(1, GAP_L))
     story.append(HRFlowable(width="100%", thickness=1, color=BURNT_ORANGE))
-    story.append(Spacer(1, 0.3*cm))
+    story.append(Spacer(1, GAP_S))
     
     footer_text = f"""
     <b>Barizi Tours</b> | Your Trusted Safari Partner<br/>
-    Generated on: {datetime.now().strftime('%B %d, %Y at %H:%M')}<br/>
+    Generated on: {now_str}<br/>
     <i>This itinerary is subject to availability. Prices valid for 7 days from generation date.</i>
     """
-    story.append(Paragraph(footer_text, styles['SmallText']))
+    story.append(Paragraph(footer_text, small))
     
-    # Build PDF
-    doc.build(story)
-    buffer.seek(0)
-    return buffer
+    return story
 
 
-def generate_operator_pdf(tour_request, itinerary_data):
-    """
-    Generate a PDF with operator-specific details (including profit margins).
-    This is for internal use only.
-    """
-    buffer = BytesIO()
-    doc = SimpleDocTemplate(
-        buffer,
-        pagesize=A4,
-        rightMargin=1*cm,
-        leftMargin=1*cm,
-        topMargin=1.5*cm,
-        bottomMargin=1.5*cm
-    )
-    
-    styles = get_custom_styles()
+def _operator_story(tour_request, itinerary_data, styles):
+    """Flowables for the operator copy (see generate_operator_pdf)."""
     story = []
     
     # Header
     story.append(Paragraph("OPERATOR COPY - CONFIDENTIAL", styles['CustomTitle']))
     story.append(HRFlowable(width="100%", thickness=2, color=colors.red))
-    story.append(Spacer(1, 0.5*cm))
+    story.append(Spacer(1, GAP_M))
     
     # Client & Request info
     info_text = f"""
@@ -375,7 +522,7 @@ def generate_operator_pdf(tour_request, itinerary_data):
     <b>Markup Applied:</b> {tour_request.markup_percentage}%
     """
     story.append(Paragraph(info_text, styles['CustomBody']))
-    story.append(Spacer(1, 0.5*cm))
+    story.append(Spacer(1, GAP_M))
     
     # Financial summary
     story.append(Paragraph("Financial Summary", styles['SectionHeader']))
@@ -384,35 +531,69 @@ def generate_operator_pdf(tour_request, itinerary_data):
     if cost_breakdown:
         fin_data = [
             ['Item', 'Amount'],
-            ['Base Cost (per person)', f"${cost_breakdown.get('subtotal_per_person', 0):,.2f}"],
+            ['Base Cost (per person)', _fmt_usd2(cost_breakdown.get('subtotal_per_person', 0))],
             ['Your Markup (%)', f"{cost_breakdown.get('operator_markup_percentage', 0)}%"],
-            ['Markup Amount (per person)', f"${cost_breakdown.get('operator_markup_per_person', 0):,.2f}"],
-            ['Final Price (per person)', f"${cost_breakdown.get('total_per_person', 0):,.2f}"],
+            ['Markup Amount (per person)', _fmt_usd2(cost_breakdown.get('operator_markup_per_person', 0))],
+            ['Final Price (per person)', _fmt_usd2(cost_breakdown.get('total_per_person', 0))],
             ['', ''],
-            ['Total Markup (All Travelers)', f"${cost_breakdown.get('operator_markup_total', 0):,.2f}"],
-            ['GRAND TOTAL', f"${cost_breakdown.get('total_all_travelers', 0):,.2f}"],
+            ['Total Markup (All Travelers)', _fmt_usd2(cost_breakdown.get('operator_markup_total', 0))],
+            ['GRAND TOTAL', _fmt_usd2(cost_breakdown.get('total_all_travelers', 0))],
             ['', ''],
-            ['YOUR PROFIT', f"${cost_breakdown.get('operator_markup_total', 0):,.2f}"],
+            ['YOUR PROFIT', _fmt_usd2(cost_breakdown.get('operator_markup_total', 0))],
         ]
         
-        fin_table = Table(fin_data, colWidths=[10*cm, 6*cm])
-        fin_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), BLACK),
-            ('TEXTCOLOR', (0, 0), (-1, 0), WHITE),
-            ('ALIGN', (0, 0), (0, -1), 'LEFT'),
-            ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, -1), (-1, -1), 14),
-            ('TEXTCOLOR', (0, -1), (-1, -1), colors.green),
-            ('BACKGROUND', (0, -1), (-1, -1), colors.HexColor('#E8F5E9')),
-            ('LINEABOVE', (0, -3), (-1, -3), 1, BLACK),
-            ('PADDING', (0, 0), (-1, -1), 8),
-            ('GRID', (0, 0), (-1, -1), 0.5, LIGHT_GRAY),
-        ]))
+        fin_table = Table(fin_data, colWidths=FIN_COL_WIDTHS)
+        fin_table.setStyle(FIN_TABLE_STYLE)
         story.append(fin_table)
     
-    # Build PDF
-    doc.build(story)
-    buffer.seek(0)
-    return buffer
+    return story
+
+
+def generate_itinerary_pdf(tour_request, itinerary_data, outfile=None,
+                           include_days=True, include_cost=True, include_packing=True):
+    """
+    Generate a professional PDF itinerary.
+    
+    Args:
+        tour_request: TourRequest model instance
+        itinerary_data: Dict containing the generated itinerary
+        outfile: Optional file-like object (e.g. an HttpResponse) to write
+            the PDF into directly
+        include_days, include_cost, include_packing: Set to False to leave
+            that section out (e.g. a totals-only quote skips days and packing)
+    
+    Returns:
+        outfile if given, else a BytesIO buffer containing the PDF
+    """
+    styles = get_custom_styles()
+    story = _client_story(
+        tour_request, itinerary_data, styles,
+        include_days=include_days, include_cost=include_cost, include_packing=include_packing,
+    )
+    return _build_pdf(story, outfile)
+
+
+def generate_operator_pdf(tour_request, itinerary_data, outfile=None):
+    """
+    Generate a PDF with operator-specific details (including profit margins).
+    This is for internal use only.
+    
+    Writes into outfile if given (see generate_itinerary_pdf), else returns
+    a BytesIO buffer.
+    """
+    return _build_pdf(_operator_story(tour_request, itinerary_data, get_custom_styles()), outfile)
+
+
+def generate_combined_pdf(tour_request, itinerary_data, outfile=None):
+    """
+    Generate the client itinerary followed by the operator copy in a single
+    PDF (one style sheet, one layout pass) instead of two separate builds.
+    
+    Writes into outfile if given (see generate_itinerary_pdf), else returns
+    a BytesIO buffer.
+    """
+    styles = get_custom_styles()
+    story = _client_story(tour_request, itinerary_data, styles)
+    story.append(PageBreak())
+    story.extend(_operator_story(tour_request, itinerary_data, styles))
+    return _build_pdf(story, outfile)
@@ -2,31 +2,279 @@
 Selenium-based Flight Price Scraper
 Uses browser automation to get real-time prices from airline booking systems.
 """
+import json
+import os
 import time
 import re
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
+from contextlib import contextmanager
+from functools import lru_cache, partial
+from operator import itemgetter
+from types import MappingProxyType
 from datetime import datetime, timedelta
 from decimal import Decimal
 
 
+# Airport code -> city name as typed into Air Tanzania's booking form. Kept
+# apart from flight_scraper.AIRPORT_NAMES, whose full airport names are for
+# display and would not match the form's autocomplete.
+AIR_TANZANIA_CITY_NAMES = MappingProxyType({
+    'DAR': 'Dar Es Salaam',
+    'JRO': 'Kilimanjaro',
+    'ZNZ': 'Zanzibar',
+    'ARK': 'Arusha',
+    'MWZ': 'Mwanza',
+    'DOD': 'Dodoma',
+    'KIH': 'Kigoma',
+    'BKZ': 'Bukoba',
+    'TKQ': 'Kigoma',
+})
+
+# Upper bound on browsers open at once when scraping airlines in parallel
+MAX_PARALLEL_BROWSERS = 3
+
+# Price patterns, compiled once. Each alternation replaces a list of
+# patterns that used to be searched one after another over the whole page;
+# exactly one group is set per match (see _matched_amount).
+# _PRICE_RE.pattern is also run in the browser (_PAGE_PRICES_JS), so keep it
+# to syntax JavaScript RegExp shares with Python.
+_AMOUNT = r'(\d+(?:,\d{3})*(?:\.\d{2})?)'
+_PRICE_RE = re.compile(
+    rf'(?:USD|\$)\s*{_AMOUNT}|{_AMOUNT}\s*USD|TZS\s*(\d+(?:,\d{{3}})*)',
+    re.IGNORECASE,
+)
+_ELEM_PRICE_RE = re.compile(_AMOUNT)
+# Precision Air: whole-dollar amounts only
+_WHOLE_USD_RE = re.compile(r'(?:USD\s*|\$)(\d+)|(\d+)\s*USD', re.IGNORECASE)
+
+
+def _add_prices(prices, amounts, low, high, seen):
+    """
+    Add the raw amount strings that fall within [low, high] to the prices
+    set. Strings already in seen are skipped, so a literal repeated across
+    the page is only converted once.
+    """
+    for amount in amounts:
+        if amount in seen:
+            continue
+        seen.add(amount)
+        price = float(amount.replace(',', ''))
+        if low <= price <= high:
+            prices.add(price)
+
+
+# Browser-side DOM queries, each a single execute_script round-trip
+_FIRST_MATCHES_JS = (
+    "return Array.from(arguments).map(sel => document.querySelector(sel));"
+)
+# Both price sources in one round-trip (arguments: pattern string, low, high).
+# Returns [page_prices, price_texts]:
+# - page_prices: a price regex run over the page HTML, keeping the distinct
+#   amounts within [low, high] as numbers (the amount is taken from whichever
+#   group matched, like _matched_amount);
+# - price_texts: the text of every fare-like element, for bare numbers the
+#   currency regex would miss.
+_PAGE_PRICES_JS = (
+    "const re = new RegExp(arguments[0], 'gi');"
+    "const amounts = new Set(Array.from(document.documentElement.outerHTML.matchAll(re),"
+    " m => m.slice(1).find(Boolean)));"
+    "const prices = Array.from(amounts, a => parseFloat(a.replace(/,/g, '')))"
+    ".filter(p => p >= arguments[1] && p <= arguments[2]);"
+    "const texts = Array.from(document.querySelectorAll("
+    "\".price, .fare, .amount, [class*='price'], [class*='fare']\""
+    "), e => e.innerText);"
+    "return [prices, texts];"
+)
+
+
+def _matched_amount(match):
+    """The amount captured by whichever alternative of a price regex matched."""
+    return next(group for group in match.groups() if group)
+
+
+# Pooled browsers are replaced after this many checkouts or seconds, since
+# long-lived chromedriver sessions grow in memory
+DRIVER_MAX_USES = 20
+DRIVER_MAX_AGE = 10 * 60
+
+# Seconds. Scrapers wait on explicit conditions (WebDriverWait) rather than
+# fixed sleeps or an implicit wait, which would stack on top of them.
+PAGE_LOAD_TIMEOUT = 20
+SCRIPT_TIMEOUT = 10
+ELEMENT_WAIT_TIMEOUT = 15
+SUGGESTION_WAIT_TIMEOUT = 3
+AIRLINE_SCRAPE_TIMEOUT = 60
+
+# Air Tanzania booking form. The explicit waits use the same selectors as
+# the lookups that follow them, so a form matched only by a fallback
+# selector is not mistaken for a missing one (with no implicit wait, an
+# empty find_elements() returns at once and that step is skipped).
+ORIGIN_INPUT_SELECTOR = "input[name*='origin'], input[id*='origin'], input[placeholder*='From'], #departure"
+DEST_INPUT_SELECTOR = "input[name*='dest'], input[id*='dest'], input[placeholder*='To'], #arrival"
+SUGGESTION_SELECTOR = ".autocomplete-suggestion, .dropdown-item, .ui-menu-item"
+
+# Pages that need no form automation are fetched with requests instead
+STATIC_FETCH_TIMEOUT = 10
+STATIC_USER_AGENT = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+)
+
+
+# Resolved webdriver binaries, keyed by browser and its major version, so
+# webdriver-manager's update check only runs after a browser upgrade
+DRIVER_CACHE_FILE = os.path.join(os.path.expanduser('~'), '.cache', 'barizi', 'driver_path.json')
+
+
+def _read_driver_cache():
+    try:
+        with open(DRIVER_CACHE_FILE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_driver_cache(cache):
+    try:
+        os.makedirs(os.path.dirname(DRIVER_CACHE_FILE), exist_ok=True)
+        with open(DRIVER_CACHE_FILE, 'w') as f:
+            json.dump(cache, f)
+    except OSError as e:
+        print(f"   ⚠️ Could not write driver cache: {e}")
+
+
+@lru_cache(maxsize=None)
+def _driver_path(browser):
+    """
+    Path to the webdriver binary for 'edge' or 'chrome'.
+    
+    Memoised per process, and persisted in DRIVER_CACHE_FILE across runs;
+    webdriver-manager's install() (which checks for driver updates over the
+    network) only runs when the installed browser's major version changes.
+    """
+    from webdriver_manager.core.os_manager import OperationSystemManager, ChromeType
+    
+    if browser == 'edge':
+        from webdriver_manager.microsoft import EdgeChromiumDriverManager as DriverManager
+        chrome_type = ChromeType.MSEDGE
+    else:
+        from webdriver_manager.chrome import ChromeDriverManager as DriverManager
+        chrome_type = ChromeType.GOOGLE
+    
+    version = OperationSystemManager().get_browser_version_from_os(chrome_type)
+    major = version.split('.')[0] if version else None
+    
+    cache = _read_driver_cache()
+    entry = cache.get(browser) or {}
+    if major and entry.get('major') == major and os.path.exists(entry.get('path', '')):
+        return entry['path']
+    
+    path = DriverManager().install()
+    if major:
+        cache[browser] = {'major': major, 'path': path}
+        _write_driver_cache(cache)
+    return path
+
+
 class SeleniumFlightScraper:
     """Browser automation scraper for airline websites."""
     
-    def __init__(self, headless=True):
+    def __init__(self, headless=True, max_uses=DRIVER_MAX_USES, debug=False):
         self.headless = headless
-        self.driver = None
+        self.max_uses = max_uses
+        # Save a screenshot when a page yields no prices
+        self.debug = debug
+        # One driver per thread so airlines can be scraped concurrently;
+        # every driver opened is also tracked so close() can quit them all
+        self._local = threading.local()
+        self._drivers = []
+        self._drivers_lock = threading.Lock()
+        self._session = None
+        # Browsers for scrape_all_airlines, kept across calls until close()
+        self._pool = None
+    
+    @property
+    def driver(self):
+        """The calling thread's WebDriver (None until _init_driver)."""
+        return getattr(self._local, 'driver', None)
+    
+    @driver.setter
+    def driver(self, value):
+        self._local.driver = value
+        if value is not None:
+            with self._drivers_lock:
+                self._drivers.append(value)
         
+    def _apply_fast_load_options(self, options):
+        """
+        Return from driver.get() at DOMContentLoaded and skip image downloads;
+        prices are read from the HTML, never from images.
+        """
+        options.page_load_strategy = 'eager'
+        options.add_argument('--blink-settings=imagesEnabled=false')
+        options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2,
+        })
+    
+    def _apply_low_memory_options(self, options):
+        """
+        Trim Chromium's per-browser footprint (renderer processes, background
+        services) so more pooled browsers fit on one host.
+        """
+        options.add_argument('--disable-features=Translate,BackForwardCache,InterestCohort')
+        options.add_argument('--renderer-process-limit=1')
+        options.add_argument('--disable-background-networking')
+        options.add_argument('--disable-extensions')
+        options.add_argument('--disable-sync')
+    
     def _init_driver(self):
-        """Initialize WebDriver (tries Edge first on Windows, then Chrome)."""
-        if self.driver:
-            return self.driver
+        """
+        Return this thread's WebDriver, starting a browser if needed.
+        
+        A browser started here is quit and replaced once it has served
+        max_uses scrapes, to cap chromedriver's memory growth over long
+        batches. (Browsers checked out of a WebDriverPool are recycled by
+        the pool instead; their use count is None.)
+        """
+        driver = self.driver
+        uses = getattr(self._local, 'uses', None)
+        if driver is not None and uses is not None and uses >= self.max_uses:
+            print(f"   ♻️ Restarting browser after {uses} scrapes")
+            self._retire_driver(driver)
+            driver = None
+        
+        if driver is None:
+            driver = self._create_driver()
+            if driver is None:
+                return None
+            self.driver = driver
+            self._local.uses = 0
         
+        if getattr(self._local, 'uses', None) is not None:
+            self._local.uses += 1
+        return driver
+    
+    def _retire_driver(self, driver):
+        """Quit one of this scraper's browsers and forget it."""
+        with self._drivers_lock:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+        self._local.driver = None
+        try:
+            driver.quit()
+        except Exception as e:
+            print(f"   ⚠️ Error closing browser: {e}")
+    
+    def _create_driver(self):
+        """Start a new WebDriver (tries Edge first on Windows, then Chrome)."""
         from selenium import webdriver
         
         # Try Microsoft Edge first (comes with Windows)
         try:
             from selenium.webdriver.edge.service import Service as EdgeService
             from selenium.webdriver.edge.options import Options as EdgeOptions
-            from webdriver_manager.microsoft import EdgeChromiumDriverManager
             
             options = EdgeOptions()
             if self.headless:
@@ -37,12 +285,15 @@ class SeleniumFlightScraper:
             options.add_argument('--window-size=1920,1080')
             options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
             options.add_experimental_option('excludeSwitches', ['enable-logging'])
+            self._apply_fast_load_options(options)
+            self._apply_low_memory_options(options)
             
-            service = EdgeService(EdgeChromiumDriverManager().install())
-            self.driver = webdriver.Edge(service=service, options=options)
-            self.driver.implicitly_wait(10)
+            service = EdgeService(_driver_path('edge'))
+            driver = webdriver.Edge(service=service, options=options)
+            driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+            driver.set_script_timeout(SCRIPT_TIMEOUT)
             print("   ✓ Edge browser initialized")
-            return self.driver
+            return driver
         except Exception as e:
             print(f"   ⚠️ Edge failed: {e}")
         
@@ -50,7 +301,6 @@ class SeleniumFlightScraper:
         try:
             from selenium.webdriver.chrome.service import Service as ChromeService
             from selenium.webdriver.chrome.options import Options as ChromeOptions
-            from webdriver_manager.chrome import ChromeDriverManager
             
             options = ChromeOptions()
             if self.headless:
@@ -60,23 +310,108 @@ class SeleniumFlightScraper:
             options.add_argument('--disable-gpu')
             options.add_argument('--window-size=1920,1080')
             options.add_experimental_option('excludeSwitches', ['enable-logging'])
+            self._apply_fast_load_options(options)
+            self._apply_low_memory_options(options)
             
-            service = ChromeService(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=options)
-            self.driver.implicitly_wait(10)
+            service = ChromeService(_driver_path('chrome'))
+            driver = webdriver.Chrome(service=service, options=options)
+            driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+            driver.set_script_timeout(SCRIPT_TIMEOUT)
             print("   ✓ Chrome browser initialized")
-            return self.driver
+            return driver
         except Exception as e:
             print(f"   ⚠️ Chrome failed: {e}")
         
         print("   ❌ No browser available. Install Chrome or Edge.")
         return None
     
+    def _fetch_static(self, url):
+        """GET a page that needs no JavaScript, without starting a browser."""
+        import requests
+        
+        if self._session is None:
+            self._session = requests.Session()
+            self._session.headers.update({'User-Agent': STATIC_USER_AGENT})
+        response = self._session.get(url, timeout=STATIC_FETCH_TIMEOUT)
+        response.raise_for_status()
+        return response
+    
+    def _get(self, driver, url):
+        """
+        Navigate to url. If the page load timeout hits, stop loading and carry
+        on with whatever has rendered; fares are usually in the HTML well
+        before every asset finishes.
+        """
+        from selenium.common.exceptions import TimeoutException
+        
+        try:
+            driver.get(url)
+        except TimeoutException:
+            print(f"   ⚠️ Page still loading after {PAGE_LOAD_TIMEOUT}s; using what has loaded")
+            driver.execute_script("window.stop();")
+    
+    def _wait_for(self, driver, condition, timeout=ELEMENT_WAIT_TIMEOUT):
+        """Wait until condition holds; return False instead of raising on timeout."""
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.common.exceptions import TimeoutException
+        
+        try:
+            WebDriverWait(driver, timeout).until(condition)
+            return True
+        except TimeoutException:
+            return False
+    
+    def _save_debug_screenshot(self, driver, path):
+        """
+        Grab a screenshot in memory and write it to path on a background
+        thread, so the scrape doesn't wait on the disk.
+        """
+        try:
+            png = driver.get_screenshot_as_png()
+        except Exception as e:
+            print(f"   ⚠️ Screenshot failed: {e}")
+            return
+        
+        def write():
+            try:
+                with open(path, 'wb') as f:
+                    f.write(png)
+                print(f"   📸 Screenshot saved: {path}")
+            except OSError as e:
+                print(f"   ⚠️ Could not save screenshot {path}: {e}")
+        
+        threading.Thread(target=write, daemon=True).start()
+    
+    def _browser_pool(self):
+        """The scraper's WebDriverPool, started on first use and kept until close()."""
+        with self._drivers_lock:
+            if self._pool is None:
+                self._pool = WebDriverPool(self, size=MAX_PARALLEL_BROWSERS, max_uses=self.max_uses)
+            return self._pool
+    
+    def _scrape_with_pooled_browser(self, scrape, *args):
+        """Run a browser-based airline scraper on a browser checked out of the pool."""
+        with self._browser_pool().acquire() as driver:
+            if driver is None:
+                return None
+            return scrape(*args)
+    
     def close(self):
-        """Close the browser."""
-        if self.driver:
-            self.driver.quit()
-            self.driver = None
+        """Close every browser opened by this scraper, from any thread."""
+        with self._drivers_lock:
+            drivers, self._drivers = self._drivers, []
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.close()
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception as e:
+                print(f"   ⚠️ Error closing browser: {e}")
+        self._local = threading.local()
+        if self._session is not None:
+            self._session.close()
+            self._session = None
     
     def scrape_air_tanzania(self, origin, destination, date=None):
         """
@@ -91,9 +426,7 @@ class SeleniumFlightScraper:
             dict with flight price info or None
         """
         from selenium.webdriver.common.by import By
-        from selenium.webdriver.support.ui import WebDriverWait, Select
         from selenium.webdriver.support import expected_conditions as EC
-        from selenium.common.exceptions import TimeoutException, NoSuchElementException
         
         print(f"\n   🌐 Opening Air Tanzania booking page...")
         
@@ -101,21 +434,8 @@ class SeleniumFlightScraper:
         if not driver:
             return None
         
-        # Airport code mapping for Air Tanzania
-        airport_mapping = {
-            'DAR': 'Dar Es Salaam',
-            'JRO': 'Kilimanjaro',
-            'ZNZ': 'Zanzibar',
-            'ARK': 'Arusha',
-            'MWZ': 'Mwanza',
-            'DOD': 'Dodoma',
-            'KIH': 'Kigoma',
-            'BKZ': 'Bukoba',
-            'TKQ': 'Kigoma',
-        }
-        
-        origin_name = airport_mapping.get(origin.upper(), origin)
-        dest_name = airport_mapping.get(destination.upper(), destination)
+        origin_name = AIR_TANZANIA_CITY_NAMES.get(origin.upper(), origin)
+        dest_name = AIR_TANZANIA_CITY_NAMES.get(destination.upper(), destination)
         
         if not date:
             date = (datetime.now() + timedelta(days=30)).strftime('%Y-%m-%d')
@@ -125,11 +445,13 @@ class SeleniumFlightScraper:
             # Their booking URL
             booking_url = "https://book.airtanzania.co.tz"
             
-            driver.get(booking_url)
+            self._get(driver, booking_url)
             print(f"   ✓ Page loaded: {driver.title[:50]}...")
             
-            # Wait for the page to load
-            time.sleep(3)
+            # Wait for the booking form rather than a fixed delay
+            if not self._wait_for(driver, EC.presence_of_element_located(
+                    (By.CSS_SELECTOR, ORIGIN_INPUT_SELECTOR))):
+                print(f"   ⚠️ Booking form did not appear in {ELEMENT_WAIT_TIMEOUT}s")
             
             # Look for booking form elements
             # The exact selectors depend on their current website structure
@@ -137,104 +459,80 @@ class SeleniumFlightScraper:
             # Try to find and fill origin
             try:
                 # Look for origin input
-                origin_inputs = driver.find_elements(By.CSS_SELECTOR, 
-                    "input[name*='origin'], input[id*='origin'], input[placeholder*='From'], #departure")
+                origin_inputs = driver.find_elements(By.CSS_SELECTOR, ORIGIN_INPUT_SELECTOR)
                 
                 if origin_inputs:
                     origin_input = origin_inputs[0]
                     origin_input.clear()
                     origin_input.send_keys(origin_name)
                     print(f"   ✓ Entered origin: {origin_name}")
-                    time.sleep(1)
+                    self._wait_for(driver, EC.visibility_of_element_located(
+                        (By.CSS_SELECTOR, SUGGESTION_SELECTOR)),
+                        timeout=SUGGESTION_WAIT_TIMEOUT)
                     
                     # Click first suggestion if dropdown appears
-                    suggestions = driver.find_elements(By.CSS_SELECTOR, 
-                        ".autocomplete-suggestion, .dropdown-item, .ui-menu-item")
+                    suggestions = driver.find_elements(By.CSS_SELECTOR, SUGGESTION_SELECTOR)
                     if suggestions:
                         suggestions[0].click()
                         print(f"   ✓ Selected origin from dropdown")
                 
                 # Look for destination input
-                dest_inputs = driver.find_elements(By.CSS_SELECTOR,
-                    "input[name*='dest'], input[id*='dest'], input[placeholder*='To'], #arrival")
+                dest_inputs = driver.find_elements(By.CSS_SELECTOR, DEST_INPUT_SELECTOR)
                 
                 if dest_inputs:
                     dest_input = dest_inputs[0]
                     dest_input.clear()
                     dest_input.send_keys(dest_name)
                     print(f"   ✓ Entered destination: {dest_name}")
-                    time.sleep(1)
+                    self._wait_for(driver, EC.visibility_of_element_located(
+                        (By.CSS_SELECTOR, SUGGESTION_SELECTOR)),
+                        timeout=SUGGESTION_WAIT_TIMEOUT)
                     
-                    suggestions = driver.find_elements(By.CSS_SELECTOR,
-                        ".autocomplete-suggestion, .dropdown-item, .ui-menu-item")
+                    suggestions = driver.find_elements(By.CSS_SELECTOR, SUGGESTION_SELECTOR)
                     if suggestions:
                         suggestions[0].click()
                         print(f"   ✓ Selected destination from dropdown")
                 
-                # Look for date input
-                date_inputs = driver.find_elements(By.CSS_SELECTOR,
-                    "input[type='date'], input[name*='date'], input[id*='date'], .datepicker")
+                # Look for the date input and search button in one round-trip
+                date_input, search_button = driver.execute_script(
+                    _FIRST_MATCHES_JS,
+                    "input[type='date'], input[name*='date'], input[id*='date'], .datepicker",
+                    "button[type='submit'], input[type='submit'], .search-btn, #searchButton",
+                )
                 
-                if date_inputs:
-                    date_input = date_inputs[0]
-                    driver.execute_script(f"arguments[0].value = '{date}'", date_input)
+                if date_input:
+                    driver.execute_script("arguments[0].value = arguments[1];", date_input, date)
                     print(f"   ✓ Set date: {date}")
                 
-                # Look for search button
-                search_buttons = driver.find_elements(By.CSS_SELECTOR,
-                    "button[type='submit'], input[type='submit'], .search-btn, #searchButton")
-                
-                if search_buttons:
-                    search_buttons[0].click()
+                if search_button:
+                    search_button.click()
                     print(f"   ✓ Clicked search button")
                     
-                    # Wait for results
-                    time.sleep(5)
+                    # Wait for fares (or an explicit no-results message)
+                    self._wait_for(driver, EC.any_of(
+                        EC.presence_of_element_located((By.CSS_SELECTOR, ".price, .fare")),
+                        EC.presence_of_element_located((By.CSS_SELECTOR, ".no-results")),
+                    ))
                 
             except Exception as e:
                 print(f"   ⚠️ Form interaction error: {e}")
             
-            # Now look for prices in the page
-            page_source = driver.page_source
-            
-            # Find all price patterns
-            price_patterns = [
-                r'USD\s*(\d+(?:,\d{3})*(?:\.\d{2})?)',
-                r'\$\s*(\d+(?:,\d{3})*(?:\.\d{2})?)',
-                r'(\d+(?:,\d{3})*(?:\.\d{2})?)\s*USD',
-                r'TZS\s*(\d+(?:,\d{3})*)',
-            ]
-            
-            prices_found = []
-            for pattern in price_patterns:
-                matches = re.findall(pattern, page_source, re.IGNORECASE)
-                for match in matches:
-                    try:
-                        price = float(match.replace(',', ''))
-                        # Filter reasonable flight prices (between $50 and $2000)
-                        if 50 <= price <= 2000:
-                            prices_found.append(price)
-                    except:
-                        pass
+            # Now look for prices in the page. The regex, dedup and range
+            # filter (reasonable flight prices, $50-$2000) all run in the
+            # browser, in the same call that collects the fare elements'
+            # texts, so only the results cross the WebDriver connection -
+            # not the whole serialized page (often megabytes).
+            page_prices, price_texts = driver.execute_script(
+                _PAGE_PRICES_JS, _PRICE_RE.pattern, 50, 2000)
+            prices_found = set(map(float, page_prices))
             
             # Also look for price elements directly
-            price_elements = driver.find_elements(By.CSS_SELECTOR,
-                ".price, .fare, .amount, [class*='price'], [class*='fare']")
-            
-            for elem in price_elements:
-                text = elem.text
-                matches = re.findall(r'(\d+(?:,\d{3})*(?:\.\d{2})?)', text)
-                for match in matches:
-                    try:
-                        price = float(match.replace(',', ''))
-                        if 50 <= price <= 2000:
-                            prices_found.append(price)
-                    except:
-                        pass
+            seen_amounts = set()
+            for text in price_texts:
+                _add_prices(prices_found, _ELEM_PRICE_RE.findall(text), 50, 2000, seen_amounts)
             
             if prices_found:
-                # Remove duplicates and sort
-                prices_found = sorted(set(prices_found))
+                prices_found = sorted(prices_found)
                 
                 print(f"\n   💰 Prices found on Air Tanzania:")
                 for p in prices_found[:5]:
@@ -260,12 +558,8 @@ class SeleniumFlightScraper:
                 print(f"   ⚠️ No prices found on page")
                 
                 # Take a screenshot for debugging
-                try:
-                    screenshot_path = f"debug_airtanzania_{origin}_{destination}.png"
-                    driver.save_screenshot(screenshot_path)
-                    print(f"   📸 Screenshot saved: {screenshot_path}")
-                except:
-                    pass
+                if self.debug:
+                    self._save_debug_screenshot(driver, f"debug_airtanzania_{origin}_{destination}.png")
                 
                 return None
                 
@@ -279,45 +573,27 @@ class SeleniumFlightScraper:
     def scrape_precision_air(self, origin, destination, date=None):
         """
         Scrape Precision Air website for flight prices.
-        """
-        from selenium.webdriver.common.by import By
-        
-        print(f"\n   🌐 Opening Precision Air booking page...")
         
-        driver = self._init_driver()
-        if not driver:
-            return None
+        The page is only searched for prices (no form to fill), so it is
+        fetched over plain HTTP instead of through a browser.
+        """
+        print(f"\n   🌐 Fetching Precision Air booking page...")
         
         try:
             # Precision Air booking page
-            driver.get("https://www.precisionairtz.com")
-            print(f"   ✓ Page loaded: {driver.title[:50]}...")
-            
-            time.sleep(3)
+            response = self._fetch_static("https://www.precisionairtz.com")
+            print(f"   ✓ Page loaded ({len(response.text)} bytes)")
             
             # Look for prices in the page
-            page_source = driver.page_source
+            page_source = response.text
             
             # Find price patterns
-            prices_found = []
-            patterns = [
-                r'USD\s*(\d+)',
-                r'\$(\d+)',
-                r'(\d+)\s*USD',
-            ]
-            
-            for pattern in patterns:
-                matches = re.findall(pattern, page_source, re.IGNORECASE)
-                for match in matches:
-                    try:
-                        price = float(match)
-                        if 50 <= price <= 1000:
-                            prices_found.append(price)
-                    except:
-                        pass
+            prices_found = set()
+            _add_prices(prices_found, map(_matched_amount, _WHOLE_USD_RE.finditer(page_source)),
+                        50, 1000, set())
             
             if prices_found:
-                prices_found = sorted(set(prices_found))
+                prices_found = sorted(prices_found)
                 print(f"\n   💰 Prices found on Precision Air:")
                 for p in prices_found[:5]:
                     print(f"      • ${p:.2f}")
@@ -329,7 +605,7 @@ class SeleniumFlightScraper:
                     'price_min': min(prices_found),
                     'price_max': max(prices_found),
                     'price_economy': min(prices_found),
-                    'source': 'selenium_scrape',
+                    'source': 'http_scrape',
                 }
             
             return None
@@ -338,37 +614,162 @@ class SeleniumFlightScraper:
             print(f"   ⚠️ Precision Air scraping error: {e}")
             return None
     
-    def scrape_all_airlines(self, origin, destination, date=None):
+    def scrape_all_airlines(self, origin, destination, date=None, target_price=None):
         """
         Try all available airline scrapers and return best result.
+        
+        If target_price is given, the first fare at or below it is returned
+        without waiting for the other airlines. Airlines still running after
+        AIRLINE_SCRAPE_TIMEOUT seconds are abandoned.
         """
+        # Browser-based scrapers run on the scraper's pooled browsers, which
+        # stay open between calls; Precision Air is fetched over plain HTTP
+        scrapers = [
+            partial(self._scrape_with_pooled_browser, self.scrape_air_tanzania),
+            self.scrape_precision_air,
+        ]
         results = []
         
-        # Try Air Tanzania
-        result = self.scrape_air_tanzania(origin, destination, date)
-        if result:
-            results.append(result)
-        
-        # Try Precision Air
-        result = self.scrape_precision_air(origin, destination, date)
-        if result:
-            results.append(result)
-        
-        # Close browser
-        self.close()
+        # Page loads dominate, so run each airline in its own thread
+        executor = ThreadPoolExecutor(max_workers=min(len(scrapers), MAX_PARALLEL_BROWSERS))
+        futures = [executor.submit(scrape, origin, destination, date) for scrape in scrapers]
+        try:
+            for future in as_completed(futures, timeout=AIRLINE_SCRAPE_TIMEOUT):
+                try:
+                    result = future.result()
+                except Exception as e:
+                    print(f"   ⚠️ Airline scraper failed: {e}")
+                    continue
+                if result and result.get('price_economy'):
+                    results.append(result)
+                    if target_price is not None and result['price_economy'] <= target_price:
+                        print(f"   ✓ {result['airline']} fare is within target; skipping the rest")
+                        break
+        except FuturesTimeoutError:
+            print(f"   ⚠️ Stopped waiting for airlines after {AIRLINE_SCRAPE_TIMEOUT}s")
+        finally:
+            # Don't block on abandoned scrapers; they hand their browser back
+            # to the pool when they finish. The caller closes the scraper.
+            executor.shutdown(wait=False, cancel_futures=True)
         
         if results:
             # Return cheapest option
-            cheapest = min(results, key=lambda x: x.get('price_economy', float('inf')))
+            cheapest = min(results, key=itemgetter('price_economy'))
             return cheapest
         
         return None
 
 
-def scrape_flight_prices(origin, destination, date=None, headless=True):
+class _PooledDriver:
+    """A pooled WebDriver plus the bookkeeping used to recycle it."""
+    
+    def __init__(self, driver):
+        self.driver = driver
+        self.created_at = time.monotonic()
+        self.uses = 0
+
+
+class WebDriverPool:
+    """
+    Up to `size` browsers shared by worker threads running one scraper.
+    
+    Browsers are started lazily on first demand and reused between
+    checkouts, so a batch of routes pays the browser start-up cost once per
+    pool slot rather than once per route. A browser is quit and replaced
+    after max_uses checkouts or max_age seconds.
+    
+    Usage:
+        pool = WebDriverPool(scraper, size=3)
+        with pool.acquire() as driver:   # in a worker thread
+            if driver:
+                scraper.scrape_air_tanzania('DAR', 'ZNZ')
+        pool.close()
+    """
+    
+    def __init__(self, scraper, size=MAX_PARALLEL_BROWSERS,
+                 max_uses=DRIVER_MAX_USES, max_age=DRIVER_MAX_AGE):
+        self.scraper = scraper
+        self.size = size
+        self.max_uses = max_uses
+        self.max_age = max_age
+        self._free = deque()
+        self._created = 0
+        self._cond = threading.Condition()
+        self._closed = False
+    
+    @contextmanager
+    def acquire(self):
+        """
+        Check out a browser and make it the scraper's driver for this thread.
+        Yields None if no browser could be started.
+        """
+        pooled = self._checkout()
+        if pooled is None:
+            yield None
+            return
+        self.scraper._local.driver = pooled.driver
+        self.scraper._local.uses = None
+        try:
+            yield pooled.driver
+        finally:
+            self.scraper._local.driver = None
+            self._checkin(pooled)
+    
+    def _checkout(self):
+        with self._cond:
+            while not self._free and self._created >= self.size:
+                self._cond.wait()
+            if self._free:
+                return self._free.popleft()
+            # Reserve a slot, then start the browser outside the lock
+            self._created += 1
+        
+        driver = self.scraper._create_driver()
+        if driver is None:
+            self._release_slot()
+            return None
+        return _PooledDriver(driver)
+    
+    def _checkin(self, pooled):
+        pooled.uses += 1
+        worn_out = (pooled.uses >= self.max_uses
+                    or time.monotonic() - pooled.created_at >= self.max_age)
+        # A browser returned after close() (e.g. by an abandoned scrape) is quit too
+        if worn_out or self._closed:
+            self._quit(pooled.driver)
+            self._release_slot()
+            return
+        with self._cond:
+            self._free.append(pooled)
+            self._cond.notify()
+    
+    def _release_slot(self):
+        with self._cond:
+            self._created -= 1
+            self._cond.notify()
+    
+    def _quit(self, driver):
+        try:
+            driver.quit()
+        except Exception as e:
+            print(f"   ⚠️ Error closing browser: {e}")
+    
+    def close(self):
+        """Quit all idle browsers; ones still checked out are quit when returned."""
+        with self._cond:
+            self._closed = True
+            idle, self._free = list(self._free), deque()
+            self._created -= len(idle)
+        for pooled in idle:
+            self._quit(pooled.driver)
+
+
+def scrape_flight_prices(origin, destination, date=None, headless=True, target_price=None):
     """
     Convenience function to scrape flight prices.
     
+    target_price: stop at the first airline fare at or below this price.
+    
     Usage:
         from tour.selenium_scraper import scrape_flight_prices
         result = scrape_flight_prices('DAR', 'ZNZ')
@@ -376,7 +777,7 @@ def scrape_flight_prices(origin, destination, date=None, headless=True):
     """
     scraper = SeleniumFlightScraper(headless=headless)
     try:
-        return scraper.scrape_all_airlines(origin, destination, date)
+        return scraper.scrape_all_airlines(origin, destination, date, target_price=target_price)
     finally:
         scraper.close()
 
@@ -400,43 +801,53 @@ def update_database_with_scraped_prices(routes=None):
             ('ARK', 'ZNZ'),
         ]
     
+    if not routes:
+        print("No routes to scrape")
+        return 0
+    
     scraper = SeleniumFlightScraper(headless=True)
+    pool = WebDriverPool(scraper, size=min(len(routes), MAX_PARALLEL_BROWSERS))
     updated = 0
     
-    try:
-        for origin, dest in routes:
+    def scrape_route(route):
+        origin, dest = route
+        with pool.acquire() as driver:
+            if not driver:
+                return origin, dest, None
             print(f"\n{'='*50}")
             print(f"Scraping: {origin} → {dest}")
             print('='*50)
-            
-            result = scraper.scrape_air_tanzania(origin, dest)
-            
-            if result and result.get('price_economy'):
-                price = Decimal(str(result['price_economy']))
-                
-                # Update or create FlightRate
-                flight, created = FlightRate.objects.update_or_create(
-                    origin_code=origin,
-                    destination_code=dest,
-                    airline='air_tanzania',
-                    defaults={
-                        'origin': AIRPORT_NAMES.get(origin, origin),
-                        'destination': AIRPORT_NAMES.get(dest, dest),
-                        'price_economy': price,
-                        'is_active': True,
-                    }
-                )
-                
-                action = "Created" if created else "Updated"
-                print(f"\n   ✅ {action}: {flight}")
-                updated += 1
-            else:
-                print(f"\n   ❌ No price found for {origin} → {dest}")
-            
-            # Small delay between requests
-            time.sleep(2)
+            return origin, dest, scraper.scrape_air_tanzania(origin, dest)
+    
+    try:
+        # Routes are scraped concurrently on pooled browsers; the database
+        # writes stay on this thread
+        with ThreadPoolExecutor(max_workers=pool.size) as executor:
+            for origin, dest, result in executor.map(scrape_route, routes):
+                if result and result.get('price_economy'):
+                    price = Decimal(str(result['price_economy']))
+                    
+                    # Update or create FlightRate
+                    flight, created = FlightRate.objects.update_or_create(
+                        origin_code=origin,
+                        destination_code=dest,
+                        airline='air_tanzania',
+                        defaults={
+                            'origin': AIRPORT_NAMES.get(origin, origin),
+                            'destination': AIRPORT_NAMES.get(dest, dest),
+                            'price_economy': price,
+                            'is_active': True,
+                        }
+                    )
+                    
+                    action = "Created" if created else "Updated"
+                    print(f"\n   ✅ {action}: {flight}")
+                    updated += 1
+                else:
+                    print(f"\n   ❌ No price found for {origin} → {dest}")
     
     finally:
+        pool.close()
         scraper.close()
     
     print(f"\n{'='*50}")
@@ -1,3 +1,4 @@
+from django.db.models import Count, Q
 from rest_framework import serializers
 from .models import TourPackage, Itinerary, Review, Vendor, Event, ExhibitorSpace, ExhibitorBooking
 from django.contrib.auth import get_user_model
@@ -40,6 +41,13 @@ class TourPackageSerializer(serializers.ModelSerializer):
             'itineraries', 'tour_reviews', 'created_at', 'updated_at'
         ]
 
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Fetch the nested relations up front (one query each, not per tour)."""
+        return queryset.select_related('operator').prefetch_related(
+            'itineraries', 'tour_reviews__user', 'vendors'
+        )
+
 
 class EventSerializer(serializers.ModelSerializer):
     # For displaying the category name (e.g., "Festival" instead of "festival")
@@ -81,9 +89,19 @@ class ExhibitorSpaceSerializer(serializers.ModelSerializer):
         model = ExhibitorSpace
         fields = ['id', 'event', 'name', 'price', 'total_slots', 'description', 'available_slots']
 
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Annotate each space with its non-cancelled booking count."""
+        return queryset.annotate(
+            used=Count('bookings', filter=~Q(bookings__status='cancelled'))
+        )
+
     def get_available_slots(self, obj):
-        # Count all non-cancelled bookings against this space
-        used = obj.bookings.exclude(status='cancelled').count()
+        # Count all non-cancelled bookings against this space; use the
+        # setup_eager_loading annotation when present to avoid a query per space
+        used = getattr(obj, 'used', None)
+        if used is None:
+            used = obj.bookings.exclude(status='cancelled').count()
         return max(obj.total_slots - used, 0)
 
 
@@ -6,22 +6,156 @@ Implements "Reverse Prompting" to generate user instructions.
 
 import json
 import time
+import functools
+import gzip
+import random
+import string
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from decimal import Decimal
+from itertools import islice
+from tempfile import SpooledTemporaryFile
 from typing import Optional
+from urllib.parse import urlparse
+import orjson
 from django.conf import settings
+from django.db import transaction
 from django.utils import timezone
-from openai import OpenAI
+from openai import OpenAI, APIConnectionError, APITimeoutError, RateLimitError
 
 logger = logging.getLogger(__name__)
 
 
-class DecimalEncoder(json.JSONEncoder):
-    """Custom JSON encoder that handles Decimal types."""
-    def default(self, obj):
-        if isinstance(obj, Decimal):
-            return float(obj)
-        return super().default(obj)
+def decimal_default(obj):
+    """``default`` hook for json.dumps / orjson.dumps that serializes Decimal as float."""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(obj, option=0) -> bytes:
+    """Serialize with orjson (UTF-8 bytes, non-string keys coerced like json)."""
+    return orjson.dumps(obj, default=decimal_default, option=orjson.OPT_NON_STR_KEYS | option)
+
+
+# Exports are spooled in memory up to this size, then spill to a temp file.
+EXPORT_SPOOL_MAX_SIZE = 16 * 1024 * 1024
+EXPORT_CHUNK_SIZE = 500
+# Export files are highly repetitive JSON; level 6 is zlib's usual size/speed balance.
+EXPORT_GZIP_LEVEL = 6
+
+
+def _save_export(user, records, file_name, export_format, pretty=False):
+    """
+    Write records gzip-compressed to a spooled temp file and attach it to a new TrainingExport.
+    
+    file_name should end in .gz. Records are streamed one JSONL line at a
+    time; with pretty=True they are dumped as a single indented JSON array
+    instead. Returns (file, record_count) with the file rewound so the
+    caller can serve it.
+    """
+    from tour.models import TrainingExport
+    from django.core.files import File
+    
+    buf = SpooledTemporaryFile(max_size=EXPORT_SPOOL_MAX_SIZE, mode='w+b')
+    with gzip.GzipFile(filename=file_name.removesuffix('.gz'), fileobj=buf, mode='wb',
+                       compresslevel=EXPORT_GZIP_LEVEL) as out:
+        if pretty:
+            records = list(records)
+            out.write(_dumps(records, orjson.OPT_INDENT_2))
+            count = len(records)
+        else:
+            count = 0
+            for record in records:
+                if count:
+                    out.write(b'\n')
+                out.write(_dumps(record))
+                count += 1
+    buf.seek(0)
+    
+    export = TrainingExport.objects.create(
+        exported_by=user,
+        file_name=file_name,
+        record_count=count,
+        export_format=export_format,
+    )
+    export.file_path.save(file_name, File(buf))
+    buf.seek(0)
+    
+    return buf, count
+
+
+# Live extraction: concurrent GPT requests per process, and attempts per request
+# on rate limits / timeouts (with exponential backoff between attempts).
+MAX_PARALLEL_REQUESTS = 10
+GPT_MAX_RETRIES = 3
+
+# Columns overwritten when a bulk save re-processes an existing ProcessedItinerary
+# (GPTProcessor._extract_fields keys plus updated_at).
+PROCESSED_UPDATE_FIELDS = [
+    'generated_instruction', 'title', 'destination_country', 'destinations', 'duration_days',
+    'budget_level', 'estimated_price_usd', 'trip_type', 'group_type', 'itinerary_json',
+    'inclusions', 'exclusions', 'accommodations', 'activities', 'training_json',
+    'gpt_model_used', 'gpt_processing_time', 'gpt_tokens_used', 'status', 'updated_at',
+]
+BULK_BATCH_SIZE = 500
+
+
+@functools.lru_cache(maxsize=1024)
+def _operator_from_domain(netloc: str) -> str:
+    """Operator name guessed from a domain, e.g. www.gembeadventures.co.tz -> Gembeadventures."""
+    return netloc.removeprefix('www.').split('.')[0].title()
+
+
+@functools.lru_cache(maxsize=256)
+def _humanize(key: str) -> str:
+    """
+    snake_case enum/key -> display label, e.g. tented_camp -> Tented Camp.
+    
+    Day types, accommodation types and reasoning keys come from small fixed
+    vocabularies, so the cache turns this into a dict lookup after warm-up.
+    """
+    return key.replace('_', ' ').title()
+
+
+def _parse_template(template: str) -> tuple:
+    """
+    Pre-parse a str.format template into (literal, field_name) pairs.
+    
+    Literals come back with {{ }} escapes already resolved, so rendering is
+    just a join instead of re-scanning the whole template on every call.
+    """
+    parts = []
+    pending = []
+    for literal, field, _, _ in string.Formatter().parse(template):
+        pending.append(literal)
+        if field is not None:
+            parts.append((''.join(pending), field))
+            pending = []
+    parts.append((''.join(pending), None))
+    return tuple(parts)
+
+
+def _render_template(parts: tuple, values: dict) -> str:
+    """Fill a template pre-parsed by _parse_template (plain fields only)."""
+    out = []
+    for literal, field in parts:
+        out.append(literal)
+        if field is not None:
+            out.append(str(values[field]))
+    return ''.join(out)
+
+
+# Day types counted as activity days by serialize_itinerary (missing = 'activity').
+ACTIVITY_DAY_TYPES = frozenset({'activity', 'summit', 'hiking'})
+
+# Optional per-day detail lines in sterilized output, in order: (key, label, unit suffix).
+STERILIZE_DAY_DETAILS = (
+    ('location', 'Location', ''),
+    ('altitude_meters', 'Altitude', 'm'),
+    ('distance_km', 'Distance', 'km'),
+    ('hiking_hours', 'Hiking Time', ' hours'),
+)
 
 
 class DataSterilizer:
@@ -51,38 +185,25 @@ class DataSterilizer:
         output = []
         output.append(f"Tour: {itinerary.get('title', 'Untitled Tour')}\n")
         
-        # Calculate real duration from actual days
         days = itinerary.get('itinerary_structure', {}).get('days', [])
         if not days and 'days' in itinerary:
             days = itinerary['days']
         
-        # Count actual activity days (excluding arrival/departure if marked as such)
+        # Day counts and cost are gathered in the same pass that renders the
+        # days; the duration line is slotted in under the title afterwards.
         activity_days = 0
-        for day in days:
-            if isinstance(day, dict):
-                day_type = day.get('day_type', 'activity')
-                if day_type in ['activity', 'summit', 'hiking']:
-                    activity_days += 1
-        
-        # Get total program days (all days including travel)
-        total_days = len([d for d in days if isinstance(d, dict)])
-        
-        # Add duration info
-        duration_info = []
-        if activity_days > 0:
-            duration_info.append(f"{activity_days} days of activities")
-        if total_days > 0:
-            duration_info.append(f"{total_days} days total program")
-        if duration_info:
-            output.append("Duration: " + " | ".join(duration_info) + "\n")
-        
-        # Process each day
+        total_days = 0
         total_cost = 0
         has_pricing = False
         
         for day in days:
             if not isinstance(day, dict):
                 continue
+            
+            # Count actual activity days (excluding arrival/departure if marked as such)
+            total_days += 1
+            if day.get('day_type', 'activity') in ACTIVITY_DAY_TYPES:
+                activity_days += 1
                 
             day_num = day.get('day', '?')
             day_title = day.get('title', 'No Title')
@@ -91,12 +212,12 @@ class DataSterilizer:
             # Add day type if available
             day_type = day.get('day_type')
             if day_type and day_type != 'activity':
-                output.append(f"  Type: {day_type.replace('_', ' ').title()}")
+                output.append(f"  Type: {_humanize(day_type)}")
             
             # Add activities if available
             activities = day.get('activities', [])
             if activities and isinstance(activities, list):
-                output.append("  Activities: " + ", ".join(str(a) for a in activities if a))
+                output.append("  Activities: " + ", ".join([str(a) for a in activities if a]))
             
             # Add transport if available
             transport = day.get('transport')
@@ -105,7 +226,7 @@ class DataSterilizer:
             
             # Add accommodation if available
             acc_name = day.get('accommodation_name')
-            acc_type = day.get('accommodation_type', '').replace('_', ' ').title()
+            acc_type = _humanize(day.get('accommodation_type', ''))
             if acc_name:
                 acc_display = f"{acc_name} ({acc_type})" if acc_type else acc_name
                 output.append(f"  Accommodation: {acc_display}")
@@ -113,7 +234,7 @@ class DataSterilizer:
             # Add meals if available
             meals = day.get('meals', [])
             if meals and isinstance(meals, list):
-                output.append("  Meals: " + ", ".join(str(m) for m in meals if m))
+                output.append("  Meals: " + ", ".join([str(m) for m in meals if m]))
             
             # Anonymize and aggregate cost
             cost = day.get('cost')
@@ -127,6 +248,15 @@ class DataSterilizer:
             
             output.append("")  # Blank line between days
         
+        # Add duration info
+        duration_info = []
+        if activity_days > 0:
+            duration_info.append(f"{activity_days} days of activities")
+        if total_days > 0:
+            duration_info.append(f"{total_days} days total program")
+        if duration_info:
+            output.insert(1, "Duration: " + " | ".join(duration_info) + "\n")
+        
         # Add estimated budget range if we have pricing data
         if has_pricing:
             # Calculate budget range (±15% of total)
@@ -137,10 +267,10 @@ class DataSterilizer:
         
         # Add inclusions/exclusions if available
         if 'inclusions' in itinerary and isinstance(itinerary['inclusions'], list) and itinerary['inclusions']:
-            output.append("\nIncluded:" + "\n- " + "\n- ".join(str(i) for i in itinerary['inclusions'] if i))
+            output.append("\nIncluded:\n- " + "\n- ".join([str(i) for i in itinerary['inclusions'] if i]))
             
         if 'exclusions' in itinerary and isinstance(itinerary['exclusions'], list) and itinerary['exclusions']:
-            output.append("\nNot Included:" + "\n- " + "\n- ".join(str(e) for e in itinerary['exclusions'] if e))
+            output.append("\nNot Included:\n- " + "\n- ".join([str(e) for e in itinerary['exclusions'] if e]))
         
         return "\n".join(output)
     
@@ -148,70 +278,55 @@ class DataSterilizer:
     def sterilize_itinerary(data: dict) -> str:
         """Convert structured JSON to human-readable markdown format."""
         lines = []
+        append = lines.append
         
         # Header
         tour_identity = data.get('tour_identity', {})
-        lines.append(f"# {tour_identity.get('tour_title', 'Tour Itinerary')}")
-        lines.append("")
+        append(f"# {tour_identity.get('tour_title', 'Tour Itinerary')}")
+        append("")
         
         # Duration
         duration = data.get('duration', {})
         if duration:
             total_days = duration.get('total_program_days', duration.get('activity_days', 0))
             activity_days = duration.get('activity_days', total_days)
-            lines.append(f"**Duration:** {activity_days} days of activities in a {total_days}-day program")
-            lines.append("")
+            append(f"**Duration:** {activity_days} days of activities in a {total_days}-day program")
+            append("")
         
         # Overview
         itinerary_structure = data.get('itinerary_structure', {})
         overview = itinerary_structure.get('overview')
         if overview:
-            lines.append(f"**Overview:** {overview}")
-            lines.append("")
+            append(f"**Overview:** {overview}")
+            append("")
         
         # Route
         route_name = itinerary_structure.get('route_name')
         if route_name:
-            lines.append(f"**Route:** {route_name}")
-            lines.append("")
+            append(f"**Route:** {route_name}")
+            append("")
         
         # Day by day itinerary
         days = itinerary_structure.get('days', [])
         if days:
-            lines.append("## Day-by-Day Itinerary")
-            lines.append("")
+            append("## Day-by-Day Itinerary")
+            append("")
             
             for day in days:
                 day_num = day.get('day')
                 title = day.get('title', f'Day {day_num}')
-                day_type = day.get('day_type', 'activity')
-                
-                lines.append(f"### Day {day_num}: {title}")
                 
-                # Location
-                location = day.get('location')
-                if location:
-                    lines.append(f"**Location:** {location}")
+                append(f"### Day {day_num}: {title}")
                 
-                # Altitude
-                altitude = day.get('altitude_meters')
-                if altitude:
-                    lines.append(f"**Altitude:** {altitude}m")
-                
-                # Distance
-                distance = day.get('distance_km')
-                if distance:
-                    lines.append(f"**Distance:** {distance}km")
-                
-                # Hiking hours
-                hiking_hours = day.get('hiking_hours')
-                if hiking_hours:
-                    lines.append(f"**Hiking Time:** {hiking_hours} hours")
+                for key, label, unit in STERILIZE_DAY_DETAILS:
+                    value = day.get(key)
+                    if value:
+                        append(f"**{label}:** {value}{unit}")
                 
                 # Activities
                 activities = day.get('activities', [])
                 if activities:
-                    lines.append(f"**Activities:** {', '.join(activities)}")
+                    append(f"**Activities:** {', '.join(activities)}")
                 
                 # Accommodation
                 accommodation = day.get('accommodation_name')
@@ -220,32 +335,30 @@ class DataSterilizer:
                     acc_desc = accommodation
                     if acc_type and acc_type != 'null':
                         acc_desc += f" ({acc_type})"
-                    lines.append(f"**Accommodation:** {acc_desc}")
+                    append(f"**Accommodation:** {acc_desc}")
                 
                 # Meals
                 meals = day.get('meals', [])
                 if meals:
-                    lines.append(f"**Meals:** {', '.join(meals)}")
+                    append(f"**Meals:** {', '.join(meals)}")
                 
-                lines.append("")  # Empty line between days
+                append("")  # Empty line between days
         
         # Inclusions
         inclusions = data.get('inclusions', [])
         if inclusions:
-            lines.append("## What's Included")
-            lines.append("")
-            for item in inclusions:
-                lines.append(f"- {item}")
-            lines.append("")
+            append("## What's Included")
+            append("")
+            lines.extend([f"- {item}" for item in inclusions])
+            append("")
         
         # Exclusions
         exclusions = data.get('exclusions', [])
         if exclusions:
-            lines.append("## What's Not Included")
-            lines.append("")
-            for item in exclusions:
-                lines.append(f"- {item}")
-            lines.append("")
+            append("## What's Not Included")
+            append("")
+            lines.extend([f"- {item}" for item in exclusions])
+            append("")
         
         # Pricing
         pricing = data.get('pricing', {})
@@ -263,23 +376,22 @@ class DataSterilizer:
                 else:
                     price_tier = "Luxury"
                 
-                lines.append(f"**Price Range:** {price_tier} (${price} per person in {currency})")
+                append(f"**Price Range:** {price_tier} (${price} per person in {currency})")
                 
                 notes = pricing.get('price_notes')
                 if notes:
-                    lines.append(f"**Pricing Notes:** {notes}")
-                lines.append("")
+                    append(f"**Pricing Notes:** {notes}")
+                append("")
         
         # Operator reasoning (for internal reference)
         operator_reasoning = data.get('operator_reasoning', {})
         if operator_reasoning:
-            lines.append("## Why This Itinerary Works")
-            lines.append("")
-            for key, value in operator_reasoning.items():
-                if value:
-                    key_name = key.replace('_', ' ').title()
-                    lines.append(f"**{key_name}:** {value}")
-            lines.append("")
+            append("## Why This Itinerary Works")
+            append("")
+            lines.extend([
+                f"**{_humanize(key)}:** {value}" for key, value in operator_reasoning.items() if value
+            ])
+            append("")
         
         return '\n'.join(lines).strip()
     
@@ -310,39 +422,162 @@ class DataSterilizer:
         return training_record
 
 
-def export_sterilized_training_data(user) -> tuple[str, int, str]:
-    """Export approved training data as sterilized JSONL for LLM training."""
-    from tour.models import ProcessedItinerary, TrainingExport
-    from django.core.files.base import ContentFile
-    
-    approved = ProcessedItinerary.objects.filter(status='approved')
+def export_sterilized_training_data(user) -> tuple:
+    """
+    Export approved training data as sterilized JSONL for LLM training.
     
-    records = []
-    for item in approved:
-        if item.training_json:
-            sterilized_record = DataSterilizer.sterilize_for_training(item.training_json)
-            records.append(sterilized_record)
+    Returns (file, record_count, file_name); file is a rewound, gzip-compressed binary file object.
+    """
+    from tour.models import ProcessedItinerary
     
-    # Generate file content
-    content = '\n'.join(json.dumps(r, ensure_ascii=False, cls=DecimalEncoder) for r in records)
-    file_name = f"sterilized_training_data_{timezone.now().strftime('%Y%m%d_%H%M%S')}.jsonl"
+    approved = ProcessedItinerary.objects.filter(status='approved')
     
-    # Create export record
-    export = TrainingExport.objects.create(
-        exported_by=user,
-        file_name=file_name,
-        record_count=len(records),
-        export_format='sterilized_jsonl',
+    records = (
+        DataSterilizer.sterilize_for_training(training_json)
+        for training_json in approved.values_list('training_json', flat=True).iterator(chunk_size=EXPORT_CHUNK_SIZE)
+        if training_json
     )
-    export.file_path.save(file_name, ContentFile(content.encode('utf-8')))
     
-    return content, len(records), file_name
+    file_name = f"sterilized_training_data_{timezone.now().strftime('%Y%m%d_%H%M%S')}.jsonl.gz"
+    content, count = _save_export(user, records, file_name, 'sterilized_jsonl')
+    
+    return content, count, file_name
+
+
+def _schema_object(description=None, **properties) -> dict:
+    """Strict structured-output object: every property required, no extras."""
+    schema = {
+        "type": "object",
+        "properties": properties,
+        "required": list(properties),
+        "additionalProperties": False,
+    }
+    if description:
+        schema["description"] = description
+    return schema
+
+
+def _schema_value(type_, description=None, enum=None, nullable=False) -> dict:
+    schema = {"type": [type_, "null"] if nullable else type_}
+    if description:
+        schema["description"] = description
+    if enum:
+        schema["enum"] = list(enum) + [None] if nullable else list(enum)
+    return schema
+
+
+def _schema_list(description=None) -> dict:
+    schema = {"type": "array", "items": {"type": "string"}}
+    if description:
+        schema["description"] = description
+    return schema
+
+
+# JSON schema passed to GPT as a strict structured output. The descriptions
+# carry the per-field guidance that used to live in an example object in the
+# prompt; source_type/operator_name/url/content_type are filled in by
+# GPTProcessor._extract_fields rather than echoed back by the model.
+EXTRACTION_SCHEMA = _schema_object(
+    country=_schema_value("string", "Tanzania or Kenya or relevant country"),
+    destination=_schema_value("string", "Main destination (e.g., Zanzibar, Serengeti, Kilimanjaro)"),
+    tour_identity=_schema_object(
+        tour_title=_schema_value("string", "Exact tour title from the page"),
+        tour_category=_schema_value("string", enum=(
+            "safari", "beach", "trekking", "city_tour", "honeymoon", "adventure", "cultural", "combined",
+        )),
+        location_focus=_schema_value("string", "Main area or route (e.g., Northern Circuit, Stone Town, Lemosho Route)"),
+    ),
+    duration=_schema_object(
+        total_program_days=_schema_value("integer", "All days including arrival/departure, e.g. 9"),
+        activity_days=_schema_value("integer", "e.g. 7"),
+        activity_nights=_schema_value("integer", "e.g. 6"),
+        logistics_days=_schema_value("integer", "e.g. 2"),
+        duration_notes=_schema_value("string", "e.g. 7 days trekking plus arrival and departure days"),
+    ),
+    itinerary_structure=_schema_object(
+        overview=_schema_value("string", "Brief 1-2 sentence summary of the tour"),
+        route_name=_schema_value("string", "Route name if applicable (e.g., Lemosho Route, Northern Circuit)"),
+        days={
+            "type": "array",
+            "items": _schema_object(
+                day=_schema_value("integer"),
+                day_type=_schema_value("string", enum=("arrival", "activity", "summit", "departure", "rest")),
+                title=_schema_value("string", "Day title (e.g., Arrival in Arusha)"),
+                location=_schema_value("string", "Location name"),
+                altitude_meters=_schema_value("number", nullable=True),
+                distance_km=_schema_value("number", nullable=True),
+                hiking_hours=_schema_value("number", nullable=True),
+                activities=_schema_list(),
+                accommodation_name=_schema_value("string", "Hotel/Lodge/Camp name", nullable=True),
+                accommodation_type=_schema_value(
+                    "string", enum=("hotel", "lodge", "tented_camp", "camping"), nullable=True
+                ),
+                meals=_schema_list("e.g. Breakfast, Lunch, Dinner"),
+            ),
+        },
+    ),
+    inclusions=_schema_list("e.g. Park fees, Accommodation, Meals as specified, Professional guide, Transport"),
+    exclusions=_schema_list("e.g. International flights, Visa fees, Travel insurance, Tips and gratuities"),
+    pricing=_schema_object(
+        price_displayed=_schema_value("boolean"),
+        price_per_person_usd=_schema_value("number", "e.g. 3500", nullable=True),
+        currency=_schema_value("string", "e.g. USD", nullable=True),
+        price_includes_flights=_schema_value("boolean"),
+        group_size_affects_price=_schema_value("boolean"),
+        season_affects_price=_schema_value("boolean"),
+        price_notes=_schema_value("string", "e.g. Price varies by group size and season"),
+    ),
+    user_flexibility=_schema_object(
+        dates_flexible=_schema_value("boolean"),
+        accommodation_preferences_accepted=_schema_value("boolean"),
+        can_request_modifications=_schema_value("boolean"),
+    ),
+    operator_constraints=_schema_object(
+        route_fixed=_schema_value("boolean"),
+        safety_critical_elements=_schema_list("e.g. Acclimatization schedule, Guide ratio"),
+        minimum_group_size=_schema_value("integer", nullable=True),
+        maximum_group_size=_schema_value("integer", nullable=True),
+    ),
+    operator_reasoning=_schema_object(
+        route_selection=_schema_value(
+            "string", "Why this route was chosen (e.g., Lemosho chosen for better acclimatization and scenic variety)"
+        ),
+        duration_reasoning=_schema_value(
+            "string", "Why this duration (e.g., 7 trek days increases summit success rate to 90%)"
+        ),
+        difficulty_assessment=_schema_value(
+            "string", "Who this is suitable for (e.g., Suitable for average fitness with prior preparation)"
+        ),
+        value_proposition=_schema_value(
+            "string", "Why this itinerary is good value (e.g., Includes pre/post accommodation unlike budget options)"
+        ),
+    ),
+    derived_user_questions=_schema_list(
+        "Three questions: one that logically leads to THIS specific itinerary, one about preferences "
+        "that match this route/tour, one with constraints that this itinerary satisfies"
+    ),
+    user_intent=_schema_object(
+        primary_goal=_schema_value("string", enum=(
+            "climb_kilimanjaro", "safari", "beach_holiday", "cultural_tour", "honeymoon", "adventure",
+        )),
+        fitness_level=_schema_value("string", enum=("unknown", "beginner", "average", "athletic", "professional")),
+        time_available=_schema_value("string", "about X days or flexible"),
+        preferences=_schema_list("e.g. scenic, good acclimatization, wildlife, relaxation"),
+        constraints=_schema_list("e.g. budget, time, fitness, none specified"),
+    ),
+    data_quality_tags=_schema_object(
+        structured=_schema_value("boolean"),
+        marketing_language=_schema_value("string", enum=("low", "medium", "high")),
+        operational_detail_level=_schema_value("string", enum=("low", "medium", "high")),
+        source_reliability=_schema_value("string", "e.g. high"),
+    ),
+)
 
 
 class GPTProcessor:
     """Processes raw itinerary text using GPT to extract structured data."""
     
-    EXTRACTION_PROMPT = """You are an expert travel data analyst creating AI training data. Extract structured tour data from this raw itinerary.
+    EXTRACTION_PROMPT = """You are an expert travel data analyst creating AI training data. Extract structured tour data from this raw itinerary into the extracted_itinerary schema.
 
 SOURCE URL: {source_url}
 OPERATOR NAME: {operator_name}
@@ -352,105 +587,6 @@ RAW ITINERARY TEXT:
 
 ---
 
-Extract and return a JSON object with this EXACT structure:
-
-{{
-    "source_type": "operator_website",
-    "operator_name": "{operator_name}",
-    "country": "Tanzania or Kenya or relevant country",
-    "destination": "Main destination (e.g., Zanzibar, Serengeti, Kilimanjaro)",
-    "url": "{source_url}",
-    "content_type": "published_itinerary",
-
-    "tour_identity": {{
-        "tour_title": "Exact tour title from the page",
-        "tour_category": "safari|beach|trekking|city_tour|honeymoon|adventure|cultural|combined",
-        "location_focus": "Main area or route (e.g., Northern Circuit, Stone Town, Lemosho Route)"
-    }},
-
-    "duration": {{
-        "total_program_days": 9,
-        "activity_days": 7,
-        "activity_nights": 6,
-        "logistics_days": 2,
-        "duration_notes": "7 days trekking plus arrival and departure days"
-    }},
-
-    "itinerary_structure": {{
-        "overview": "Brief 1-2 sentence summary of the tour",
-        "route_name": "Route name if applicable (e.g., Lemosho Route, Northern Circuit)",
-        "days": [
-            {{
-                "day": 1,
-                "day_type": "arrival|activity|summit|departure|rest",
-                "title": "Day title (e.g., Arrival in Arusha)",
-                "location": "Location name",
-                "altitude_meters": null,
-                "distance_km": null,
-                "hiking_hours": null,
-                "activities": ["Activity 1", "Activity 2", "Activity 3"],
-                "accommodation_name": "Hotel/Lodge/Camp name or null",
-                "accommodation_type": "hotel|lodge|tented_camp|camping|null",
-                "meals": ["Breakfast", "Lunch", "Dinner"]
-            }}
-        ]
-    }},
-
-    "inclusions": ["Park fees", "Accommodation", "Meals as specified", "Professional guide", "Transport"],
-    "exclusions": ["International flights", "Visa fees", "Travel insurance", "Tips and gratuities"],
-
-    "pricing": {{
-        "price_displayed": true,
-        "price_per_person_usd": 3500,
-        "currency": "USD",
-        "price_includes_flights": false,
-        "group_size_affects_price": true,
-        "season_affects_price": true,
-        "price_notes": "Price varies by group size and season"
-    }},
-
-    "user_flexibility": {{
-        "dates_flexible": true,
-        "accommodation_preferences_accepted": true,
-        "can_request_modifications": true
-    }},
-
-    "operator_constraints": {{
-        "route_fixed": false,
-        "safety_critical_elements": ["Acclimatization schedule", "Guide ratio"],
-        "minimum_group_size": 1,
-        "maximum_group_size": null
-    }},
-
-    "operator_reasoning": {{
-        "route_selection": "Why this route was chosen (e.g., Lemosho chosen for better acclimatization and scenic variety)",
-        "duration_reasoning": "Why this duration (e.g., 7 trek days increases summit success rate to 90%)",
-        "difficulty_assessment": "Who this is suitable for (e.g., Suitable for average fitness with prior preparation)",
-        "value_proposition": "Why this itinerary is good value (e.g., Includes pre/post accommodation unlike budget options)"
-    }},
-
-    "derived_user_questions": [
-        "Question that logically leads to THIS specific itinerary",
-        "Question about preferences that match this route/tour",
-        "Question with constraints that this itinerary satisfies"
-    ],
-
-    "user_intent": {{
-        "primary_goal": "climb_kilimanjaro|safari|beach_holiday|cultural_tour|honeymoon|adventure",
-        "fitness_level": "unknown|beginner|average|athletic|professional",
-        "time_available": "about X days or flexible",
-        "preferences": ["scenic", "good acclimatization", "wildlife", "relaxation"],
-        "constraints": ["budget", "time", "fitness", "none specified"]
-    }},
-
-    "data_quality_tags": {{
-        "structured": true,
-        "marketing_language": "low|medium|high",
-        "operational_detail_level": "low|medium|high",
-        "source_reliability": "high"
-    }}
-}}
-
 CRITICAL RULES:
 
 1. DURATION: Count ALL days including arrival/departure. Label each day with day_type.
@@ -472,261 +608,526 @@ CRITICAL RULES:
 
 5. USER INTENT should be what a typical customer would express BEFORE seeing this itinerary
 
-6. PRICING: Look for $, USD, per person, pp, pax. If not found, set price_displayed: false
-
-Return ONLY valid JSON, no other text."""
+6. PRICING: Look for $, USD, per person, pp, pax. If not found, set price_displayed: false"""
+    _EXTRACTION_PROMPT_PARTS = _parse_template(EXTRACTION_PROMPT)
 
     def __init__(self):
-        self.client = OpenAI(api_key=settings.OPENAI_API_KEY)
+        # _call_gpt does its own backoff; SDK retries on top would multiply requests
+        self.client = OpenAI(api_key=settings.OPENAI_API_KEY, max_retries=0)
         self.model = "gpt-4o"
     
-    def process_raw_itinerary(self, raw_itinerary, force_reprocess=False) -> Optional['ProcessedItinerary']:
+    # Used for both live calls and Batch API request lines.
+    SYSTEM_PROMPT = "You are a travel data extraction expert. Always return valid JSON."
+    
+    def _operator_name(self, raw_itinerary) -> str:
         """
-        Process a RawItinerary and create/update a ProcessedItinerary.
+        Operator name from the scraping source, else derived from the URL domain.
         
-        Args:
-            raw_itinerary: The RawItinerary to process
-            force_reprocess: If True, reprocess even if already processed
+        Callers handling many itineraries should select_related('source').
+        """
+        if raw_itinerary.source_id:
+            return raw_itinerary.source.name
+        if raw_itinerary.source_url:
+            # Cached per domain: every page from one operator shares it
+            return _operator_from_domain(urlparse(raw_itinerary.source_url).netloc)
+        return "Unknown Operator"
+    
+    def _build_request(self, raw_itinerary) -> dict:
+        """Chat completion arguments for extracting one RawItinerary."""
+        prompt = _render_template(self._EXTRACTION_PROMPT_PARTS, {
+            'raw_text': raw_itinerary.raw_text[:15000],
+            'source_url': raw_itinerary.source_url or "",
+            'operator_name': self._operator_name(raw_itinerary),
+        })
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": self.SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": 0.3,
+            "response_format": {
+                "type": "json_schema",
+                "json_schema": {"name": "extracted_itinerary", "strict": True, "schema": EXTRACTION_SCHEMA},
+            },
+        }
+    
+    def _extract_fields(self, raw_itinerary, result_text, processing_time=None, tokens_used=None) -> dict:
+        """
+        Parse a GPT extraction response into ProcessedItinerary field values.
         
-        Returns the ProcessedItinerary if successful, None if failed.
+        Raises json.JSONDecodeError if the response is not valid JSON.
+        """
+        # Constant/source fields aren't part of EXTRACTION_SCHEMA; anything the
+        # response does carry for them (older prompt format) wins.
+        data = {
+            "source_type": "operator_website",
+            "operator_name": self._operator_name(raw_itinerary),
+            "url": raw_itinerary.source_url or "",
+            "content_type": "published_itinerary",
+            **orjson.loads(result_text),
+        }
+        
+        # Extract from new nested structure
+        tour_identity = data.get('tour_identity', {})
+        duration = data.get('duration', {})
+        itinerary_structure = data.get('itinerary_structure', {})
+        pricing = data.get('pricing', {})
+        
+        # Extract accommodations from days
+        accommodations = []
+        activities = {}  # insertion-ordered set: dedupes while keeping day order
+        for day in itinerary_structure.get('days', []):
+            accommodation_name = day.get('accommodation_name')
+            if accommodation_name:
+                accommodations.append({
+                    'name': accommodation_name,
+                    'type': day.get('accommodation_type'),
+                    'location': day.get('location')
+                })
+            activities.update(dict.fromkeys(day.get('activities') or ()))
+        activities = list(activities)
+        
+        # Get first question from derived_user_questions for backward compatibility
+        derived_questions = data.get('derived_user_questions', [])
+        first_question = derived_questions[0] if derived_questions else ''
+        
+        # Get duration - prefer activity_days, fallback to total
+        duration_days = duration.get('activity_days') or duration.get('total_program_days')
+        
+        return {
+            'generated_instruction': first_question,
+            'title': tour_identity.get('tour_title', raw_itinerary.page_title or 'Untitled'),
+            'destination_country': data.get('country', ''),
+            'destinations': [data.get('destination', '')] if data.get('destination') else [],
+            'duration_days': duration_days,
+            'budget_level': 'mid_range',  # Default, can be inferred from price
+            'estimated_price_usd': pricing.get('price_per_person_usd'),
+            'trip_type': tour_identity.get('tour_category', ''),
+            'group_type': 'Group' if data.get('assumptions_and_flexibility', {}).get('group_tour_available') else 'Private',
+            'itinerary_json': itinerary_structure,
+            'inclusions': data.get('inclusions', []),
+            'exclusions': data.get('exclusions', []),
+            'accommodations': accommodations,
+            'activities': activities,
+            'training_json': data,  # Store the FULL structured data
+            'gpt_model_used': self.model,
+            'gpt_processing_time': processing_time,
+            'gpt_tokens_used': tokens_used,
+            'status': 'pending_review',  # Reset status for re-review
+        }
+    
+    def _save_extraction(self, raw_itinerary, result_text, processing_time=None, tokens_used=None):
+        """
+        Parse a GPT extraction response and create/update the ProcessedItinerary.
+        
+        Raises json.JSONDecodeError if the response is not valid JSON.
         """
         from tour.models import ProcessedItinerary
         
-        if raw_itinerary.is_processed and not force_reprocess:
-            logger.warning(f"RawItinerary {raw_itinerary.id} already processed. Use force_reprocess=True to reprocess.")
-            return None
+        # Create or update ProcessedItinerary
+        processed, created = ProcessedItinerary.objects.update_or_create(
+            raw_itinerary=raw_itinerary,
+            defaults=self._extract_fields(raw_itinerary, result_text, processing_time, tokens_used)
+        )
+        
+        action = "Created" if created else "Updated"
+        logger.info(f"{action} ProcessedItinerary {processed.id}")
+        
+        # Mark raw as processed
+        raw_itinerary.is_processed = True
+        raw_itinerary.save()
+        
+        logger.info(f"Successfully processed RawItinerary {raw_itinerary.id} -> ProcessedItinerary {processed.id}")
+        return processed
+    
+    def _mark_error(self, raw_itinerary, error_msg):
+        logger.error(f"Failed to process RawItinerary {raw_itinerary.id}: {error_msg}")
+        raw_itinerary.processing_error = error_msg
+    
+    def _record_error(self, raw_itinerary, error_msg):
+        self._mark_error(raw_itinerary, error_msg)
+        raw_itinerary.save()
+    
+    def _collect_result(self, results, raw_itinerary, result_text, processing_time=None, tokens_used=None) -> bool:
+        """
+        Parse one response into an unsaved ProcessedItinerary for _save_results.
+        
+        results is a (processed, failed) pair of lists; the result is appended
+        to one of them. Returns True if the response parsed.
+        """
+        from tour.models import ProcessedItinerary
         
+        processed, failed = results
         try:
+            fields = self._extract_fields(raw_itinerary, result_text, processing_time, tokens_used)
+        except json.JSONDecodeError as e:
+            self._mark_error(raw_itinerary, f"JSON parsing error: {str(e)}")
+            failed.append(raw_itinerary)
+            return False
+        except Exception as e:
+            # Unexpected response shape; record it rather than lose the rest of the batch
+            self._mark_error(raw_itinerary, str(e))
+            failed.append(raw_itinerary)
+            return False
+        
+        raw_itinerary.is_processed = True
+        processed.append(ProcessedItinerary(raw_itinerary=raw_itinerary, **fields))
+        return True
+    
+    def _save_results(self, results):
+        """Write the (processed, failed) lists from _collect_result in a few bulk queries."""
+        from tour.models import ProcessedItinerary, RawItinerary
+        
+        processed, failed = results
+        with transaction.atomic():
+            if processed:
+                ProcessedItinerary.objects.bulk_create(
+                    processed,
+                    batch_size=BULK_BATCH_SIZE,
+                    update_conflicts=True,
+                    unique_fields=['raw_itinerary'],
+                    update_fields=PROCESSED_UPDATE_FIELDS,
+                )
+                RawItinerary.objects.bulk_update(
+                    [item.raw_itinerary for item in processed], ['is_processed'], batch_size=BULK_BATCH_SIZE
+                )
+            if failed:
+                RawItinerary.objects.bulk_update(failed, ['processing_error'], batch_size=BULK_BATCH_SIZE)
+        
+        logger.info(f"Saved {len(processed)} processed itineraries, {len(failed)} failures")
+    
+    def _call_gpt(self, raw_itinerary) -> tuple:
+        """
+        Run the extraction request for one RawItinerary. Safe to call from worker threads.
+        
+        Rate limits, timeouts and connection errors are retried with exponential
+        backoff; the last error is re-raised.
+        Returns (raw_itinerary, response_text, processing_time, tokens_used).
+        """
+        request = self._build_request(raw_itinerary)
+        for attempt in range(GPT_MAX_RETRIES):
             start_time = time.time()
-            
-            # Get operator name from scraping source if available
-            operator_name = "Unknown Operator"
-            source_url = raw_itinerary.source_url or ""
-            if hasattr(raw_itinerary, 'scrape_queue') and raw_itinerary.scrape_queue:
-                operator_name = raw_itinerary.scrape_queue.source.name
-            elif raw_itinerary.source_url:
-                # Extract from URL domain
-                from urllib.parse import urlparse
-                domain = urlparse(raw_itinerary.source_url).netloc
-                operator_name = domain.replace('www.', '').replace('.com', '').replace('.co.tz', '').title()
-            
-            # Call GPT
-            prompt = self.EXTRACTION_PROMPT.format(
-                raw_text=raw_itinerary.raw_text[:15000],
-                source_url=source_url,
-                operator_name=operator_name
-            )
-            
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are a travel data extraction expert. Always return valid JSON."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.3,
-                response_format={"type": "json_object"}
-            )
+            try:
+                response = self.client.chat.completions.create(**request)
+            except (RateLimitError, APITimeoutError, APIConnectionError) as e:
+                if attempt == GPT_MAX_RETRIES - 1:
+                    raise
+                delay = 2 ** attempt + random.random()
+                logger.warning(f"GPT request for RawItinerary {raw_itinerary.id} failed ({e}), retrying in {delay:.1f}s")
+                time.sleep(delay)
+                continue
             
             processing_time = time.time() - start_time
             tokens_used = response.usage.total_tokens if response.usage else None
-            
-            # Parse response
-            result_text = response.choices[0].message.content
-            data = json.loads(result_text)
-            
-            # Extract from new nested structure
-            tour_identity = data.get('tour_identity', {})
-            duration = data.get('duration', {})
-            itinerary_structure = data.get('itinerary_structure', {})
-            pricing = data.get('pricing', {})
-            
-            # Extract accommodations from days
-            accommodations = []
-            activities = []
-            for day in itinerary_structure.get('days', []):
-                if day.get('accommodation_name'):
-                    accommodations.append({
-                        'name': day.get('accommodation_name'),
-                        'type': day.get('accommodation_type'),
-                        'location': day.get('location')
-                    })
-                activities.extend(day.get('activities', []))
-            
-            # Remove duplicate activities
-            activities = list(set(activities))
-            
-            # Get first question from derived_user_questions for backward compatibility
-            derived_questions = data.get('derived_user_questions', [])
-            first_question = derived_questions[0] if derived_questions else ''
-            
-            # Get duration - prefer activity_days, fallback to total
-            duration_days = duration.get('activity_days') or duration.get('total_program_days')
-            
-            # Create or update ProcessedItinerary
-            processed, created = ProcessedItinerary.objects.update_or_create(
-                raw_itinerary=raw_itinerary,
-                defaults={
-                    'generated_instruction': first_question,
-                    'title': tour_identity.get('tour_title', raw_itinerary.page_title or 'Untitled'),
-                    'destination_country': data.get('country', ''),
-                    'destinations': [data.get('destination', '')] if data.get('destination') else [],
-                    'duration_days': duration_days,
-                    'budget_level': 'mid_range',  # Default, can be inferred from price
-                    'estimated_price_usd': pricing.get('price_per_person_usd'),
-                    'trip_type': tour_identity.get('tour_category', ''),
-                    'group_type': 'Group' if data.get('assumptions_and_flexibility', {}).get('group_tour_available') else 'Private',
-                    'itinerary_json': itinerary_structure,
-                    'inclusions': data.get('inclusions', []),
-                    'exclusions': data.get('exclusions', []),
-                    'accommodations': accommodations,
-                    'activities': activities,
-                    'training_json': data,  # Store the FULL structured data
-                    'gpt_model_used': self.model,
-                    'gpt_processing_time': processing_time,
-                    'gpt_tokens_used': tokens_used,
-                    'status': 'pending_review',  # Reset status for re-review
-                }
-            )
-            
-            action = "Created" if created else "Updated"
-            logger.info(f"{action} ProcessedItinerary {processed.id}")
-            
-            # Mark raw as processed
-            raw_itinerary.is_processed = True
-            raw_itinerary.save()
-            
-            logger.info(f"Successfully processed RawItinerary {raw_itinerary.id} -> ProcessedItinerary {processed.id}")
-            return processed
+            return raw_itinerary, response.choices[0].message.content, processing_time, tokens_used
+    
+    def _persist(self, raw_itinerary, result_text, processing_time, tokens_used) -> Optional['ProcessedItinerary']:
+        """Save a GPT response, recording any failure on the RawItinerary. Returns None if failed."""
+        try:
+            return self._save_extraction(raw_itinerary, result_text, processing_time, tokens_used)
             
         except json.JSONDecodeError as e:
-            error_msg = f"JSON parsing error: {str(e)}"
-            logger.error(f"Failed to process RawItinerary {raw_itinerary.id}: {error_msg}")
-            raw_itinerary.processing_error = error_msg
-            raw_itinerary.save()
+            self._record_error(raw_itinerary, f"JSON parsing error: {str(e)}")
             return None
             
         except Exception as e:
-            error_msg = str(e)
-            logger.error(f"Failed to process RawItinerary {raw_itinerary.id}: {error_msg}")
-            raw_itinerary.processing_error = error_msg
-            raw_itinerary.save()
+            self._record_error(raw_itinerary, str(e))
             return None
     
+    def process_raw_itinerary(self, raw_itinerary, force_reprocess=False) -> Optional['ProcessedItinerary']:
+        """
+        Process a RawItinerary and create/update a ProcessedItinerary.
+        
+        Args:
+            raw_itinerary: The RawItinerary to process
+            force_reprocess: If True, reprocess even if already processed
+        
+        Returns the ProcessedItinerary if successful, None if failed.
+        """
+        if raw_itinerary.is_processed and not force_reprocess:
+            logger.warning(f"RawItinerary {raw_itinerary.id} already processed. Use force_reprocess=True to reprocess.")
+            return None
+        
+        try:
+            result = self._call_gpt(raw_itinerary)
+        except Exception as e:
+            self._record_error(raw_itinerary, str(e))
+            return None
+        
+        return self._persist(*result)
+    
+    def submit_batch(self, pending_qs, user=None) -> Optional['BatchJob']:
+        """
+        Submit RawItineraries to the OpenAI Batch API (24h window, half price).
+        
+        Itineraries already waiting in an unfinished batch are skipped.
+        Returns the BatchJob, or None if there was nothing to submit.
+        """
+        from tour.models import BatchJob
+        
+        raws = list(
+            pending_qs.exclude(batch_jobs__status__in=BatchJob.ACTIVE_STATUSES)
+            .select_related('source').defer('raw_html').distinct()
+        )
+        if not raws:
+            return None
+        
+        lines = [
+            _dumps({
+                "custom_id": str(raw.id),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self._build_request(raw),
+            })
+            for raw in raws
+        ]
+        input_file = self.client.files.create(
+            file=(f"itinerary_batch_{timezone.now().strftime('%Y%m%d_%H%M%S')}.jsonl", b'\n'.join(lines)),
+            purpose='batch',
+        )
+        batch = self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint='/v1/chat/completions',
+            completion_window='24h',
+        )
+        
+        job = BatchJob.objects.create(
+            batch_id=batch.id,
+            input_file_id=input_file.id,
+            status=batch.status,
+            gpt_model=self.model,
+            request_count=len(raws),
+            submitted_by=user,
+        )
+        job.raw_itineraries.set(raws)
+        
+        logger.info(f"Submitted batch {batch.id} with {len(raws)} raw itineraries")
+        return job
+    
+    def ingest_batch_results(self, batch_id: str) -> dict:
+        """
+        Refresh a BatchJob from OpenAI and, once completed, save its results.
+        
+        Returns stats dict with counts; 'status' is the batch status from OpenAI.
+        """
+        from tour.models import BatchJob
+        
+        job = BatchJob.objects.get(batch_id=batch_id)
+        stats = {
+            'status': job.status,
+            'processed': 0,
+            'succeeded': 0,
+            'failed': 0,
+        }
+        if job.ingested_at:
+            logger.warning(f"Batch {batch_id} already ingested")
+            return stats
+        
+        batch = self.client.batches.retrieve(batch_id)
+        job.status = stats['status'] = batch.status
+        job.output_file_id = batch.output_file_id or ''
+        job.error_file_id = batch.error_file_id or ''
+        if batch.status not in BatchJob.FINAL_STATUSES:
+            job.save()
+            return stats
+        
+        raws = job.raw_itineraries.defer('raw_html').in_bulk()
+        results = ([], [])
+        for file_id in (job.output_file_id, job.error_file_id):
+            if not file_id:
+                continue
+            for line in self.client.files.content(file_id).content.splitlines():
+                if not line.strip():
+                    continue
+                try:
+                    result = orjson.loads(line)
+                    raw = raws.pop(int(result['custom_id']), None)
+                except Exception as e:
+                    logger.error(f"Skipping unreadable line in batch {batch_id}: {e}")
+                    continue
+                # Already processed live since submission: keep that result
+                if raw is None or raw.is_processed:
+                    continue
+                
+                stats['processed'] += 1
+                try:
+                    response = result.get('response') or {}
+                    body = response.get('body') or {}
+                    if result.get('error') or response.get('status_code') != 200:
+                        error = result.get('error') or body.get('error') or {}
+                        self._mark_error(raw, f"Batch request failed: {error.get('message', 'unknown error')}")
+                        results[1].append(raw)
+                        ok = False
+                    else:
+                        ok = self._collect_result(
+                            results,
+                            raw,
+                            body['choices'][0]['message']['content'],
+                            tokens_used=(body.get('usage') or {}).get('total_tokens'),
+                        )
+                except Exception as e:
+                    self._mark_error(raw, str(e))
+                    results[1].append(raw)
+                    ok = False
+                if ok:
+                    stats['succeeded'] += 1
+                else:
+                    stats['failed'] += 1
+        
+        self._save_results(results)
+        
+        # Anything the batch never answered (expired/cancelled) is left pending
+        # so it can be resubmitted or processed live.
+        job.succeeded = stats['succeeded']
+        job.failed = stats['failed']
+        job.ingested_at = timezone.now()
+        job.save()
+        
+        return stats
+    
     def process_pending_raw_itineraries(self, max_items: int = 5) -> dict:
         """
         Process pending raw itineraries.
         
+        GPT requests run concurrently (up to MAX_PARALLEL_REQUESTS); responses
+        are parsed on the calling thread as they complete and saved together
+        in bulk at the end.
         Returns stats dict with counts.
         """
-        from tour.models import RawItinerary
+        from tour.models import BatchJob, RawItinerary
         
-        pending = RawItinerary.objects.filter(
+        # Items waiting in an active batch are left for ingest_batch_results
+        pending = list(RawItinerary.objects.filter(
             is_processed=False,
             processing_error=''
-        )[:max_items]
+        ).exclude(
+            batch_jobs__status__in=BatchJob.ACTIVE_STATUSES
+        ).select_related('source').defer('raw_html')[:max_items])
         
         stats = {
             'processed': 0,
             'succeeded': 0,
             'failed': 0,
         }
+        if not pending:
+            return stats
         
-        for raw in pending:
-            stats['processed'] += 1
-            result = self.process_raw_itinerary(raw)
-            if result:
-                stats['succeeded'] += 1
-            else:
-                stats['failed'] += 1
+        results = ([], [])
+        with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_REQUESTS, len(pending))) as executor:
+            futures = {executor.submit(self._call_gpt, raw): raw for raw in pending}
+            for future in as_completed(futures):
+                stats['processed'] += 1
+                try:
+                    ok = self._collect_result(results, *future.result())
+                except Exception as e:
+                    self._mark_error(futures[future], str(e))
+                    results[1].append(futures[future])
+                    ok = False
+                if ok:
+                    stats['succeeded'] += 1
+                else:
+                    stats['failed'] += 1
+        
+        self._save_results(results)
         
         return stats
 
 
+# Columns read by _legacy_training_record; everything else stays in the database.
+LEGACY_EXPORT_FIELDS = (
+    'title', 'destination_country', 'destinations', 'raw_itinerary', 'raw_itinerary__source_url',
+    'inclusions', 'exclusions', 'estimated_price_usd', 'group_type', 'generated_instruction',
+    'itinerary_json', 'trip_type', 'duration_days',
+)
+
+
+def _legacy_training_record(item, training_data: dict) -> dict:
+    """Build a training record from ProcessedItinerary fields (pre-tour_identity format)."""
+    return {
+        "source_type": "operator_website",
+        "operator_name": training_data.get('operator_name', 'Unknown'),
+        "country": item.destination_country,
+        "destination": item.destinations[0] if item.destinations else item.destination_country,
+        "url": item.raw_itinerary.source_url if item.raw_itinerary else "",
+        "content_type": "published_itinerary",
+        
+        "tour_identity": {
+            "tour_title": item.title,
+            "tour_category": item.trip_type,
+            "duration_days": item.duration_days,
+            "duration_nights": (item.duration_days - 1) if item.duration_days else None,
+            "location_focus": item.destinations[0] if item.destinations else ""
+        },
+        
+        "itinerary_structure": item.itinerary_json or {
+            "overview": "",
+            "days": []
+        },
+        
+        "inclusions": item.inclusions or [],
+        "exclusions": item.exclusions or [],
+        
+        "pricing": {
+            "price_displayed": item.estimated_price_usd is not None,
+            "price_per_person_usd": item.estimated_price_usd,
+            "currency": "USD" if item.estimated_price_usd else None,
+            "price_notes": ""
+        },
+        
+        "assumptions_and_flexibility": {
+            "dates_flexible": True,
+            "accommodation_changeable": True,
+            "activities_changeable": True,
+            "private_tour": item.group_type == 'Private'
+        },
+        
+        "realistic_customer_question": item.generated_instruction,
+        
+        "data_quality_tags": {
+            "structured": True,
+            "marketing_language": "medium",
+            "operational_detail_level": "medium",
+            "source_reliability": "high"
+        }
+    }
+
+
 def export_approved_training_data(user, format='jsonl') -> tuple:
     """
     Export all approved ProcessedItineraries in the structured training format.
     
-    Returns (file_content, record_count, file_name)
+    Returns (file, record_count, file_name); file is a rewound, gzip-compressed binary file object.
     """
-    from tour.models import ProcessedItinerary, TrainingExport
-    from django.core.files.base import ContentFile
+    from tour.models import ProcessedItinerary
     
     approved = ProcessedItinerary.objects.filter(status='approved')
     
-    records = []
-    for item in approved:
-        # Use the full training_json which contains the structured data
-        training_data = item.training_json or {}
-        
-        # If we have the new format, use it directly
-        if 'tour_identity' in training_data:
-            records.append(training_data)
-        else:
-            # Build from ProcessedItinerary fields (legacy support)
-            training_record = {
-                "source_type": "operator_website",
-                "operator_name": training_data.get('operator_name', 'Unknown'),
-                "country": item.destination_country,
-                "destination": item.destinations[0] if item.destinations else item.destination_country,
-                "url": item.raw_itinerary.source_url if item.raw_itinerary else "",
-                "content_type": "published_itinerary",
-                
-                "tour_identity": {
-                    "tour_title": item.title,
-                    "tour_category": item.trip_type,
-                    "duration_days": item.duration_days,
-                    "duration_nights": (item.duration_days - 1) if item.duration_days else None,
-                    "location_focus": item.destinations[0] if item.destinations else ""
-                },
-                
-                "itinerary_structure": item.itinerary_json or {
-                    "overview": "",
-                    "days": []
-                },
-                
-                "inclusions": item.inclusions or [],
-                "exclusions": item.exclusions or [],
-                
-                "pricing": {
-                    "price_displayed": item.estimated_price_usd is not None,
-                    "price_per_person_usd": item.estimated_price_usd,
-                    "currency": "USD" if item.estimated_price_usd else None,
-                    "price_notes": ""
-                },
-                
-                "assumptions_and_flexibility": {
-                    "dates_flexible": True,
-                    "accommodation_changeable": True,
-                    "activities_changeable": True,
-                    "private_tour": item.group_type == 'Private'
-                },
-                
-                "realistic_customer_question": item.generated_instruction,
-                
-                "data_quality_tags": {
-                    "structured": True,
-                    "marketing_language": "medium",
-                    "operational_detail_level": "medium",
-                    "source_reliability": "high"
-                }
-            }
-            records.append(training_record)
-    
-    # Generate file content
-    if format == 'jsonl':
-        content = '\n'.join(json.dumps(r, ensure_ascii=False, cls=DecimalEncoder) for r in records)
-        file_name = f"training_data_{timezone.now().strftime('%Y%m%d_%H%M%S')}.jsonl"
-    else:
-        content = json.dumps(records, indent=2, ensure_ascii=False, cls=DecimalEncoder)
-        file_name = f"training_data_{timezone.now().strftime('%Y%m%d_%H%M%S')}.json"
+    def records():
+        # Most rows are already in the new format and only need training_json;
+        # legacy rows are fetched per chunk with just the columns they use.
+        rows = approved.values_list('id', 'training_json').iterator(chunk_size=EXPORT_CHUNK_SIZE)
+        while chunk := list(islice(rows, EXPORT_CHUNK_SIZE)):
+            legacy_ids = [pk for pk, training_data in chunk if 'tour_identity' not in (training_data or {})]
+            legacy = {}
+            if legacy_ids:
+                legacy = (
+                    ProcessedItinerary.objects
+                    .select_related('raw_itinerary')
+                    .only(*LEGACY_EXPORT_FIELDS)
+                    .in_bulk(legacy_ids)
+                )
+            
+            for pk, training_data in chunk:
+                training_data = training_data or {}
+                # If we have the new format, use it directly
+                if 'tour_identity' in training_data:
+                    yield training_data
+                else:
+                    yield _legacy_training_record(legacy[pk], training_data)
     
-    # Create export record
-    export = TrainingExport.objects.create(
-        exported_by=user,
-        file_name=file_name,
-        record_count=len(records),
-        export_format=format,
-    )
-    export.file_path.save(file_name, ContentFile(content.encode('utf-8')))
+    extension = 'jsonl' if format == 'jsonl' else 'json'
+    file_name = f"training_data_{timezone.now().strftime('%Y%m%d_%H%M%S')}.{extension}.gz"
+    content, count = _save_export(user, records(), file_name, format, pretty=format != 'jsonl')
     
-    return content, len(records), file_name
+    return content, count, file_name
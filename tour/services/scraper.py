@@ -5,34 +5,224 @@ The "Collector Robot" - visits tour operator websites and extracts itinerary dat
 
 import time
 import re
+import hashlib
 import logging
+import socket
+import threading
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from importlib.util import find_spec
+from itertools import islice
 from urllib.parse import urlparse
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NameResolutionError, NewConnectionError
+from urllib3.util.connection import allowed_gai_family
+import soupsieve
 from bs4 import BeautifulSoup
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
 from django.utils import timezone
 
 logger = logging.getLogger(__name__)
 
+# Queue items on different domains are fetched in parallel, up to this many
+# domains at once; items on the same domain stay sequential and rate limited.
+MAX_PARALLEL_DOMAINS = 8
+
+# Text and metadata of successful scrape_url results are cached per URL for
+# SCRAPE_CACHE_TTL seconds (settings override), so callers that don't need the
+# HTML don't refetch.
+DEFAULT_SCRAPE_CACHE_TTL = 3600
+
+# Pages are streamed and abandoned past this size; we only keep ~12KB of text.
+MAX_PAGE_BYTES = 2_000_000
+
+# Hosts whose keep-alive connections the session keeps open (requests keeps 10).
+POOL_HOSTS = 50
+
+# Rows per INSERT/UPDATE when saving a queue run's results
+BULK_BATCH_SIZE = 100
+
+# Resolved addresses are reused for this long, so a run over many pages on
+# the same operators doesn't repeat getaddrinfo for every new connection.
+DNS_CACHE_TTL = 300
+DNS_CACHE_SIZE = 512
+
+# lxml parses far faster than the pure-Python html.parser; use it when installed.
+HTML_PARSER = 'lxml' if find_spec('lxml') else 'html.parser'
+
+# Common price-related class/id patterns, combined into one selector so the
+# page is walked once, and compiled once instead of per page
+PRICE_SELECTOR = soupsieve.compile(', '.join((
+    '[class*="price"]', '[class*="Price"]', '[class*="cost"]', '[class*="Cost"]',
+    '[class*="rate"]', '[class*="Rate"]', '[class*="amount"]', '[class*="Amount"]',
+    '[id*="price"]', '[id*="Price"]', '[id*="cost"]', '[id*="rate"]',
+    '.booking-price', '.tour-price', '.package-price', '.trip-cost',
+    '[class*="booking"]', '[class*="sidebar"]',
+)))
+
+# Max price-looking elements (in document order) inspected per page
+MAX_PRICE_ELEMENTS = 75
+
+# Distinct price snippets kept for the PRICING INFORMATION line
+MAX_PRICES = 10
+
+# Where actual content starts on common tour sites, in order of preference;
+# only matches within the first CONTENT_START_WINDOW characters count
+CONTENT_MARKERS = (
+    'OVERVIEW', 'Overview', 'Itinerary', 'Day 1', 'Day One',
+    'Trip Overview', 'Tour Overview', 'About This Trip',
+    'Detailed Itinerary', 'Trip Details',
+)
+CONTENT_START_WINDOW = 5000
+
+# Where content likely ends; one alternation finds the earliest in a single scan
+END_MARKERS_RE = re.compile('|'.join(re.escape(marker) for marker in (
+    'Related Tours', 'You may also like', 'Similar Trips',
+    'Book Now Reserve', 'Contact Form', '© 20', 'Footer',
+    'Share this', 'Leave a comment',
+)))
+
+# Text inside a price-looking element that marks it as actual pricing
+PRICE_TEXT_RE = re.compile(r'[\$€£]\s*[\d,]+|\d+\s*(?:USD|EUR|GBP|usd)|per person|pp|pax', re.I)
+
+# Price patterns searched for in the full page text
+PRICE_PATTERNS = [
+    re.compile(pattern, re.I) for pattern in (
+        r'(?:Price|Cost|Rate|From|Starting)[\s:]*[\$€£]?\s*[\d,]+(?:\.\d{2})?(?:\s*(?:USD|EUR|per person|pp|pax))?',
+        r'[\$€£]\s*[\d,]+(?:\.\d{2})?\s*(?:USD|EUR|per person|pp|pax)?',
+        r'(?:USD|EUR|GBP)\s*[\d,]+(?:\.\d{2})?',
+    )
+]
+
+# <meta charset=...> / http-equiv content type, looked for near the top of the page
+META_CHARSET_RE = re.compile(rb'<meta[^>]+charset=["\']?([\w-]+)', re.I)
+META_CHARSET_WINDOW = 4096
+
+BLANK_LINES_RE = re.compile(r'\n\s*\n')
+# Runs of 2+ spaces; single spaces are already normalized and never need a match
+SPACES_RE = re.compile(r' {2,}')
+
+# Common noise stripped from extracted text, as one alternation so the text is
+# scanned once. The leading lookahead on the patterns' first characters lets
+# the engine reject most positions before trying any alternative.
+NOISE_RE = re.compile(r'(?=[csf©])(?:' + '|'.join((
+    r'Cookie.*?accept',
+    r'Subscribe.*?newsletter',
+    r'Follow us on.*',
+    r'Share this.*',
+    r'©.*?\d{4}',
+)) + ')', re.I | re.S)
+
+
+_dns_cache = {}
+_dns_cache_lock = threading.Lock()
+
+
+def _cached_getaddrinfo(*args):
+    now = time.monotonic()
+    cached = _dns_cache.get(args)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+    
+    # Lookup failures raise and are never cached
+    addresses = socket.getaddrinfo(*args)
+    with _dns_cache_lock:
+        if len(_dns_cache) >= DNS_CACHE_SIZE:
+            _dns_cache.clear()
+        _dns_cache[args] = (now + DNS_CACHE_TTL, addresses)
+    return addresses
+
+
+class _CachedDNSConnectionMixin:
+    """
+    Resolves the host through the scraper's DNS cache, then hands urllib3 one
+    address at a time so timeouts, socket options and errors behave as usual.
+    Only the scraper's own session uses this; socket.getaddrinfo is untouched.
+    """
+    
+    def _new_conn(self):
+        host = self._dns_host
+        try:
+            addresses = _cached_getaddrinfo(host, self.port, allowed_gai_family(), socket.SOCK_STREAM)
+        except socket.gaierror as e:
+            raise NameResolutionError(self.host, self, e) from e
+        
+        error = None
+        try:
+            for *_, sockaddr in addresses:
+                self._dns_host = sockaddr[0]
+                try:
+                    return super()._new_conn()
+                except (ConnectTimeoutError, NewConnectionError) as e:
+                    error = e
+        finally:
+            self._dns_host = host
+        raise error
+
+
+class _CachedDNSHTTPConnection(_CachedDNSConnectionMixin, HTTPConnection):
+    pass
+
+
+class _CachedDNSHTTPSConnection(_CachedDNSConnectionMixin, HTTPSConnection):
+    pass
+
+
+class _CachedDNSHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _CachedDNSHTTPConnection
+
+
+class _CachedDNSHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _CachedDNSHTTPSConnection
+
+
+class _CachedDNSAdapter(HTTPAdapter):
+    """HTTPAdapter whose connections resolve hosts through the DNS cache."""
+    
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _CachedDNSHTTPConnectionPool,
+            'https': _CachedDNSHTTPSConnectionPool,
+        }
+
 
 class RateLimiter:
-    """Ensures we don't overwhelm target websites."""
+    """
+    Ensures we don't overwhelm target websites.
+    
+    Thread-safe: each domain has its own lock, so a wait for one domain
+    never holds up requests to another.
+    """
     
     def __init__(self):
         self._last_request_times = {}
+        self._locks = defaultdict(threading.Lock)
+        self._locks_guard = threading.Lock()
+    
+    def _lock_for(self, domain: str) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks[domain]
     
     def wait_if_needed(self, domain: str, min_seconds: int = 5):
         """Wait if we've recently made a request to this domain."""
-        now = time.time()
-        last_time = self._last_request_times.get(domain, 0)
-        elapsed = now - last_time
-        
-        if elapsed < min_seconds:
-            wait_time = min_seconds - elapsed
-            logger.info(f"Rate limiting: waiting {wait_time:.1f}s for {domain}")
-            time.sleep(wait_time)
-        
-        self._last_request_times[domain] = time.time()
+        with self._lock_for(domain):
+            last_time = self._last_request_times.get(domain)
+            if last_time is not None:
+                elapsed = time.monotonic() - last_time
+                if elapsed < min_seconds:
+                    wait_time = min_seconds - elapsed
+                    logger.info(f"Rate limiting: waiting {wait_time:.1f}s for {domain}")
+                    time.sleep(wait_time)
+            
+            self._last_request_times[domain] = time.monotonic()
 
 
 class ItineraryScraper:
@@ -41,16 +231,28 @@ class ItineraryScraper:
     def __init__(self):
         self.rate_limiter = RateLimiter()
         self.session = requests.Session()
+        # Keep connections to many hosts alive across a run, with enough per
+        # host for every worker thread (see process_pending_queue), resolving
+        # hosts through the DNS cache
+        adapter = _CachedDNSAdapter(pool_connections=POOL_HOSTS, pool_maxsize=MAX_PARALLEL_DOMAINS)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
         })
     
-    def scrape_url(self, url: str, rate_limit_seconds: int = 5) -> dict:
+    def scrape_url(self, url: str, rate_limit_seconds: int = 5, force_refresh: bool = False,
+                   include_html: bool = True) -> dict:
         """
         Fetch and parse a single URL.
         
+        The text and metadata of successful scrapes are cached (see
+        DEFAULT_SCRAPE_CACHE_TTL), but not the HTML. Callers that don't need
+        raw_html pass include_html=False to use the cache; otherwise the page
+        is always fetched. force_refresh=True bypasses the cache.
+        
         Returns dict with:
         - success: bool
         - raw_html: str
@@ -60,6 +262,13 @@ class ItineraryScraper:
         - meta_keywords: str
         - error: str (if failed)
         """
+        cache_key = 'scrape:' + hashlib.sha1(url.encode()).hexdigest()
+        if not force_refresh and not include_html:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"Using cached scrape of {url}")
+                return cached
+        
         result = {
             'success': False,
             'raw_html': '',
@@ -77,30 +286,19 @@ class ItineraryScraper:
             
             # Fetch the page
             logger.info(f"Scraping: {url}")
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-            
-            result['raw_html'] = response.text
-            
-            # Parse HTML
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Extract title
-            title_tag = soup.find('title')
-            result['page_title'] = title_tag.get_text(strip=True) if title_tag else ''
+            with self.session.get(url, timeout=30, stream=True) as response:
+                response.raise_for_status()
+                html = self._read_body(response)
             
-            # Extract meta tags
-            meta_desc = soup.find('meta', attrs={'name': 'description'})
-            result['meta_description'] = meta_desc.get('content', '') if meta_desc else ''
-            
-            meta_keywords = soup.find('meta', attrs={'name': 'keywords'})
-            result['meta_keywords'] = meta_keywords.get('content', '') if meta_keywords else ''
-            
-            # Extract main content text
-            result['raw_text'] = self._extract_itinerary_text(soup)
+            result.update(self.parse_page(html))
             
             result['success'] = True
             logger.info(f"Successfully scraped: {url}")
+            # Pages can be up to MAX_PAGE_BYTES; keep the HTML out of the cache
+            cache.set(cache_key, result.copy(), getattr(settings, 'SCRAPE_CACHE_TTL', DEFAULT_SCRAPE_CACHE_TTL))
+            
+            if include_html:
+                result['raw_html'] = html
             
         except requests.exceptions.RequestException as e:
             result['error'] = f"Request failed: {str(e)}"
@@ -111,45 +309,90 @@ class ItineraryScraper:
         
         return result
     
+    def parse_page(self, html: str) -> dict:
+        """
+        Parse a page into page_title, meta_description, meta_keywords and raw_text.
+        
+        Results are cached by a hash of the HTML, so a refetched page whose
+        content hasn't changed is never parsed twice.
+        """
+        cache_key = 'scrape-parse:' + hashlib.blake2b(html.encode(), digest_size=16).hexdigest()
+        parsed = cache.get(cache_key)
+        if parsed is not None:
+            return parsed
+        
+        soup = BeautifulSoup(html, HTML_PARSER)
+        
+        # Extract title
+        title_tag = soup.find('title')
+        
+        # Extract meta tags
+        meta_desc = soup.find('meta', attrs={'name': 'description'})
+        meta_keywords = soup.find('meta', attrs={'name': 'keywords'})
+        
+        parsed = {
+            'page_title': title_tag.get_text(strip=True) if title_tag else '',
+            'meta_description': meta_desc.get('content', '') if meta_desc else '',
+            'meta_keywords': meta_keywords.get('content', '') if meta_keywords else '',
+            # Extract main content text
+            'raw_text': self._extract_itinerary_text(soup),
+        }
+        
+        cache.set(cache_key, parsed, getattr(settings, 'SCRAPE_CACHE_TTL', DEFAULT_SCRAPE_CACHE_TTL))
+        return parsed
+    
+    def _read_body(self, response) -> str:
+        """Read a streamed response body, giving up once it exceeds MAX_PAGE_BYTES."""
+        chunks = []
+        size = 0
+        for chunk in response.iter_content(chunk_size=65536):
+            size += len(chunk)
+            if size > MAX_PAGE_BYTES:
+                raise requests.exceptions.RequestException(f"Page larger than {MAX_PAGE_BYTES} bytes")
+            chunks.append(chunk)
+        
+        body = b''.join(chunks)
+        try:
+            return body.decode(self._page_encoding(response, body), errors='replace')
+        except LookupError:
+            return body.decode('utf-8', errors='replace')
+    
+    def _page_encoding(self, response, body: bytes) -> str:
+        """
+        Charset from the Content-Type header, else the page's <meta> tag, else UTF-8.
+        
+        Never falls back to requests' apparent_encoding, which runs a charset
+        detector over the whole body.
+        """
+        if 'charset' in response.headers.get('Content-Type', '').lower():
+            return response.encoding
+        match = META_CHARSET_RE.search(body, 0, META_CHARSET_WINDOW)
+        return match.group(1).decode('ascii') if match else 'utf-8'
+    
     def _extract_itinerary_text(self, soup: BeautifulSoup) -> str:
         """Extract relevant itinerary text, ignoring ads/navigation."""
         
-        # First, extract price information before removing elements
-        price_info = self._extract_price_info(soup)
-        
         # Remove unwanted elements
         for element in soup.find_all(['script', 'style', 'nav', 'iframe', 'noscript']):
             element.decompose()
         
-        # Get full text first
+        # Get full text once; price extraction and content slicing both use it
         full_text = soup.get_text(separator=' ', strip=True)
         
-        # Try to find where actual content starts (common patterns for tour sites)
-        content_markers = [
-            'OVERVIEW', 'Overview', 'Itinerary', 'Day 1', 'Day One',
-            'Trip Overview', 'Tour Overview', 'About This Trip',
-            'Detailed Itinerary', 'Trip Details'
-        ]
+        price_info = self._extract_price_info(soup, full_text)
         
+        # Try to find where actual content starts (common patterns for tour sites)
         start_idx = 0
-        for marker in content_markers:
-            idx = full_text.find(marker)
-            if idx > 0 and idx < 5000:  # Should be early in the page
+        for marker in CONTENT_MARKERS:
+            # Should be early in the page; don't scan past that
+            idx = full_text.find(marker, 0, CONTENT_START_WINDOW + len(marker))
+            if idx > 0 and idx < CONTENT_START_WINDOW:
                 start_idx = idx
                 break
         
-        # Find where content likely ends
-        end_markers = [
-            'Related Tours', 'You may also like', 'Similar Trips',
-            'Book Now Reserve', 'Contact Form', '© 20', 'Footer',
-            'Share this', 'Leave a comment'
-        ]
-        
-        end_idx = len(full_text)
-        for marker in end_markers:
-            idx = full_text.find(marker, start_idx + 500)
-            if idx > 0:
-                end_idx = min(end_idx, idx)
+        # Find where content likely ends: the earliest end marker, in one pass
+        end_match = END_MARKERS_RE.search(full_text, start_idx + 500)
+        end_idx = end_match.start() if end_match else len(full_text)
         
         # Extract content section
         text = full_text[start_idx:end_idx]
@@ -168,96 +411,58 @@ class ItineraryScraper:
         # Limit size for GPT processing
         return text[:12000]
     
-    def _extract_price_info(self, soup: BeautifulSoup) -> str:
-        """Extract price information from various page elements."""
-        price_texts = []
-        
-        # Common price-related class/id patterns
-        price_selectors = [
-            '[class*="price"]', '[class*="Price"]', '[class*="cost"]', '[class*="Cost"]',
-            '[class*="rate"]', '[class*="Rate"]', '[class*="amount"]', '[class*="Amount"]',
-            '[id*="price"]', '[id*="Price"]', '[id*="cost"]', '[id*="rate"]',
-            '.booking-price', '.tour-price', '.package-price', '.trip-cost',
-            '[class*="booking"]', '[class*="sidebar"]',
-        ]
-        
-        for selector in price_selectors:
-            try:
-                elements = soup.select(selector)
-                for el in elements[:5]:  # Limit to first 5 matches per selector
-                    text = el.get_text(strip=True)
-                    # Check if it contains price-like patterns
-                    if re.search(r'[\$€£]\s*[\d,]+|\d+\s*(?:USD|EUR|GBP|usd)|per person|pp|pax', text, re.I):
-                        if len(text) < 500:  # Avoid huge blocks
-                            price_texts.append(text)
-            except Exception:
-                continue
-        
-        # Also search for price patterns in the full text
-        full_text = soup.get_text()
-        price_patterns = [
-            r'(?:Price|Cost|Rate|From|Starting)[\s:]*[\$€£]?\s*[\d,]+(?:\.\d{2})?(?:\s*(?:USD|EUR|per person|pp|pax))?',
-            r'[\$€£]\s*[\d,]+(?:\.\d{2})?\s*(?:USD|EUR|per person|pp|pax)?',
-            r'(?:USD|EUR|GBP)\s*[\d,]+(?:\.\d{2})?',
-        ]
-        
-        for pattern in price_patterns:
-            matches = re.findall(pattern, full_text, re.I)
-            price_texts.extend(matches[:5])
-        
-        # Remove duplicates and join
-        unique_prices = list(set(price_texts))
-        return ' | '.join(unique_prices[:10]) if unique_prices else ''
+    def _extract_price_info(self, soup: BeautifulSoup, full_text: str) -> str:
+        """Extract price information from price-like page elements and the page text."""
+        # Distinct prices in the order found (dict keeps insertion order)
+        prices = {}
+        
+        for el in PRICE_SELECTOR.iselect(soup, limit=MAX_PRICE_ELEMENTS):
+            text = el.get_text(strip=True)
+            # Check if it contains price-like patterns
+            if PRICE_TEXT_RE.search(text):
+                if len(text) < 500:  # Avoid huge blocks
+                    prices[text] = None
+                    if len(prices) >= MAX_PRICES:
+                        break
+        
+        # Also search for price patterns in the full text, scanning only
+        # as far as needed to fill up to MAX_PRICES
+        for pattern in PRICE_PATTERNS:
+            if len(prices) >= MAX_PRICES:
+                break
+            for match in islice(pattern.finditer(full_text), 5):
+                prices[match.group()] = None
+                if len(prices) >= MAX_PRICES:
+                    break
+        
+        return ' | '.join(prices)
     
     def _clean_text(self, text: str) -> str:
         """Clean and normalize extracted text."""
         
         # Remove excessive whitespace
-        text = re.sub(r'\n\s*\n', '\n\n', text)
-        text = re.sub(r' +', ' ', text)
+        text = BLANK_LINES_RE.sub('\n\n', text)
+        if '  ' in text:
+            text = SPACES_RE.sub(' ', text)
         
         # Remove common noise patterns
-        noise_patterns = [
-            r'Cookie.*?accept',
-            r'Subscribe.*?newsletter',
-            r'Follow us on.*',
-            r'Share this.*',
-            r'©.*?\d{4}',
-        ]
-        for pattern in noise_patterns:
-            text = re.sub(pattern, '', text, flags=re.I | re.S)
+        text = NOISE_RE.sub('', text)
         
         return text.strip()
     
-    def process_queue_item(self, queue_item) -> bool:
+    def _rate_limit_for(self, queue_item) -> int:
+        return queue_item.source.rate_limit_seconds if queue_item.source else 5
+    
+    def _finish_queue_item(self, queue_item, result: dict, update_source_stats: bool = True) -> bool:
         """
-        Process a single ScrapeQueue item.
+        Store a scrape_url result for a queue item and update its status.
         
-        Returns True if successful, False otherwise.
+        Returns True if the page was scraped and saved.
         """
-        from tour.models import RawItinerary, ScrapeQueue
-        
-        # Mark as in progress
-        queue_item.status = 'in_progress'
-        queue_item.save()
-        
         try:
-            # Scrape the URL
-            rate_limit = queue_item.source.rate_limit_seconds if queue_item.source else 5
-            result = self.scrape_url(queue_item.url, rate_limit)
-            
             if result['success']:
                 # Create RawItinerary record
-                RawItinerary.objects.create(
-                    source_type='scraped',
-                    source=queue_item.source,
-                    source_url=queue_item.url,
-                    raw_html=result['raw_html'],
-                    raw_text=result['raw_text'],
-                    page_title=result['page_title'],
-                    meta_description=result['meta_description'],
-                    meta_keywords=result['meta_keywords'],
-                )
+                self._raw_itinerary_for(queue_item, result).save()
                 
                 # Update queue item
                 queue_item.status = 'completed'
@@ -265,51 +470,177 @@ class ItineraryScraper:
                 queue_item.save()
                 
                 # Update source stats
-                if queue_item.source:
-                    queue_item.source.total_scraped += 1
-                    queue_item.source.last_scraped_at = timezone.now()
-                    queue_item.source.save()
+                if update_source_stats and queue_item.source_id:
+                    record_source_scrapes({queue_item.source_id: 1})
                 
                 return True
             else:
                 raise Exception(result['error'])
                 
         except Exception as e:
-            queue_item.retry_count += 1
-            queue_item.error_message = str(e)
-            
-            if queue_item.retry_count >= queue_item.max_retries:
-                queue_item.status = 'failed'
-            else:
-                queue_item.status = 'pending'  # Will retry
-            
+            self._record_failure(queue_item, str(e))
             queue_item.save()
             return False
     
+    def _raw_itinerary_for(self, queue_item, result: dict):
+        """Build (without saving) the RawItinerary for a successful scrape_url result."""
+        from tour.models import RawItinerary
+        
+        return RawItinerary(
+            source_type='scraped',
+            source=queue_item.source,
+            source_url=queue_item.url,
+            raw_html=result['raw_html'],
+            raw_text=result['raw_text'],
+            page_title=result['page_title'],
+            meta_description=result['meta_description'],
+            meta_keywords=result['meta_keywords'],
+        )
+    
+    def _record_failure(self, queue_item, error: str):
+        """Bump a queue item's retry count and set it back to pending, or failed once out of retries."""
+        queue_item.retry_count += 1
+        queue_item.error_message = error
+        
+        if queue_item.retry_count >= queue_item.max_retries:
+            queue_item.status = 'failed'
+        else:
+            queue_item.status = 'pending'  # Will retry
+    
+    def process_queue_item(self, queue_item, update_source_stats: bool = True) -> bool:
+        """
+        Process a single ScrapeQueue item.
+        
+        Set update_source_stats=False when the caller bumps the source
+        counters itself (see process_pending_queue).
+        
+        Returns True if successful, False otherwise.
+        """
+        # Mark as in progress
+        queue_item.status = 'in_progress'
+        queue_item.save()
+        
+        try:
+            result = self.scrape_url(queue_item.url, self._rate_limit_for(queue_item))
+        except Exception as e:
+            result = {'success': False, 'error': str(e)}
+        
+        return self._finish_queue_item(queue_item, result, update_source_stats)
+    
+    def _scrape_domain(self, items: list) -> list:
+        """Scrape one domain's queue items in order. Runs on a worker thread; no DB access."""
+        results = []
+        for item in items:
+            try:
+                result = self.scrape_url(item.url, self._rate_limit_for(item))
+            except Exception as e:
+                result = {'success': False, 'error': str(e)}
+            results.append((item, result))
+        return results
+    
     def process_pending_queue(self, max_items: int = 10) -> dict:
         """
         Process pending items in the scrape queue.
         
+        Different domains are scraped concurrently (up to MAX_PARALLEL_DOMAINS);
+        each domain's pages are fetched one after another with its rate limit.
+        Once all pages are fetched the results are written in bulk.
+        
         Returns stats dict with counts.
         """
         from tour.models import ScrapeQueue
         
-        pending = ScrapeQueue.objects.filter(status='pending')[:max_items]
+        pending = list(
+            ScrapeQueue.objects.filter(status='pending')
+            .select_related('source')
+            .only('id', 'url', 'retry_count', 'max_retries', 'source__id', 'source__rate_limit_seconds')
+            [:max_items]
+        )
         
         stats = {
             'processed': 0,
             'succeeded': 0,
             'failed': 0,
         }
+        if not pending:
+            return stats
+        
+        # Mark as in progress
+        ScrapeQueue.objects.filter(pk__in=[item.pk for item in pending]).update(status='in_progress')
         
+        by_domain = defaultdict(list)
         for item in pending:
-            stats['processed'] += 1
-            if self.process_queue_item(item):
-                stats['succeeded'] += 1
-            else:
-                stats['failed'] += 1
+            by_domain[urlparse(item.url).netloc].append(item)
+        
+        succeeded = []
+        failed = []
+        
+        with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_DOMAINS, len(by_domain))) as executor:
+            futures = [executor.submit(self._scrape_domain, items) for items in by_domain.values()]
+            for future in as_completed(futures):
+                for item, result in future.result():
+                    if result['success']:
+                        succeeded.append((item, result))
+                    else:
+                        failed.append((item, result))
+        
+        self._save_queue_results(succeeded, failed)
+        
+        stats['processed'] = len(succeeded) + len(failed)
+        stats['succeeded'] = len(succeeded)
+        stats['failed'] = len(failed)
         
         return stats
+    
+    def _save_queue_results(self, succeeded: list, failed: list):
+        """
+        Write a run's (queue_item, result) pairs in a few bulk statements.
+        
+        Creates the RawItinerary rows, completes the succeeded queue items,
+        stores retry state for failed ones and bumps source counters.
+        """
+        from tour.models import RawItinerary, ScrapeQueue
+        
+        now = timezone.now()
+        
+        for item, result in failed:
+            self._record_failure(item, result['error'])
+        
+        with transaction.atomic():
+            RawItinerary.objects.bulk_create(
+                [self._raw_itinerary_for(item, result) for item, result in succeeded],
+                batch_size=BULK_BATCH_SIZE,
+            )
+            ScrapeQueue.objects.filter(pk__in=[item.pk for item, _ in succeeded]).update(
+                status='completed', processed_at=now,
+            )
+            ScrapeQueue.objects.bulk_update(
+                [item for item, _ in failed], ['retry_count', 'error_message', 'status'],
+                batch_size=BULK_BATCH_SIZE,
+            )
+            record_source_scrapes(Counter(item.source_id for item, _ in succeeded if item.source_id))
+        
+        for item, _ in succeeded:
+            item.status = 'completed'
+            item.processed_at = now
+
+
+def record_source_scrapes(counts: dict):
+    """
+    Add scrape counts to ScrapingSource stats in SQL.
+    
+    counts maps source id -> number of newly scraped pages. The increment
+    runs as UPDATE ... SET total_scraped = total_scraped + n, so concurrent
+    workers never overwrite each other's counts.
+    """
+    from tour.models import ScrapingSource
+    
+    now = timezone.now()
+    for source_id, count in counts.items():
+        ScrapingSource.objects.filter(pk=source_id).update(
+            total_scraped=F('total_scraped') + count,
+            last_scraped_at=now,
+        )
 
 
 def create_raw_from_uploaded_package(package) -> 'RawItinerary':
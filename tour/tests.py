@@ -1,3 +1,259 @@
-from django.test import TestCase
+import datetime
+import json
+from types import SimpleNamespace
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TestCase, TransactionTestCase
+
+from tour.models import BatchJob, ProcessedItinerary, RawItinerary, TourRequest
+from tour.services.gpt_processor import GPTProcessor
+
+
+def _extraction(title, activities=()):
+    """A GPT extraction response body as the processor expects it."""
+    return json.dumps({
+        'tour_identity': {'tour_title': title, 'tour_category': 'safari'},
+        'duration': {'activity_days': 3, 'total_program_days': 4},
+        'itinerary_structure': {'days': [
+            {'day': 1, 'activities': list(activities), 'accommodation_name': 'Lodge'},
+            {'day': 2, 'activities': list(activities)},
+        ]},
+        'pricing': {'price_per_person_usd': 1200},
+    })
+
+
+def _completion(content, tokens=42):
+    return SimpleNamespace(
+        usage=SimpleNamespace(total_tokens=tokens),
+        choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+    )
+
+
+def _batch_line(raw, content=None, error=None):
+    """One line of a Batch API output/error file."""
+    if error:
+        response = {'status_code': 500, 'body': {'error': {'message': error}}}
+    else:
+        response = {'status_code': 200, 'body': {
+            'choices': [{'message': {'content': content}}],
+            'usage': {'total_tokens': 10},
+        }}
+    return json.dumps({'custom_id': str(raw.id), 'response': response, 'error': None}).encode()
+
+
+class GPTProcessorTests(TestCase):
+    """GPT processing with the OpenAI client mocked out."""
+
+    def setUp(self):
+        patcher = mock.patch('tour.services.gpt_processor.OpenAI')
+        self.client = patcher.start().return_value
+        self.addCleanup(patcher.stop)
+        self.processor = GPTProcessor()
+
+        self.good = RawItinerary.objects.create(
+            source_url='https://safari.example.com/trip', raw_text='VALID-RESPONSE itinerary', page_title='Good')
+        self.bad = RawItinerary.objects.create(
+            source_url='https://safari.example.com/other', raw_text='BROKEN-RESPONSE itinerary', page_title='Bad')
+
+    def _respond(self, **kwargs):
+        """Answer live requests by raw text: valid JSON for VALID-RESPONSE, garbage otherwise."""
+        prompt = kwargs['messages'][1]['content']
+        if 'VALID-RESPONSE' in prompt:
+            return _completion(_extraction('Serengeti Escape', ['Game drive', 'Walk']))
+        return _completion('not json')
+
+    def test_process_pending_saves_results_and_errors(self):
+        self.client.chat.completions.create.side_effect = self._respond
+
+        stats = self.processor.process_pending_raw_itineraries(max_items=10)
+
+        self.assertEqual(stats, {'processed': 2, 'succeeded': 1, 'failed': 1})
+        processed = ProcessedItinerary.objects.get(raw_itinerary=self.good)
+        self.assertEqual(processed.title, 'Serengeti Escape')
+        self.assertEqual(processed.duration_days, 3)
+        self.assertEqual(processed.activities, ['Game drive', 'Walk'])
+        self.assertEqual(processed.accommodations, [{'name': 'Lodge', 'type': None, 'location': None}])
+        self.assertEqual(processed.gpt_tokens_used, 42)
+        self.assertEqual(processed.status, 'pending_review')
+
+        self.good.refresh_from_db()
+        self.bad.refresh_from_db()
+        self.assertTrue(self.good.is_processed)
+        self.assertEqual(self.good.processing_error, '')
+        self.assertFalse(self.bad.is_processed)
+        self.assertTrue(self.bad.processing_error.startswith('JSON parsing error'))
+        self.assertFalse(ProcessedItinerary.objects.filter(raw_itinerary=self.bad).exists())
+
+    def test_process_pending_skips_items_in_active_batch(self):
+        job = BatchJob.objects.create(batch_id='batch_active', input_file_id='file_in', gpt_model='gpt-4o')
+        job.raw_itineraries.add(self.bad)
+        self.client.chat.completions.create.side_effect = self._respond
+
+        stats = self.processor.process_pending_raw_itineraries(max_items=10)
+
+        self.assertEqual(stats, {'processed': 1, 'succeeded': 1, 'failed': 0})
+        self.assertEqual(self.client.chat.completions.create.call_count, 1)
+        self.bad.refresh_from_db()
+        self.assertFalse(self.bad.is_processed)
+        self.assertEqual(self.bad.processing_error, '')
+
+    def test_submit_and_ingest_batch(self):
+        late = RawItinerary.objects.create(
+            source_url='https://safari.example.com/late', raw_text='VALID-RESPONSE too', page_title='Late')
+        self.client.files.create.return_value = SimpleNamespace(id='file_in')
+        self.client.batches.create.return_value = SimpleNamespace(id='batch_1', status='validating')
+
+        job = self.processor.submit_batch(RawItinerary.objects.filter(is_processed=False))
+
+        self.assertEqual(job.batch_id, 'batch_1')
+        self.assertEqual(job.request_count, 3)
+        self.assertEqual(set(job.raw_itineraries.all()), {self.good, self.bad, late})
+        _, upload = self.client.files.create.call_args.kwargs['file']
+        self.assertEqual(
+            sorted(json.loads(line)['custom_id'] for line in upload.splitlines()),
+            sorted(str(raw.id) for raw in (self.good, self.bad, late)),
+        )
+        # Already queued, so a second submit has nothing to send
+        self.assertIsNone(self.processor.submit_batch(RawItinerary.objects.filter(is_processed=False)))
+
+        # late gets processed live while the batch runs; its batch result is ignored
+        RawItinerary.objects.filter(pk=late.pk).update(is_processed=True)
+        self.client.batches.retrieve.return_value = SimpleNamespace(
+            status='completed', output_file_id='file_out', error_file_id='file_err')
+        files = {
+            'file_out': b'\n'.join([
+                _batch_line(self.good, _extraction('Batch Safari', ['Balloon'])),
+                _batch_line(late, _extraction('Stale result')),
+            ]),
+            'file_err': _batch_line(self.bad, error='server error'),
+        }
+        self.client.files.content.side_effect = lambda file_id: SimpleNamespace(content=files[file_id])
+
+        stats = self.processor.ingest_batch_results('batch_1')
+
+        self.assertEqual(stats, {'status': 'completed', 'processed': 2, 'succeeded': 1, 'failed': 1})
+        processed = ProcessedItinerary.objects.get(raw_itinerary=self.good)
+        self.assertEqual(processed.title, 'Batch Safari')
+        self.assertEqual(processed.gpt_tokens_used, 10)
+        self.assertFalse(ProcessedItinerary.objects.filter(raw_itinerary=late).exists())
+
+        self.good.refresh_from_db()
+        self.bad.refresh_from_db()
+        self.assertTrue(self.good.is_processed)
+        self.assertFalse(self.bad.is_processed)
+        self.assertEqual(self.bad.processing_error, 'Batch request failed: server error')
+
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.succeeded, job.failed), ('completed', 1, 1))
+        self.assertIsNotNone(job.ingested_at)
+
+        # A second ingest is a no-op
+        self.client.batches.retrieve.reset_mock()
+        self.processor.ingest_batch_results('batch_1')
+        self.client.batches.retrieve.assert_not_called()
+
+
+class DataMigrationTests(TransactionTestCase):
+    """Forward data migrations 0021-0024, run from the 0020 schema."""
+
+    start = [('tour', '0020_ai_training_pipeline')]
+    end = [('tour', '0024_batchjob')]
+
+    def setUp(self):
+        executor = MigrationExecutor(connection)
+        executor.migrate(self.start)
+        self.old_apps = executor.loader.project_state(self.start).apps
+
+    def tearDown(self):
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(executor.loader.graph.leaf_nodes())
+
+    def _migrate_forward(self):
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(self.end)
+        return executor.loader.project_state(self.end).apps
+
+    def test_forward_migrations(self):
+        operator = get_user_model().objects.create(email='operator@example.com', name='Operator')
+        UploadedPackage = self.old_apps.get_model('tour', 'UploadedPackage')
+        Destination = self.old_apps.get_model('tour', 'Destination')
+        package = UploadedPackage.objects.create(
+            operator_id=operator.pk, title='Northern Circuit',
+            destinations='Serengeti, Ngorongoro Crater , ,Tarangire',
+            image_2='package_images/b.jpg', image_4='package_images/d.jpg',
+        )
+        empty = UploadedPackage.objects.create(operator_id=operator.pk, title='Empty', destinations='')
+        first = Destination.objects.create(name='Serengeti National Park', region='Northern Circuit')
+        second = Destination.objects.create(name='Serengeti National Park', region='Western Circuit')
+
+        new_apps = self._migrate_forward()
+
+        UploadedPackage = new_apps.get_model('tour', 'UploadedPackage')
+        PackageImage = new_apps.get_model('tour', 'PackageImage')
+        Destination = new_apps.get_model('tour', 'Destination')
+        BatchJob = new_apps.get_model('tour', 'BatchJob')
+
+        # 0021: image_2..4 columns become ordered PackageImage rows
+        self.assertEqual(
+            list(PackageImage.objects.filter(package_id=package.pk).values_list('order', 'image')),
+            [(2, 'package_images/b.jpg'), (4, 'package_images/d.jpg')],
+        )
+        self.assertFalse(PackageImage.objects.filter(package_id=empty.pk).exists())
+
+        # 0022: comma-separated destinations become a JSON list
+        self.assertEqual(
+            UploadedPackage.objects.get(pk=package.pk).destinations,
+            ['Serengeti', 'Ngorongoro Crater', 'Tarangire'],
+        )
+        self.assertEqual(UploadedPackage.objects.get(pk=empty.pk).destinations, [])
+
+        # 0023: unique slugs for existing destinations, in pk order
+        self.assertEqual(Destination.objects.get(pk=first.pk).slug, 'serengeti-national-park')
+        self.assertEqual(Destination.objects.get(pk=second.pk).slug, 'serengeti-national-park-2')
+
+        # 0024: BatchJob table is usable
+        self.assertEqual(BatchJob.objects.count(), 0)
+
+
+class PDFGeneratorTests(TestCase):
+
+    def setUp(self):
+        self.tour_request = TourRequest(
+            pk=7, client_name='Jane & Co <test>', client_email='jane@example.com',
+            tour_type='mid_range', group_type='family', num_adults=2, num_children=1,
+            budget_per_person=3000, markup_percentage=15,
+            start_date=datetime.date(2026, 7, 1), end_date=datetime.date(2026, 7, 3),
+        )
+        day = {
+            'title': 'Game drive & picnic', 'destination': 'Serengeti',
+            'activities': [{'name': 'Game drive', 'time': '06:00', 'cost_per_person': 50}],
+            'accommodation': {'name': 'Lodge', 'meal_plan': 'FB', 'cost_per_person': 200},
+            'transport': {'description': '4x4', 'distance_km': 120},
+            'meals_included': ['B', 'L', 'D'],
+        }
+        self.itinerary = {
+            'summary': 'Three days in the Serengeti',
+            'days': [dict(day, day=n) for n in (1, 2, 3)],
+            'cost_breakdown': {'subtotal_per_person': 750, 'total_per_person': 862.5, 'total_all_travelers': 2587.5},
+            'what_to_pack': ['hat', 'boots'],
+        }
+
+    @mock.patch('reportlab.rl_config.invariant', 1)
+    def test_repeated_renders_are_identical(self):
+        # Render the cached day flowables twice; the first build must not leak
+        # layout state into the cache. invariant and a fixed clock pin the
+        # document timestamps and ID.
+        from tour import pdf_generator
+
+        with mock.patch.object(pdf_generator, 'datetime') as clock:
+            clock.now.return_value = datetime.datetime(2026, 6, 1, 9, 30)
+            first = pdf_generator.generate_itinerary_pdf(self.tour_request, self.itinerary).getvalue()
+            second = pdf_generator.generate_itinerary_pdf(self.tour_request, self.itinerary).getvalue()
+
+        self.assertTrue(first.startswith(b'%PDF'))
+        self.assertEqual(first, second)
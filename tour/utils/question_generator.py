@@ -2,7 +2,8 @@
 Utility for generating unique and specific questions about Kilimanjaro routes.
 """
 import random
-from typing import List, Dict, Optional
+import re
+from typing import List, Dict, Optional, Tuple
 
 class KilimanjaroQuestionGenerator:
     """Generates unique questions about Kilimanjaro routes."""
@@ -112,123 +113,104 @@ class KilimanjaroQuestionGenerator:
         }
     }
     
+    ROUTE_TEMPLATES = (
+        "What makes the {route} Route's {highlight} particularly special compared to other routes?",
+        "How does the {route} Route's {aspect} affect the overall climbing experience?",
+        "For someone considering the {route} Route, what should they know about the {highlight} section?",
+        "What training would you recommend specifically for the {route} Route's {aspect}?",
+        "How does the {route} Route's {day}-day itinerary optimize for altitude acclimatization?",
+        "What wildlife might I expect to see on the {route} Route near {highlight}?",
+        "How does the {route} Route's {aspect} impact packing requirements?",
+        "What's the most challenging part of the {route} Route's {highlight} section?",
+        "How does the {route} Route's {aspect} compare to other routes in terms of difficulty?",
+        "What photography opportunities does the {route} Route offer at {highlight}?"
+    )
+    
+    COMPARISON_TEMPLATES = (
+        "How does the acclimatization profile compare between the {route1} and {route2} routes?",
+        "What are the key differences in scenery between the {route1} and {route2} routes?",
+        "For someone with {fitness} fitness level, which would be better between {route1} and {route2} and why?",
+        "How do the success rates compare between the {route1} and {route2} routes, and what factors contribute to this?",
+        "What type of hiker would prefer the {route1} route over the {route2} route?",
+        "How do the camping conditions differ between {route1} and {route2}?",
+        "Which route offers better opportunities for {interest}, {route1} or {route2}?",
+        "How does the crowd level compare between the {route1} and {route2} routes during {season}?",
+        "What are the main advantages of choosing {route1} over {route2} for someone with {experience}?",
+        "How do the physical demands differ between the {route1} and {route2} routes?"
+    )
+    
+    FITNESS_LEVELS = ("average", "above average", "excellent", "beginner")
+    INTERESTS = ("wildlife photography", "landscape photography", "bird watching", "stargazing")
+    SEASONS = ("peak season (July-October)", "shoulder season (January-March)", "rainy season (April-June)")
+    EXPERIENCE_LEVELS = ("no high-altitude experience", "some hiking experience", "extensive trekking experience")
+    
+    # Route name -> one tuple per template holding every filled-in variant of it
+    _QUESTION_POOL: Dict[str, Tuple[Tuple[str, ...], ...]] = {}
+    
+    # (%-style template, extra placeholder or None, values for it) per comparison
+    # template; %(name)s with a dict formats faster than str.format_map
+    _COMPARISON_POOL: Tuple[Tuple[str, Optional[str], Tuple[str, ...]], ...] = ()
+    
+    @classmethod
+    def _build_pools(cls):
+        """
+        Format every route question once, at import, instead of on each call,
+        and tag each comparison template with the placeholder it fills.
+        """
+        for name, route in cls.ROUTE_SPECIFICS.items():
+            values = {
+                'highlight': route['highlights'],
+                'aspect': route['unique_aspects'],
+                'day': route['days'],
+            }
+            pool = []
+            for template in cls.ROUTE_TEMPLATES:
+                kind = next(kind for kind in values if '{%s}' % kind in template)
+                pool.append(tuple(
+                    template.format_map({'route': name.title(), kind: value})
+                    for value in values[kind]
+                ))
+            cls._QUESTION_POOL[name] = tuple(pool)
+        
+        comparison_values = {
+            'fitness': cls.FITNESS_LEVELS,
+            'interest': cls.INTERESTS,
+            'season': cls.SEASONS,
+            'experience': cls.EXPERIENCE_LEVELS,
+        }
+        comparison_pool = []
+        for template in cls.COMPARISON_TEMPLATES:
+            kind = next((kind for kind in comparison_values if '{%s}' % kind in template), None)
+            percent_template = re.sub(r'\{(\w+)\}', r'%(\1)s', template.replace('%', '%%'))
+            comparison_pool.append((percent_template, kind, comparison_values.get(kind, ())))
+        cls._COMPARISON_POOL = tuple(comparison_pool)
+    
     @classmethod
     def generate_route_questions(cls, route_name: str, count: int = 3) -> List[str]:
         """Generate unique questions about a specific route."""
-        route = cls.ROUTE_SPECIFICS.get(route_name.lower())
-        if not route:
+        pool = cls._QUESTION_POOL.get(route_name.lower())
+        if not pool:
             return []
-            
-        questions = []
-        used_templates = set()
-        
-        templates = [
-            "What makes the {route} Route's {highlight} particularly special compared to other routes?",
-            "How does the {route} Route's {aspect} affect the overall climbing experience?",
-            "For someone considering the {route} Route, what should they know about the {highlight} section?",
-            "What training would you recommend specifically for the {route} Route's {aspect}?",
-            "How does the {route} Route's {day}-day itinerary optimize for altitude acclimatization?",
-            "What wildlife might I expect to see on the {route} Route near {highlight}?",
-            "How does the {route} Route's {aspect} impact packing requirements?",
-            "What's the most challenging part of the {route} Route's {highlight} section?",
-            "How does the {route} Route's {aspect} compare to other routes in terms of difficulty?",
-            "What photography opportunities does the {route} Route offer at {highlight}?"
-        ]
         
-        while len(questions) < count and templates:
-            # Select a random template that hasn't been used yet
-            template = random.choice([t for t in templates if t not in used_templates])
-            used_templates.add(template)
-            
-            # Fill in the placeholders
-            if '{highlight}' in template:
-                highlight = random.choice(route['highlights'])
-                question = template.format(
-                    route=route_name.title(),
-                    highlight=highlight
-                )
-            elif '{aspect}' in template:
-                aspect = random.choice(route['unique_aspects'])
-                question = template.format(
-                    route=route_name.title(),
-                    aspect=aspect
-                )
-            elif '{day}' in template:
-                day = random.choice(route['days'])
-                question = template.format(
-                    route=route_name.title(),
-                    day=day
-                )
-            else:
-                continue
-                
-            questions.append(question)
-        
-        return questions
+        # Distinct templates, each with a random highlight/aspect/day filled in
+        return [random.choice(variants) for variants in random.sample(pool, min(count, len(pool)))]
     
     @classmethod
     def generate_comparison_questions(cls, route1: str, route2: str, count: int = 3) -> List[str]:
         """Generate comparison questions between two routes."""
         questions = []
+        route1, route2 = route1.title(), route2.title()
         
-        templates = [
-            "How does the acclimatization profile compare between the {route1} and {route2} routes?",
-            "What are the key differences in scenery between the {route1} and {route2} routes?",
-            "For someone with {fitness} fitness level, which would be better between {route1} and {route2} and why?",
-            "How do the success rates compare between the {route1} and {route2} routes, and what factors contribute to this?",
-            "What type of hiker would prefer the {route1} route over the {route2} route?",
-            "How do the camping conditions differ between {route1} and {route2}?",
-            "Which route offers better opportunities for {interest}, {route1} or {route2}?",
-            "How does the crowd level compare between the {route1} and {route2} routes during {season}?",
-            "What are the main advantages of choosing {route1} over {route2} for someone with {experience}?",
-            "How do the physical demands differ between the {route1} and {route2} routes?"
-        ]
-        
-        fitness_levels = ["average", "above average", "excellent", "beginner"]
-        interests = ["wildlife photography", "landscape photography", "bird watching", "stargazing"]
-        seasons = ["peak season (July-October)", "shoulder season (January-March)", "rainy season (April-June)"]
-        experience_levels = ["no high-altitude experience", "some hiking experience", "extensive trekking experience"]
-        
-        used_templates = set()
-        
-        while len(questions) < count and templates:
-            template = random.choice([t for t in templates if t not in used_templates])
-            used_templates.add(template)
-            
-            if '{fitness}' in template:
-                question = template.format(
-                    route1=route1.title(),
-                    route2=route2.title(),
-                    fitness=random.choice(fitness_levels)
-                )
-            elif '{interest}' in template:
-                question = template.format(
-                    route1=route1.title(),
-                    route2=route2.title(),
-                    interest=random.choice(interests)
-                )
-            elif '{season}' in template:
-                question = template.format(
-                    route1=route1.title(),
-                    route2=route2.title(),
-                    season=random.choice(seasons)
-                )
-            elif '{experience}' in template:
-                question = template.format(
-                    route1=route1.title(),
-                    route2=route2.title(),
-                    experience=random.choice(experience_levels)
-                )
-            else:
-                question = template.format(
-                    route1=route1.title(),
-                    route2=route2.title()
-                )
-                
-            questions.append(question)
+        for template, kind, values in random.sample(cls._COMPARISON_POOL, min(count, len(cls._COMPARISON_POOL))):
+            fields = {'route1': route1, 'route2': route2}
+            if kind:
+                fields[kind] = random.choice(values)
+            questions.append(template % fields)
         
         return questions
 
+KilimanjaroQuestionGenerator._build_pools()
+
 # Example usage:
 if __name__ == "__main__":
     # Generate questions about a specific route
@@ -1,7 +1,7 @@
 from django.forms import modelformset_factory
 from django.shortcuts import render, get_object_or_404
 from django.views import View
-from django.http import HttpResponse
+from django.http import FileResponse, HttpResponse
 from rest_framework import generics, permissions
 from rest_framework.response import Response
 from rest_framework.views import APIView
@@ -15,7 +15,7 @@ from .models import (
     Itinerary, TourPackage, Trip, Vendor, ServiceProvider, ServiceMatch,
     # Tour pricing models
     Destination, HotelRate, TransportRate, ActivityRate, FuelPrice, FlightRate, TourRequest,
-    UploadedPackage,
+    UploadedPackage, PackageImage,
     # AI Training Pipeline
     ScrapingSource, ScrapeQueue, RawItinerary, ProcessedItinerary, TrainingExport
 )
@@ -293,7 +293,7 @@ def marketplace_view(request):
 # ---- Tour Package Views ----
 class TourPackageView(APIView):
     def get(self, request):
-        tours = TourPackage.objects.all()
+        tours = TourPackageSerializer.setup_eager_loading(TourPackage.objects.all())
         serializer = TourPackageSerializer(tours, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
@@ -308,7 +308,7 @@ class TourPackageView(APIView):
 class TourPackageDetailView(APIView):
     def get_object(self, pk):
         try:
-            return TourPackage.objects.get(pk=pk)
+            return TourPackageSerializer.setup_eager_loading(TourPackage.objects.all()).get(pk=pk)
         except TourPackage.DoesNotExist:
             return None
 
@@ -325,7 +325,7 @@ class ExhibitorSpaceListView(APIView):
         event = get_object_or_404(Event, slug=event_slug)
         if not event.has_exhibitors:
             return Response([], status=status.HTTP_200_OK)
-        spaces = event.exhibitor_spaces.all()
+        spaces = ExhibitorSpaceSerializer.setup_eager_loading(event.exhibitor_spaces.all())
         serializer = ExhibitorSpaceSerializer(spaces, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
@@ -1514,9 +1514,10 @@ def tour_request_pdf(request, pk, pdf_type='client'):
     
     Args:
         pk: TourRequest primary key
-        pdf_type: 'client' for client version, 'operator' for internal version with profit info
+        pdf_type: 'client' for client version, 'operator' for internal version with profit info,
+            'combined' for both in one file (client pages first)
     """
-    from .pdf_generator import generate_itinerary_pdf, generate_operator_pdf
+    from .pdf_generator import generate_combined_pdf, generate_itinerary_pdf, generate_operator_pdf
     
     tour_request = get_object_or_404(TourRequest, pk=pk, operator=request.user)
     
@@ -1531,16 +1532,18 @@ def tour_request_pdf(request, pk, pdf_type='client'):
         messages.error(request, 'Error parsing itinerary data.')
         return redirect('tour_request_detail', pk=pk)
     
-    # Generate PDF based on type
+    # Generate PDF based on type, writing straight into the response
+    response = HttpResponse(content_type='application/pdf')
     if pdf_type == 'operator':
-        pdf_buffer = generate_operator_pdf(tour_request, itinerary_data)
+        generate_operator_pdf(tour_request, itinerary_data, outfile=response)
         filename = f"OPERATOR_{tour_request.client_name.replace(' ', '_')}_{tour_request.start_date}.pdf"
+    elif pdf_type == 'combined':
+        generate_combined_pdf(tour_request, itinerary_data, outfile=response)
+        filename = f"COMBINED_{tour_request.client_name.replace(' ', '_')}_{tour_request.start_date}.pdf"
     else:
-        pdf_buffer = generate_itinerary_pdf(tour_request, itinerary_data)
+        generate_itinerary_pdf(tour_request, itinerary_data, outfile=response)
         filename = f"Itinerary_{tour_request.client_name.replace(' ', '_')}_{tour_request.start_date}.pdf"
     
-    # Return PDF response
-    response = HttpResponse(pdf_buffer.read(), content_type='application/pdf')
     response['Content-Disposition'] = f'attachment; filename="{filename}"'
     
     return response
@@ -1733,7 +1736,7 @@ def upload_package(request):
             description=request.POST.get('description', ''),
             package_type=request.POST.get('package_type', 'safari'),
             duration_days=int(request.POST.get('duration_days', 1)),
-            destinations=request.POST.get('destinations', ''),
+            destinations=_parse_destinations(request.POST.get('destinations', '')),
             price_per_person=request.POST.get('price_per_person') or None,
             min_group_size=int(request.POST.get('min_group_size', 1)),
             max_group_size=int(request.POST.get('max_group_size', 20)),
@@ -1746,14 +1749,9 @@ def upload_package(request):
             package.pdf_itinerary = request.FILES['pdf_itinerary']
         if 'cover_image' in request.FILES:
             package.cover_image = request.FILES['cover_image']
-        if 'image_2' in request.FILES:
-            package.image_2 = request.FILES['image_2']
-        if 'image_3' in request.FILES:
-            package.image_3 = request.FILES['image_3']
-        if 'image_4' in request.FILES:
-            package.image_4 = request.FILES['image_4']
         
         package.save()
+        _save_package_images(package, request.FILES)
         
         # Extract text from PDF for AI training (async would be better for production)
         if package.pdf_itinerary:
@@ -1787,7 +1785,8 @@ def edit_uploaded_package(request, pk):
         package.description = request.POST.get('description', package.description)
         package.package_type = request.POST.get('package_type', package.package_type)
         package.duration_days = int(request.POST.get('duration_days', package.duration_days))
-        package.destinations = request.POST.get('destinations', package.destinations)
+        if 'destinations' in request.POST:
+            package.destinations = _parse_destinations(request.POST['destinations'])
         package.price_per_person = request.POST.get('price_per_person') or None
         package.min_group_size = int(request.POST.get('min_group_size', package.min_group_size))
         package.max_group_size = int(request.POST.get('max_group_size', package.max_group_size))
@@ -1808,14 +1807,9 @@ def edit_uploaded_package(request, pk):
         
         if 'cover_image' in request.FILES:
             package.cover_image = request.FILES['cover_image']
-        if 'image_2' in request.FILES:
-            package.image_2 = request.FILES['image_2']
-        if 'image_3' in request.FILES:
-            package.image_3 = request.FILES['image_3']
-        if 'image_4' in request.FILES:
-            package.image_4 = request.FILES['image_4']
         
         package.save()
+        _save_package_images(package, request.FILES)
         messages.success(request, 'Package updated successfully!')
         return redirect('uploaded_packages_list')
     
@@ -1843,10 +1837,31 @@ def delete_uploaded_package(request, pk):
 
 def share_package(request, token):
     """Public view for shared packages (accessible via share link)."""
-    package = get_object_or_404(UploadedPackage, share_token=token)
+    package = get_object_or_404(UploadedPackage.objects.prefetch_related('images'), share_token=token)
     return render(request, 'tours/shared_package.html', {'package': package})
 
 
+def _parse_destinations(value):
+    """Split the comma-separated destinations input into a clean list."""
+    return [d.strip() for d in value.split(',') if d.strip()]
+
+
+# Upload form slots for additional gallery images -> PackageImage.order
+PACKAGE_IMAGE_SLOTS = (('image_2', 2), ('image_3', 3), ('image_4', 4))
+
+
+def _save_package_images(package, files):
+    """Store uploaded gallery images as PackageImage rows, replacing the slot if re-uploaded."""
+    for field_name, order in PACKAGE_IMAGE_SLOTS:
+        if field_name in files:
+            PackageImage.objects.update_or_create(
+                package=package, order=order,
+                defaults={'image': files[field_name]},
+            )
+    # Drop any cached gallery so the new rows are picked up
+    package.__dict__.pop('all_images', None)
+
+
 def extract_pdf_text(pdf_path):
     """Extract text from PDF for AI training."""
     try:
@@ -2120,7 +2135,7 @@ def run_gpt_processor(request):
 @staff_required
 def export_training_data(request):
     """Preview and export training data as JSONL."""
-    from .services.gpt_processor import export_approved_training_data, DecimalEncoder
+    from .services.gpt_processor import export_approved_training_data, decimal_default
     import json
     
     action = request.GET.get('action', 'preview')
@@ -2131,13 +2146,12 @@ def export_training_data(request):
             content, count, filename = export_approved_training_data(request.user)
             
             if count == 0:
+                content.close()
                 messages.warning(request, 'No approved records to export.')
                 return redirect('export_training_data')
             
             # Return file download
-            response = HttpResponse(content, content_type='application/jsonl')
-            response['Content-Disposition'] = f'attachment; filename="{filename}"'
-            return response
+            return FileResponse(content, as_attachment=True, filename=filename)
         except Exception as e:
             messages.error(request, f'Export error: {str(e)}')
             return redirect('export_training_data')
@@ -2151,7 +2165,7 @@ def export_training_data(request):
         preview_data.append({
             'id': item.id,
             'title': item.title,
-            'json_preview': json.dumps(data, indent=2, ensure_ascii=False, cls=DecimalEncoder)[:2000],  # Truncate for display
+            'json_preview': json.dumps(data, indent=2, ensure_ascii=False, default=decimal_default)[:2000],  # Truncate for display
             'full_json': data
         })
     
@@ -2172,13 +2186,12 @@ def export_sterilized_data(request):
             content, count, filename = export_sterilized_training_data(request.user)
             
             if count == 0:
+                content.close()
                 messages.warning(request, 'No approved records to export.')
                 return redirect('export_sterilized_data')
             
             # Return file download
-            response = HttpResponse(content, content_type='application/jsonl')
-            response['Content-Disposition'] = f'attachment; filename="{filename}"'
-            return response
+            return FileResponse(content, as_attachment=True, filename=filename)
         except Exception as e:
             messages.error(request, f'Sterilized export error: {str(e)}')
     
@@ -2212,7 +2225,9 @@ def raw_itineraries_list(request):
     """List raw itineraries."""
     status_filter = request.GET.get('status', '')
     
-    items = RawItinerary.objects.all()
+    # Only the processed row's pk is needed for the "View" link; join it in
+    # rather than loading each ProcessedItinerary, and skip the raw HTML.
+    items = RawItinerary.objects.defer('raw_html').annotate(processed_pk=F('processed__pk'))
     if status_filter == 'pending':
         items = items.filter(is_processed=False)
     elif status_filter == 'processed':